@@ -0,0 +1,40 @@
+"""
+Measure what the emoji table costs: importing the module and loading the
+table on the first lookup.
+
+    python benchmarks/emoji_benchmark.py
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT = '''
+import time
+started_at = time.perf_counter()
+from sclack.emoji import emoji_codemap
+imported_at = time.perf_counter()
+emoji_codemap.get('smile')
+loaded_at = time.perf_counter()
+emoji_codemap.complete('par')
+completed_at = time.perf_counter()
+print(imported_at - started_at, loaded_at - imported_at, completed_at - loaded_at)
+'''
+
+
+def main(runs=10):
+    totals = [0.0, 0.0, 0.0]
+    for _ in range(runs):
+        # A fresh interpreter each time, so nothing is already imported
+        output = subprocess.check_output([sys.executable, '-c', SCRIPT], cwd=ROOT)
+        for index, value in enumerate(output.split()):
+            totals[index] += float(value)
+    import_time, load_time, complete_time = [total / runs * 1e3 for total in totals]
+    print('import {:.2f} ms  first lookup {:.2f} ms  prefix lookup {:.3f} ms'.format(
+        import_time, load_time, complete_time
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Measure the latency saved by reusing connections, against a local HTTP
+server standing in for Slack. Only the TCP handshake is saved here, with
+TLS to slack.com the difference is much larger.
+
+    python benchmarks/http_benchmark.py
+"""
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sclack.transport import create_session
+
+BODY = b'{"ok": true, "channel": {"id": "C1", "name": "general"}}'
+
+
+class SlackHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Answer in one segment, like a real server would
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+class ThreadingServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+def measure(post, url, runs):
+    started_at = time.perf_counter()
+    for _ in range(runs):
+        post(url, data={'channel': 'C1'}).json()
+    return (time.perf_counter() - started_at) / runs * 1e3
+
+
+def main(runs=500):
+    server = ThreadingServer(('127.0.0.1', 0), SlackHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = 'http://127.0.0.1:{}/api/conversations.info'.format(server.server_address[1])
+
+    session = create_session()
+    measure(session.post, url, 10)
+    fresh = measure(requests.post, url, runs)
+    pooled = measure(session.post, url, runs)
+    server.shutdown()
+    print('new connection {:.3f} ms  pooled {:.3f} ms  saved {:.3f} ms per request'.format(
+        fresh, pooled, fresh - pooled
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Compare MarkdownText.parse_message with the previous character by character
+parser, checking that both produce the same markup.
+
+    python benchmarks/markdown_benchmark.py
+"""
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sclack.emoji import emoji_codemap
+from sclack.markdown import MarkdownText
+from sclack.store import Store
+
+
+class LegacyParser:
+    """
+    Parser as it was before the single pass tokenizer
+    """
+    def decode_buffer(self):
+        return (self._buffer
+            .replace('&lt;', '<')
+            .replace('&gt;', '>')
+            .replace('&amp;', '&'))
+
+    def change_state(self, buffer_state, next_state):
+        self._result.append((buffer_state, self.decode_buffer()))
+        self._buffer = ''
+        self._previous_state = self._state
+        self._state = next_state
+
+    def resolve_mention(self):
+        if self._buffer.startswith('@'):
+            user = Store.instance.find_user_by_id(self._buffer[1:])
+            if user:
+                self._buffer = user.get('display_name') or user.get('real_name') or user['name']
+
+    def parse_message(self, text):
+        self._buffer = ''
+        self._state = 'message'
+        self._previous_state = 'message'
+        self._result = []
+        def render_emoji(result):
+            return emoji_codemap.get(result.group(1), result.group(0))
+
+        if Store.instance.config['features']['emoji']:
+            text = re.sub(r':([\w_+-]+):', render_emoji, text)
+        text = text.replace('```', '`')
+        for char in text:
+            if char == '<' and self._state != 'code':
+                self.change_state('message', 'link')
+            elif char == '>' and self._state == 'link':
+                self.resolve_mention()
+                self.change_state('link', 'message')
+            elif char == '|' and self._state == 'link':
+                self._buffer = ''
+            elif char == '*' and self._state == 'bold':
+                self.change_state('bold', self._previous_state)
+            elif char == '*' and self._state not in ('link', 'code'):
+                self.change_state(self._state, 'bold')
+            elif char == '_' and self._state == 'italics':
+                self.change_state('italics', self._previous_state)
+            elif char == '_' and self._state not in ('link', 'code', 'emoji'):
+                self.change_state(self._state, 'italics')
+            elif char == '`' and self._state == 'code':
+                self.change_state('code', self._previous_state)
+            elif char == '`' and self._state != 'link':
+                self.change_state(self._state, 'code')
+            else:
+                self._buffer = self._buffer + char
+
+        self._result.append(('message', self.decode_buffer()))
+        return self._result
+
+
+SAMPLES = {
+    'short': 'hey <@U1>, *deploy* is _done_ :tada:',
+    'link': 'see <https://example.com|the docs> &amp; `code <not a link>`',
+    'long paste': ('```\n' + 'def f(x):\n    return x * 2  # <comment>\n' * 2000 + '```\n') +
+        'and some *bold* text :smile: ' * 500,
+}
+
+
+def main():
+    store = Store([['bench', 'token']], {'features': {'markdown': True, 'emoji': True}})
+    store.state.users = [{'id': 'U1', 'name': 'someone', 'profile': {}}]
+    store.index_users()
+    Store.instance = store
+
+    parser = MarkdownText('')
+    legacy = LegacyParser()
+    for name, text in SAMPLES.items():
+        assert parser.parse_message(text) == legacy.parse_message(text), name
+        number = max(1, 20000 // len(text))
+        new_time = timeit.timeit(lambda: parser.parse_message(text), number=number) / number
+        old_time = timeit.timeit(lambda: legacy.parse_message(text), number=number) / number
+        print('{:<12} {:>8} chars  legacy {:>10.1f} us  tokenizer {:>10.1f} us  {:>6.1f}x'.format(
+            name, len(text), old_time * 1e6, new_time * 1e6, old_time / new_time
+        ))
+
+
+if __name__ == '__main__':
+    main()
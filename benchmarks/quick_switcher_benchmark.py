@@ -0,0 +1,73 @@
+"""
+Time a keystroke in the quick switcher with many channels and users, for
+the filter run on every title and for the index used now.
+
+    python benchmarks/quick_switcher_benchmark.py
+"""
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sclack.utils.search import TitleIndex, normalize, remove_diacritic
+
+QUERY = 'design-team'
+
+
+def random_titles(count):
+    random.seed(0)
+    words = [''.join(random.choice(string.ascii_lowercase) for _ in range(6)) for _ in range(500)]
+    words += ['design', 'team', 'équipe', 'général']
+    return ['-'.join(random.sample(words, 3)) for _ in range(count)]
+
+
+def legacy_filter(titles, text):
+    text = remove_diacritic(text)
+    return [title for title in titles if text.lower() in remove_diacritic(title.lower())]
+
+
+def main(count=50000):
+    titles = random_titles(count)
+    prefixes = [QUERY[:length] for length in range(1, len(QUERY) + 1)]
+
+    started_at = time.perf_counter()
+    for prefix in prefixes:
+        legacy_filter(titles, prefix)
+    legacy = (time.perf_counter() - started_at) / len(prefixes) * 1e3
+
+    started_at = time.perf_counter()
+    index = TitleIndex(titles)
+    build = (time.perf_counter() - started_at) * 1e3
+
+    started_at = time.perf_counter()
+    previous = None
+    for prefix in prefixes:
+        previous = index.search(normalize(prefix), previous)
+    narrowed = (time.perf_counter() - started_at) / len(prefixes) * 1e3
+
+    started_at = time.perf_counter()
+    for prefix in prefixes:
+        index.search(normalize(prefix))
+    scan = (time.perf_counter() - started_at) / len(prefixes) * 1e3
+
+    started_at = time.perf_counter()
+    index.build_trigrams()
+    trigrams = (time.perf_counter() - started_at) * 1e3
+
+    started_at = time.perf_counter()
+    for prefix in prefixes:
+        index.search(normalize(prefix))
+    fresh = (time.perf_counter() - started_at) / len(prefixes) * 1e3
+
+    print('{} titles'.format(count))
+    print('legacy {:.2f} ms per keystroke'.format(legacy))
+    print('titles normalized in {:.2f} ms, {:.2f} ms per keystroke narrowing'.format(build, narrowed))
+    print('{:.2f} ms per query from scratch without trigrams'.format(scan))
+    print('trigrams indexed in {:.2f} ms, {:.2f} ms per query from scratch'.format(trigrams, fresh))
+
+
+if __name__ == '__main__':
+    main()
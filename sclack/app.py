@@ -1,38 +1,58 @@
 #!/usr/bin/env python3
 import asyncio
-import concurrent.futures
 import functools
 import json
 import os
-import requests
 import sys
 import time
 import traceback
-import tempfile
 import urwid
 from datetime import datetime
 from sclack.components import Attachment, Channel, ChannelHeader, ChatBox, Dm
 from sclack.components import Indicators, MarkdownText, MessageBox
 from sclack.component.message import Message
+from sclack.component.message_walker import LazyMessage
 from sclack.components import NewMessagesDivider, Profile, ProfileSideBar
 from sclack.components import Reaction, SideBar, TextDivider
 from sclack.components import User, Workspaces
-from sclack.image import Image
+from sclack.emoji import emoji_codemap
+from sclack.frames import DEFAULT_MAX_FPS, FrameMainLoop
+from sclack.history import ChannelHistory
+from sclack.image import Image, render_picture
 from sclack.loading import LoadingChatBox, LoadingSideBar
+from sclack.markdown import markup_cache, MARKUP_CACHE_SIZE
+from sclack.outbox import Outbox
+from sclack.picture_cache import is_picture_response
 from sclack.quick_switcher import QuickSwitcher
+from sclack.rtm import CATCH_UP_KEY, CAUGHT_UP_EVENT, RECONNECTED_EVENT, RealTimeReader
+from sclack.scheduler import Scheduler
 from sclack.store import Store
 from sclack.themes import themes
 
 from sclack.widgets.set_snooze import SetSnoozeWidget
 from sclack.utils.channel import is_dm, is_group, is_channel
+from sclack.utils.tasks import LatestTask
 
 loop = asyncio.get_event_loop()
 
 SCLACK_SUBTYPE = 'sclack_message'
 MARK_READ_ALARM_PERIOD = 3
+UNREAD_RECONCILE_INTERVAL = 300
+RENDER_SLICE_BUDGET = 8
+# About a screen of messages, a history page is 100 of them or more
+RENDER_FIRST_SLICE = 40
+RENDER_MIN_SLICE = 20
 
 
 class SclackEventLoop(urwid.AsyncioEventLoop):
+    def __init__(self, max_fps=DEFAULT_MAX_FPS, **kwargs):
+        super(SclackEventLoop, self).__init__(**kwargs)
+        # The screen is painted when the loop is idle, which asyncio can't
+        # tell, so urwid fakes it on a timer: every 1/256 s in the pinned
+        # urwid 2.0.1, 1/30 s from 2.1. There is no public way to set it,
+        # this overrides a private attribute of urwid.AsyncioEventLoop
+        self._idle_emulation_delay = 1.0 / max_fps
+
     def run(self):
         self._loop.set_exception_handler(self._custom_exception_handler)
         self._loop.run_forever()
@@ -57,18 +77,40 @@ class App:
 
     def __init__(self, config):
         self._loading = False
+        self._loading_older_messages = False
+        self._history_rendered = False
         self.config = config
         self.quick_switcher = None
         self.set_snooze_widget = None
+        self.channel_switch = LatestTask(loop)
+        self.catch_up = LatestTask(loop)
+        # (channel, ts) of the messages received since the last reconnection,
+        # while the missed ones are being fetched
+        self._received_since_reconnect = None
         self.workspaces = list(config['workspaces'].items())
         self.store = Store(self.workspaces, self.config)
         Store.instance = self.store
+        markup_cache.max_size = config.get('cache', {}).get('markdown_size', MARKUP_CACHE_SIZE)
+        self.scheduler = Scheduler(config, self.store.metrics)
+        self.store.executor = self.scheduler.api
+        self.outbox = Outbox(
+            self.store.post_message,
+            self.store.edit_message,
+            loop,
+            self.scheduler.interactive,
+            self.store.metrics,
+            on_sent=self.handle_message_sent,
+            on_failed=self.handle_message_failed
+        )
         urwid.set_encoding('UTF-8')
         sidebar = LoadingSideBar()
         chatbox = LoadingChatBox('Everything is terrible!')
         palette = themes.get(config['theme'], themes['default'])
 
-        custom_loop = SclackEventLoop(loop=loop)
+        custom_loop = SclackEventLoop(
+            loop=loop,
+            max_fps=config.get('render', {}).get('max_fps', DEFAULT_MAX_FPS)
+        )
         custom_loop.set_exception_handler(self._exception_handler)
 
         if len(self.workspaces) <= 1:
@@ -82,8 +124,9 @@ class App:
         ])
         self._body = urwid.Frame(self.columns, header=self.workspaces_line)
 
-        self.urwid_loop = urwid.MainLoop(
+        self.urwid_loop = FrameMainLoop(
             self._body,
+            self.store.metrics,
             palette=palette,
             event_loop=custom_loop,
             unhandled_input=self.unhandled_input
@@ -108,6 +151,10 @@ class App:
             self.sidebar = LoadingSideBar()
             self.chatbox = LoadingChatBox('And it becomes worse!')
             self.message_box = None
+            # Stop rtm to switch workspace
+            self.stop_background_tasks()
+            self.outbox.cancel()
+            self.stop_requests()
             self.store.switch_to_workspace(workspace_number)
             loop.create_task(self.animate_loading())
             loop.create_task(self.component_did_mount())
@@ -142,35 +189,134 @@ class App:
 
     @asyncio.coroutine
     def component_did_mount(self):
-        with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
+        api_calls = self.store.metrics.get('api.calls')
+        executor = self.scheduler.api
+        has_snapshot = yield from loop.run_in_executor(executor, self.store.load_snapshot)
+        if has_snapshot:
+            # Paint from the snapshot right away, then catch up with the API
+            yield from self.render_sidebar(executor)
+            yield from asyncio.gather(
+                self.mount_chatbox(executor, self.store.state.channels[0]['id']),
+                self.refresh_sidebar(executor),
+                self.reconcile_sidebar(executor)
+            )
+        else:
             yield from self.mount_sidebar(executor)
-            yield from self.mount_chatbox(executor, self.store.state.channels[0]['id'])
+            yield from asyncio.gather(
+                self.mount_chatbox(executor, self.store.state.channels[0]['id']),
+                self.refresh_sidebar(executor)
+            )
+            yield from loop.run_in_executor(executor, self.store.save_snapshot)
+        self.store.metrics.gauge('startup.api_calls', self.store.metrics.get('api.calls') - api_calls)
 
     @asyncio.coroutine
-    def mount_sidebar(self, executor):
+    def load_sidebar(self, executor, on_channels_page=None, on_users_page=None):
+        """
+        :param executor:
+        :param on_channels_page: see `Store.iter_channels`, called from the executor
+        :param on_users_page: see `Store.iter_users`, called from the executor
+        :return:
+        """
         yield from asyncio.gather(
             loop.run_in_executor(executor, self.store.load_auth),
-            loop.run_in_executor(executor, self.store.load_channels),
+            loop.run_in_executor(executor, self.store.load_channels, on_channels_page),
             loop.run_in_executor(executor, self.store.load_stars),
             loop.run_in_executor(executor, self.store.load_groups),
-            loop.run_in_executor(executor, self.store.load_users),
+            loop.run_in_executor(executor, self.store.load_users, on_users_page),
             loop.run_in_executor(executor, self.store.load_user_dnd),
+            loop.run_in_executor(executor, self.store.load_custom_emoji),
+        )
+
+    @asyncio.coroutine
+    def mount_sidebar(self, executor):
+        """
+        Load and render the sidebar. The channels and DMs are painted as their
+        pages arrive, before the whole sidebar is rendered
+        :param executor:
+        :return:
+        """
+        state = self.store.state
+        loaded = {'channels': [], 'dms': []}
+
+        def render(channels=None, dms=None):
+            if channels is not None:
+                loaded['channels'] = channels
+                loaded['dms'] = dms
+            # Unless the workspace was switched meanwhile
+            if self.store.state is state and self._loading:
+                self.render_partial_sidebar(loaded['channels'], loaded['dms'])
+
+        def channels_loaded(channels, dms):
+            loop.call_soon_threadsafe(render, channels, dms)
+
+        def users_loaded(users):
+            # DMs are only shown once their user is known
+            if loaded['dms']:
+                loop.call_soon_threadsafe(render)
+
+        yield from self.load_sidebar(executor, channels_loaded, users_loaded)
+        yield from self.render_sidebar(executor)
+
+    @asyncio.coroutine
+    def refresh_sidebar(self, executor):
+        yield from asyncio.gather(
+            self.get_unread_counts(executor),
+            self.get_presences(executor, self.sidebar.get_all_dms())
         )
+
+    @asyncio.coroutine
+    def reconcile_sidebar(self, executor):
+        """
+        Reload the data painted from the snapshot and only render the sidebar
+        again when something it shows has changed
+        :param executor:
+        :return:
+        """
+        state = self.store.state
+        signature = self.store.sidebar_signature()
+        yield from self.load_sidebar(executor)
+
+        # Workspace was switched meanwhile
+        if self.store.state is not state:
+            return
+
+        if self.store.sidebar_signature() != signature:
+            yield from self.render_sidebar(executor)
+            if getattr(self.store.state, 'channel', None):
+                self.sidebar.select_channel(self.store.state.channel['id'])
+            yield from self.refresh_sidebar(executor)
+
+        yield from loop.run_in_executor(executor, self.store.save_snapshot)
+
+    @asyncio.coroutine
+    def render_sidebar(self, executor):
         profile = Profile(name=self.store.state.auth['user'], is_snoozed=self.store.state.is_snoozed)
 
-        channels = []
-        dms = []
         stars = []
         star_user_tmp = []  # To contain user, channel should be on top of list
         stars_user_id = []  # To ignore item in DMs list
         stars_channel_id = []  # To ignore item in channels list
-        max_users_sidebar = self.store.config['sidebar']['max_users']
+
+        # Starred items are usually already loaded, only ask the API for the others
+        known_channels = {channel['id']: channel for channel in self.store.state.channels}
+        known_channels.update({dm['id']: dm for dm in self.store.state.dms})
+        unknown_ids = [
+            star['channel'] for star in self.store.state.stars
+            if star['channel'] not in known_channels
+        ]
+        if unknown_ids:
+            unknown_channels = yield from loop.run_in_executor(
+                executor,
+                self.store.get_channels_info,
+                unknown_ids
+            )
+            known_channels.update(unknown_channels)
 
         # Prepare list of Star users and channels
         for dm in self.store.state.stars:
             if is_dm(dm['channel']):
-                detail = self.store.get_channel_info(dm['channel'])
-                user = self.store.find_user_by_id(detail['user'])
+                detail = known_channels.get(dm['channel'])
+                user = detail and self.store.find_user_by_id(detail['user'])
 
                 if user:
                     stars_user_id.append(user['id'])
@@ -181,7 +327,7 @@ class App:
                         you=False
                     ))
             elif is_channel(dm['channel']) or is_group(dm['channel']):
-                channel = self.store.get_channel_info(dm['channel'])
+                channel = known_channels.get(dm['channel'])
                 # Group chat (is_mpim) is not supported, prefer to https://github.com/haskellcamargo/sclack/issues/67
                 if channel and not channel.get('is_archived', False) and not channel.get('is_mpim', False):
                     stars_channel_id.append(channel['id'])
@@ -192,35 +338,56 @@ class App:
                     ))
         stars.extend(star_user_tmp)
 
-        # Prepare list of Channels
-        for channel in self.store.state.channels:
-            if channel['id'] in stars_channel_id:
-                continue
-            channels.append(Channel(
+        channels = self.render_sidebar_channels(self.store.state.channels, stars_channel_id)
+        dms = self.render_sidebar_dms(self.store.state.dms, stars_user_id)
+
+        self.sidebar = SideBar(profile, channels, dms, stars=stars, title=self.store.state.auth['team'])
+        urwid.connect_signal(self.sidebar, 'go_to_channel', self.go_to_channel)
+
+    def render_partial_sidebar(self, channels, dms):
+        """
+        Paint the channels and DMs loaded so far. Stars come with the whole
+        sidebar, and nothing can be opened before it is rendered
+        :param channels:
+        :param dms:
+        :return:
+        """
+        auth = getattr(self.store.state, 'auth', None)
+        if not auth or 'user' not in auth:
+            return
+        profile = Profile(name=auth['user'], is_snoozed=self.store.state.is_snoozed)
+        self.sidebar = SideBar(
+            profile,
+            self.render_sidebar_channels(channels),
+            self.render_sidebar_dms(dms),
+            title=auth['team']
+        )
+
+    def render_sidebar_channels(self, channels, skipped_ids=()):
+        return [
+            Channel(
                 id=channel['id'],
                 name=channel['name'],
                 is_private=channel['is_private']
-            ))
+            )
+            for channel in channels
+            if channel['id'] not in skipped_ids
+        ]
 
-        # Prepare list of DM
-        dm_users = self.store.state.dms[:max_users_sidebar]
-        for dm in dm_users:
-            if dm['user'] in stars_user_id:
+    def render_sidebar_dms(self, dms, skipped_user_ids=()):
+        widgets = []
+        for dm in dms[:self.store.config['sidebar']['max_users']]:
+            if dm['user'] in skipped_user_ids:
                 continue
             user = self.store.find_user_by_id(dm['user'])
             if user:
-                dms.append(Dm(
+                widgets.append(Dm(
                     dm['id'],
                     name=self.store.get_user_display_name(user),
                     user=dm['user'],
                     you=user['id'] == self.store.state.auth['user_id']
                 ))
-
-        self.sidebar = SideBar(profile, channels, dms, stars=stars, title=self.store.state.auth['team'])
-        urwid.connect_signal(self.sidebar, 'go_to_channel', self.go_to_channel)
-        loop.create_task(self.get_channels_info(executor, self.sidebar.get_all_channels()))
-        loop.create_task(self.get_presences(executor, self.sidebar.get_all_dms()))
-        loop.create_task(self.get_dms_unread(executor, self.sidebar.get_all_dms()))
+        return widgets
 
     @asyncio.coroutine
     def get_presences(self, executor, dm_widgets):
@@ -244,49 +411,46 @@ class App:
                 widget.set_presence(response['presence'])
 
     @asyncio.coroutine
-    def get_dms_unread(self, executor, dm_widgets):
+    def get_unread_counts(self, executor):
         """
-        Compute and return unread_count_display because updating UI from another thread is unsafe
+        Fill every channel, group and DM badge from one bulk request, the
+        widgets are only updated here because doing it from another thread is unsafe
         :param executor:
-        :param dm_widgets:
         :return:
         """
-        def get_presence(dm_widget):
-            profile_response = self.store.get_channel_info(dm_widget.id)
-            return [dm_widget, profile_response]
-
-        responses = yield from asyncio.gather(*[
-            loop.run_in_executor(executor, get_presence, dm_widget)
-            for dm_widget in dm_widgets
-        ])
-
-        for profile_response in responses:
-            [widget, response] = profile_response
-            if response is not None:
-                widget.set_unread(response['unread_count_display'])
-
-    @asyncio.coroutine
-    def get_channels_info(self, executor, channels):
-        def get_info(channel):
-            info = self.store.get_channel_info(channel.id)
-            return [channel, info]
-        channels_info = yield from asyncio.gather(*[
-            loop.run_in_executor(executor, get_info, channel)
-            for channel in channels
-        ])
+        sidebar = self.sidebar
+        widgets = sidebar.get_all_channels() + sidebar.get_all_groups() + sidebar.get_all_dms()
+        counts = yield from loop.run_in_executor(
+            executor,
+            self.store.load_unread_counts,
+            [widget.id for widget in widgets]
+        )
 
-        for channel_info in channels_info:
-            [widget, response] = channel_info
-            widget.set_unread(response.get('unread_count_display', 0))
+        for widget in widgets:
+            if widget.id in counts:
+                widget.set_unread(counts[widget.id])
 
-    @asyncio.coroutine
     def update_chat(self, event):
         """
-        Update channel/DM message count badge
+        Update channel/DM message count badge from the locally kept counts
         :param event:
         :return:
         """
-        self.sidebar.update_items(event)
+        channel_id = self.store.apply_unread_event(event)
+        if channel_id is not None:
+            self.sidebar.update_items(channel_id, self.store.state.unread_counts[channel_id])
+
+    @asyncio.coroutine
+    def reconcile_unread_counts(self):
+        """
+        Counts are kept from RTM events, only check them against the API once in a while
+        :return:
+        """
+        interval = self.config.get('api', {}).get('unread_reconcile_interval', UNREAD_RECONCILE_INTERVAL)
+        while True:
+            yield from asyncio.sleep(interval)
+            if self.is_chatbox_rendered:
+                yield from self.get_unread_counts(self.scheduler.api)
 
     @asyncio.coroutine
     def mount_chatbox(self, executor, channel):
@@ -294,7 +458,7 @@ class App:
             loop.run_in_executor(executor, self.store.load_channel, channel),
             loop.run_in_executor(executor, self.store.load_messages, channel)
         )
-        messages = self.render_messages(self.store.state.messages)
+        yield from loop.run_in_executor(executor, self.store.load_bots, self.store.state.messages)
         header = self.render_chatbox_header()
         self._loading = False
         self.sidebar.select_channel(channel)
@@ -302,9 +466,10 @@ class App:
             user=self.store.state.auth['user'],
             is_read_only=self.store.state.channel.get('is_read_only', False)
         )
-        self.chatbox = ChatBox(messages, header, self.message_box, self.urwid_loop)
+        self.chatbox = ChatBox([], header, self.message_box, self.urwid_loop)
         urwid.connect_signal(self.chatbox, 'set_insert_mode', self.set_insert_mode)
         urwid.connect_signal(self.chatbox, 'mark_read', self.handle_mark_read)
+        urwid.connect_signal(self.chatbox, 'load_older_messages', self.handle_load_older_messages)
         urwid.connect_signal(self.chatbox, 'open_quick_switcher', self.open_quick_switcher)
         urwid.connect_signal(self.chatbox, 'open_set_snooze', self.open_set_snooze)
 
@@ -312,8 +477,30 @@ class App:
         urwid.connect_signal(self.message_box.prompt_widget, 'go_to_last_message', self.go_to_last_message)
 
         self.real_time_task = loop.create_task(self.start_real_time())
+        self.unread_counts_task = loop.create_task(self.reconcile_unread_counts())
+        yield from self.render_history(self.chatbox.body.body, self.store.state.messages)
+
+    def stop_background_tasks(self):
+        if hasattr(self, 'real_time_task'):
+            self.real_time_task.cancel()
+        if hasattr(self, 'unread_counts_task'):
+            self.unread_counts_task.cancel()
+        self.channel_switch.cancel()
+        self.catch_up.cancel()
+        self._received_since_reconnect = None
+
+    def stop_requests(self):
+        """
+        Wake up the workers waiting for a rate limit, their requests fail
+        :return:
+        """
+        if self.store.dispatcher is not None:
+            self.store.dispatcher.close()
 
     def edit_message(self, widget, user_id, ts, original_text):
+        if ts is None:
+            # Not sent yet
+            return
         is_logged_user = self.store.state.auth['user_id'] == user_id
         current_date = datetime.today()
         message_date = datetime.fromtimestamp(float(ts))
@@ -335,9 +522,11 @@ class App:
             pass
 
     def delete_message(self, widget, user_id, ts):
-        if self.store.state.auth['user_id'] == user_id:
+        if ts is not None and self.store.state.auth['user_id'] == user_id:
             if self.store.delete_message(self.store.state.channel['id'], ts)['ok']:
-                self.chatbox.body.body.remove(widget)
+                position = self.chatbox.body.body.position_of(widget)
+                if position is not None:
+                    del self.chatbox.body.body[position]
 
     def go_to_profile(self, user_id):
         if len(self.columns.contents) > 2:
@@ -393,8 +582,33 @@ class App:
         self.store.set_topic(self.store.state.channel['id'], text)
         self.go_to_sidebar()
 
+    def get_message_author(self, message):
+        """
+        Author of a message as (id, name, color, is_app), None when it can't be found
+        :param message:
+        :return:
+        """
+        subtype = message.get('subtype')
+
+        if subtype == 'bot_message':
+            bot = (self.store.find_user_by_id(message['bot_id'])
+                or self.store.find_or_load_bot(message['bot_id']))
+            if bot:
+                user_name = bot.get('profile', {}).get('display_name') or bot.get('name')
+                return message['bot_id'], user_name, bot.get('color'), 'app_id' in bot
+            return None
+        elif subtype == 'file_comment':
+            user = self.store.find_user_by_id(message['comment']['user'])
+        else:
+            user = self.store.find_user_by_id(message['user'])
+
+        # A temporary fix for a null pointer exception for truncated or deleted users
+        if user is None:
+            return None
+
+        return user['id'], user['profile']['display_name'] or user.get('name'), user.get('color'), False
+
     def render_message(self, message, channel_id=None):
-        is_app = False
         subtype = message.get('subtype')
 
         if subtype == SCLACK_SUBTYPE:
@@ -413,7 +627,8 @@ class App:
             return message
 
         message_text = message['text']
-        files = message.get('files', [])
+        # Copied, the message is kept in the history and rendered again
+        files = list(message.get('files', []))
 
         # Files uploaded
         if len(files) > 0:
@@ -426,38 +641,13 @@ class App:
             else:
                 message_text = '{}\n{}'.format(message_text, file_text)
 
-        if subtype == 'bot_message':
-            bot = (self.store.find_user_by_id(message['bot_id'])
-                or self.store.find_or_load_bot(message['bot_id']))
-            if bot:
-                user_id = message['bot_id']
-                user_name = bot.get('profile', {}).get('display_name') or bot.get('name')
-                color = bot.get('color')
-                is_app = 'app_id' in bot
-            else:
-                return None
-        elif subtype == 'file_comment':
-            user = self.store.find_user_by_id(message['comment']['user'])
+        author = self.get_message_author(message)
+        if author is None:
+            return None
+        user_id, user_name, color, is_app = author
 
-            # A temporary fix for a null pointer exception for truncated or deleted users
-            if user is None:
-                return None
-
-            user_id = user['id']
-            user_name = user['profile']['display_name'] or user.get('name')
-            color = user.get('color')
-            if message.get('file'):
-                message['file'] = None
-        else:
-            user = self.store.find_user_by_id(message['user'])
-
-            # A temporary fix for a null pointer exception for truncated or deleted users
-            if user is None:
-                return None
-
-            user_id = user['id']
-            user_name = user['profile']['display_name'] or user.get('name')
-            color = user.get('color')
+        if subtype == 'file_comment' and message.get('file'):
+            message['file'] = None
 
         user = User(user_id, user_name, color, is_app)
         text = MarkdownText(message_text)
@@ -544,40 +734,181 @@ class App:
                 ))
 
     def render_messages(self, messages, channel_id=None):
+        new_messages_index = self.find_new_messages_index(messages)
+        rows = self.render_message_rows(
+            messages, 0, len(messages), self.store.state.last_date, new_messages_index, channel_id
+        )
+        if messages:
+            self.store.state.last_date = datetime.fromtimestamp(float(messages[-1]['ts'])).date()
+        return rows
+
+    def find_new_messages_index(self, messages):
+        """
+        Position of the first unread message, where the new messages divider
+        goes, when it isn't shown yet
+        :param messages:
+        :return: the position or None
+        """
+        state = self.store.state
+        if state.did_render_new_messages or state.channel.get('unread_count_display', 0) <= 0:
+            return None
+        last_read = float(state.channel.get('last_read', '0'))
+        for index, message in enumerate(messages):
+            if float(message['ts']) > last_read:
+                state.did_render_new_messages = True
+                return index
+        return None
+
+    def render_message_rows(self, messages, start, stop, previous_date, new_messages_index, channel_id=None):
+        """
+        Rows of messages[start:stop], dividers included
+        :param messages:
+        :param start:
+        :param stop:
+        :param previous_date: date of the message before `start`
+        :param new_messages_index: position of the first unread message
+        :param channel_id:
+        :return:
+        """
         _messages = []
-        previous_date = self.store.state.last_date
-        last_read_datetime = datetime.fromtimestamp(float(self.store.state.channel.get('last_read', '0')))
         today = datetime.today().date()
-        for message in messages:
-            message_datetime = datetime.fromtimestamp(float(message['ts']))
-            message_date = message_datetime.date()
+        for index in range(start, stop):
+            message = messages[index]
+            message_date = datetime.fromtimestamp(float(message['ts'])).date()
             date_text = None
-            unread_text = None
             if not previous_date or previous_date != message_date:
                 previous_date = message_date
-                self.store.state.last_date = previous_date
                 if message_date == today:
                     date_text = 'Today'
                 else:
                     date_text = message_date.strftime('%A, %B %d')
 
             # New messages badge
-            if (message_datetime > last_read_datetime and not self.store.state.did_render_new_messages
-                and (self.store.state.channel.get('unread_count_display', 0) > 0)):
-                self.store.state.did_render_new_messages = True
-                unread_text = 'new messages'
-            if unread_text is not None:
-                _messages.append(NewMessagesDivider(unread_text, date=date_text))
+            if index == new_messages_index:
+                _messages.append(NewMessagesDivider('new messages', date=date_text))
             elif date_text is not None:
                 _messages.append(TextDivider(('history_date', date_text), 'center'))
 
-            message = self.render_message(message, channel_id)
-
-            if message is not None:
-                _messages.append(message)
+            # Messages are only turned into widgets when they are about to be shown
+            if message.get('subtype') == SCLACK_SUBTYPE:
+                _messages.append(self.render_message(message, channel_id))
+            elif self.get_message_author(message) is not None:
+                _messages.append(LazyMessage(
+                    message,
+                    channel_id,
+                    functools.partial(self.render_message, message, channel_id)
+                ))
 
         return _messages
 
+    @asyncio.coroutine
+    def render_history(self, walker, messages, channel_id=None):
+        """
+        Fill the walker with the rows of a whole history a slice at a time,
+        newest first, giving the event loop back between slices so keys are
+        handled while a long history is rendered. Slices are sized to take
+        about `render.slice_budget` milliseconds. It stops when another
+        history is shown meanwhile. The bots of the messages should be
+        loaded already, see `Store.load_bots`
+        :param walker:
+        :param messages:
+        :param channel_id:
+        :return:
+        """
+        self._history_rendered = False
+        budget = self.config.get('render', {}).get('slice_budget', RENDER_SLICE_BUDGET) / 1000.0
+        state = self.store.state
+        first_date = state.last_date
+        new_messages_index = self.find_new_messages_index(messages)
+        if messages:
+            state.last_date = datetime.fromtimestamp(float(messages[-1]['ts'])).date()
+
+        stop = len(messages)
+        size = RENDER_FIRST_SLICE
+        first = True
+        while first or stop > 0:
+            started_at = time.perf_counter()
+            start = max(stop - size, 0)
+            previous_date = first_date
+            if start > 0:
+                previous_date = datetime.fromtimestamp(float(messages[start - 1]['ts'])).date()
+            rows = self.render_message_rows(
+                messages, start, stop, previous_date, new_messages_index, channel_id
+            )
+            count = stop - start
+            if first:
+                walker[:] = rows
+                if len(walker):
+                    walker.set_focus(len(walker) - 1)
+                first = False
+            else:
+                # The focus follows the rows it was on, nothing moves on screen
+                walker[0:0] = rows
+            stop = start
+            self.store.metrics.incr('render.history_slices')
+
+            elapsed = time.perf_counter() - started_at
+            if elapsed > 0:
+                size = max(RENDER_MIN_SLICE, int(count * budget / elapsed))
+            yield from asyncio.sleep(0)
+            # Another channel or workspace took the chat meanwhile
+            if (not self.is_chatbox_rendered or self.chatbox.body.body is not walker
+                    or state is not self.store.state or state.messages is not messages):
+                return
+
+        self._history_rendered = True
+
+    def handle_load_older_messages(self):
+        # Older messages go above the whole history, wait until it is rendered
+        if not self._loading_older_messages and self._history_rendered and self.store.state.has_more:
+            self._loading_older_messages = True
+            loop.create_task(self.load_older_messages())
+
+    @asyncio.coroutine
+    def load_older_messages(self):
+        """
+        Prepend the previous page of the history. The rows already there are
+        kept, and the focus stays on the same row so nothing moves
+        :return:
+        """
+        state = self.store.state
+        channel_id = state.channel['id']
+        try:
+            messages, has_more = yield from loop.run_in_executor(
+                self.scheduler.api,
+                self.store.load_older_messages,
+                channel_id,
+                state.messages[0]['ts']
+            )
+            if self.store.find_unknown_bots(messages):
+                yield from loop.run_in_executor(self.scheduler.api, self.store.load_bots, messages)
+            if not self.is_chatbox_rendered or state.channel['id'] != channel_id:
+                return
+            state.has_more = has_more
+            if not messages:
+                return
+
+            # Dates are computed for the older page alone, the newest one
+            # goes on to the new messages
+            last_date = state.last_date
+            did_render_new_messages = state.did_render_new_messages
+            state.last_date = None
+            state.did_render_new_messages = True
+            rows = self.render_messages(messages, channel_id=channel_id)
+            older_last_date = state.last_date
+            state.last_date = last_date
+            state.did_render_new_messages = did_render_new_messages
+
+            walker = self.chatbox.body.body
+            first_date = datetime.fromtimestamp(float(state.messages[0]['ts'])).date()
+            if walker and type(walker[0]) is TextDivider and first_date == older_last_date:
+                # That day already started in the older page
+                del walker[0]
+            walker[0:0] = rows
+            state.messages[0:0] = messages
+        finally:
+            self._loading_older_messages = False
+
     def handle_mark_read(self, data):
         """
         Mark as read to bottom
@@ -620,46 +951,131 @@ class App:
                 else:
                     message = self.chatbox.body.body[index - 1]
 
-            if message.channel_id:
+            if message.channel_id and message.ts:
                 self.store.mark_read(message.channel_id, message.ts)
 
+    def save_channel_history(self):
+        """
+        Keep the open channel, widgets included, so coming back to it is instant
+        :return:
+        """
+        state = self.store.state
+        # A history left before it was fully rendered misses its oldest rows
+        if not self.is_chatbox_rendered or not state.messages or not self._history_rendered:
+            return
+        walker = self.chatbox.body.body
+        self.store.history.put(state.channel['id'], ChannelHistory(
+            channel=state.channel,
+            members=state.members,
+            pin_count=state.pin_count,
+            has_more=state.has_more,
+            messages=state.messages,
+            rows=list(walker),
+            widgets=walker.widgets,
+            focus=walker.focus,
+            last_date=state.last_date
+        ))
+
     @asyncio.coroutine
-    def _go_to_channel(self, channel_id):
-        with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-            yield from asyncio.gather(
-                loop.run_in_executor(executor, self.store.load_channel, channel_id),
-                loop.run_in_executor(executor, self.store.load_messages, channel_id)
-            )
-            self.store.state.last_date = None
+    def restore_channel_history(self, channel_id, history):
+        """
+        Paint a channel from the history cache, then only ask for the
+        messages posted since it was left
+        :param channel_id:
+        :param history:
+        :return: False when too many messages were missed and the channel must be loaded again
+        """
+        state = self.store.state
+        state.channel = history.channel
+        state.members = history.members
+        state.pin_count = history.pin_count
+        state.has_more = history.has_more
+        state.messages = history.messages
+        state.last_date = history.last_date
+        state.did_render_new_messages = True
+
+        self.chatbox.body.body.set_contents(history.rows, history.widgets)
+        self._history_rendered = True
+        self.chatbox.body.body.set_focus(history.focus)
+        self.chatbox.header = self.render_chatbox_header()
+        self.chatbox.message_box.is_read_only = state.channel.get('is_read_only', False)
+        self.sidebar.select_channel(channel_id)
+        self.go_to_chatbox()
+
+        messages = yield from loop.run_in_executor(
+            self.scheduler.api,
+            self.store.load_newer_messages,
+            channel_id,
+            history.newest_ts()
+        )
+        if not self.is_chatbox_rendered or state.channel['id'] != channel_id:
+            return True
+        if messages is None:
+            return False
+        if messages:
+            state.messages.extend(messages)
+            self.chatbox.body.body.extend(self.render_messages(messages, channel_id=channel_id))
+            self.chatbox.body.scroll_to_bottom()
+        return True
+
+    @asyncio.coroutine
+    def _go_to_channel(self, channel_id, use_cache=True):
+        """
+        Show a channel, from the history cache when it was visited lately
+        :param channel_id:
+        :param use_cache: False to load the channel from Slack, the rows on screen are left out
+        :return:
+        """
+        history = None
+        if use_cache:
+            self.save_channel_history()
+            history = self.store.history.pop(channel_id)
+        else:
+            self.store.history.discard(channel_id)
+        if history is not None and self.is_chatbox_rendered:
+            restored = yield from self.restore_channel_history(channel_id, history)
+            if restored:
+                return
 
-            if len(self.store.state.messages) == 0:
-                messages = self.render_messages([{
+        executor = self.scheduler.api
+        (channel, members), history = yield from asyncio.gather(
+            loop.run_in_executor(executor, self.store.fetch_channel, channel_id),
+            loop.run_in_executor(executor, self.store.fetch_messages, channel_id)
+        )
+        yield from loop.run_in_executor(executor, self.store.load_bots, history.get('messages', []))
+        # A newer selection would have cancelled this task, the responses are current
+        self.store.set_channel(channel, members)
+        self.store.set_messages(channel_id, history)
+        self.store.state.last_date = None
+
+        state = self.store.state
+        if self.is_chatbox_rendered:
+            self.chatbox.header = self.render_chatbox_header()
+            self.chatbox.message_box.is_read_only = state.channel.get('is_read_only', False)
+            self.sidebar.select_channel(channel_id)
+
+        if len(state.messages) == 0:
+            if self.is_chatbox_rendered:
+                self.chatbox.body.body[:] = self.render_messages([{
                     'text': "There's no conversation in this channel",
                     'ts': '0',
                     'subtype': SCLACK_SUBTYPE,
                 }])
-            else:
-                messages = self.render_messages(self.store.state.messages, channel_id=channel_id)
+            self.go_to_sidebar()
+            return
 
-            header = self.render_chatbox_header()
-            if self.is_chatbox_rendered:
-                self.chatbox.body.body[:] = messages
-                self.chatbox.header = header
-                self.chatbox.message_box.is_read_only = self.store.state.channel.get('is_read_only', False)
-                self.sidebar.select_channel(channel_id)
-                self.urwid_loop.set_alarm_in(0, self.scroll_messages)
-
-            if len(self.store.state.messages) == 0:
-                self.go_to_sidebar()
-            else:
-                self.go_to_chatbox()
+        self.go_to_chatbox()
+        if self.is_chatbox_rendered:
+            yield from self.render_history(self.chatbox.body.body, state.messages, channel_id)
+            self.urwid_loop.set_alarm_in(0, self.scroll_messages)
 
-    def go_to_channel(self, channel_id):
+    def go_to_channel(self, channel_id, use_cache=True):
         if self.quick_switcher:
             urwid.disconnect_signal(self.quick_switcher, 'go_to_channel', self.go_to_channel)
             self.urwid_loop.widget = self._body
             self.quick_switcher = None
-        loop.create_task(self._go_to_channel(channel_id))
+        if self.channel_switch.start(self._go_to_channel(channel_id, use_cache)):
+            self.store.metrics.incr('channels.cancelled_switches')
 
     def handle_set_snooze_time(self, snoozed_time):
         loop.create_task(self.dispatch_snooze_time(snoozed_time))
@@ -682,94 +1098,172 @@ class App:
     @asyncio.coroutine
     def load_picture_async(self, url, width, message_widget, auth=True):
         width = min(width, 800)
-        bytes_in_cache = self.store.cache.picture.get(url)
-        if bytes_in_cache:
-            message_widget.file = bytes_in_cache
-            return
-        with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-            headers = {}
-            if auth:
-                headers = {'Authorization': 'Bearer {}'.format(self.store.slack_token)}
-            bytes = yield from loop.run_in_executor(
-                executor,
-                functools.partial(requests.get, url, headers=headers)
-            )
-            file = tempfile.NamedTemporaryFile(delete=False)
-            file.write(bytes.content)
-            file.close()
-            picture = Image(file.name, width=(width / 10))
-            message_widget.file = picture
+        rendered = yield from self.fetch_picture(url, width // 10, auth=auth)
+        message_widget.file = Image(rendered)
 
     @asyncio.coroutine
     def load_profile_avatar(self, url, profile):
-        bytes_in_cache = self.store.cache.avatar.get(url)
-        if bytes_in_cache:
-            profile.avatar = bytes_in_cache
-            return
-        with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-            bytes = yield from loop.run_in_executor(executor, requests.get, url)
-            file = tempfile.NamedTemporaryFile(delete=False)
-            file.write(bytes.content)
-            file.close()
-            avatar = Image(file.name, width=35)
-            self.store.cache.avatar[url] = avatar
-            profile.avatar = avatar
+        rendered = yield from self.fetch_picture(url, 35, auth=False)
+        profile.avatar = Image(rendered)
+
+    @asyncio.coroutine
+    def fetch_picture(self, url, width, auth=True):
+        """
+        Rendered picture from the cache, downloading or rendering it only when
+        the cache doesn't have it for this width
+        :param url:
+        :param width: columns
+        :param auth: whether the URL needs the workspace token
+        :return: the result of `render_picture`
+        """
+        pictures = self.store.pictures
+        headers = {}
+        if auth:
+            headers['Authorization'] = 'Bearer {}'.format(self.store.slack_token)
+
+        executor = self.scheduler.download
+        data = None
+        if pictures is not None:
+            rendered = yield from loop.run_in_executor(executor, pictures.lookup, url, width)
+            if rendered is not None:
+                return rendered
+            # Maybe downloaded before, but rendered with another width
+            if (yield from loop.run_in_executor(executor, pictures.is_fresh, url)):
+                data = yield from loop.run_in_executor(executor, pictures.get_data, url)
+            else:
+                headers.update(pictures.conditional_headers(url))
+
+        if data is None:
+            response = yield from loop.run_in_executor(
+                executor,
+                functools.partial(self.store.session.get, url, headers=headers)
+            )
+            if pictures is not None and response.status_code == 304:
+                yield from loop.run_in_executor(executor, pictures.revalidated, url)
+                rendered = yield from loop.run_in_executor(executor, pictures.lookup, url, width)
+                if rendered is not None:
+                    return rendered
+                data = yield from loop.run_in_executor(executor, pictures.get_data, url)
+            elif not is_picture_response(response):
+                # Error pages are neither rendered nor kept
+                return None
+            elif pictures is None:
+                data = response.content
+            else:
+                data = response.content
+                yield from loop.run_in_executor(
+                    executor,
+                    pictures.put_data, url, data, response.headers
+                )
+
+        rendered = yield from loop.run_in_executor(
+            self.scheduler.render,
+            functools.partial(render_picture, data, width=width)
+        )
+        if pictures is not None:
+            yield from loop.run_in_executor(
+                executor,
+                pictures.put_rendered, url, width, rendered
+            )
+        return rendered
 
     @asyncio.coroutine
     def start_real_time(self):
-        self.store.slack.rtm_connect(auto_reconnect=True)
+        self.rtm = RealTimeReader(self.store.slack, loop, self.store.metrics, self.scheduler.api)
+        try:
+            connected = yield from self.rtm.connect()
+            if connected:
+                yield from self.handle_real_time_events()
+        finally:
+            self.rtm.close()
 
+    @asyncio.coroutine
+    def handle_real_time_events(self):
         def stop_typing(*args):
             # Prevent error while switching workspace
             if self.is_chatbox_rendered:
                 self.chatbox.message_box.typing = None
 
         alarm = None
-
-        while self.store.slack.server.connected is True:
-            events = self.store.slack.rtm_read()
+        # New messages of the open channel are added at once at the end of
+        # each batch of events, so a burst becomes one change of the chat
+        new_messages = []
+
+        def flush():
+            if new_messages and self.is_chatbox_rendered:
+                self.chatbox.body.body.extend(self.render_messages(new_messages))
+                self.chatbox.body.scroll_to_bottom()
+            del new_messages[:]
+
+        while True:
+            events = yield from self.rtm.read()
+            self.store.metrics.incr('render.events_applied', len(events))
+            # Bots are loaded before the batch is applied, rendering never waits for Slack
+            messages = [
+                event.get('message', event) for event in events
+                if event.get('type') == 'message'
+            ]
+            if self.store.find_unknown_bots(messages):
+                yield from loop.run_in_executor(self.scheduler.api, self.store.load_bots, messages)
 
             for event in events:
                 if event.get('type') == 'hello':
                     pass
+                elif event.get('type') == RECONNECTED_EVENT:
+                    self._received_since_reconnect = set()
+                    self.catch_up.start(self.rtm.catch_up(
+                        self.load_missed_messages(dict(self.store.state.last_seen_ts))
+                    ))
+                elif event.get('type') == CAUGHT_UP_EVENT:
+                    # Unless it comes from a catch up replaced by a newer one
+                    if not self.catch_up.running:
+                        self._received_since_reconnect = None
                 elif event.get('type') in ('channel_marked', 'group_marked', 'im_marked'):
-                    unread = event.get('unread_count_display', 0)
-
-                    if event.get('type') == 'channel_marked':
-                        targets = self.sidebar.get_all_channels()
-                    elif event.get('type') == 'group_marked':
-                        targets = self.sidebar.get_all_groups()
-                    else:
-                        targets = self.sidebar.get_all_dms()
-
-                    for target in targets:
-                        if target.id == event['channel']:
-                            target.set_unread(unread)
+                    self.update_chat(event)
 
                 elif event['type'] == 'message':
-                    loop.create_task(
-                        self.update_chat(event)
-                    )
+                    received = self._received_since_reconnect
+                    if received is not None:
+                        key = (event.get('channel'), event.get('ts'))
+                        if not event.get(CATCH_UP_KEY):
+                            received.add(key)
+                        elif key in received:
+                            continue
+                    self.store.set_last_seen_ts(event.get('channel'), event.get('ts'))
+                    self.update_chat(event)
 
                     if event.get('channel') == self.store.state.channel['id']:
                         if not self.is_chatbox_rendered:
                             return
 
+                        walker = self.chatbox.body.body
+                        newest_ts = new_messages[-1]['ts'] if new_messages else walker.newest_ts()
+                        if event.get('subtype') in ('message_deleted', 'message_changed'):
+                            flush()
                         if event.get('subtype') == 'message_deleted':
-                            for widget in self.chatbox.body.body:
-                                if hasattr(widget, 'ts') and getattr(widget, 'ts') == event['deleted_ts']:
-                                    self.chatbox.body.body.remove(widget)
-                                    break
+                            position = walker.find_ts(event['deleted_ts'])
+                            if position is not None:
+                                del walker[position]
                         elif event.get('subtype') == 'message_changed':
-                            for index, widget in enumerate(self.chatbox.body.body):
-                                if hasattr(widget, 'ts') and getattr(widget, 'ts') == event['message']['ts']:
-                                    self.chatbox.body.body[index] = self.render_message(event['message'])
-                                    break
+                            position = walker.find_ts(event['message']['ts'])
+                            if position is not None:
+                                walker[position] = self.render_message(event['message'])
+                        elif walker.find_ts(event['ts']) is not None:
+                            # Our own message, already confirmed by the outbox
+                            pass
+                        elif newest_ts and float(event['ts']) < float(newest_ts):
+                            # Arrived late, goes at its place without a date divider
+                            if self.get_message_author(event) is not None:
+                                walker.insert_message(LazyMessage(
+                                    event,
+                                    None,
+                                    functools.partial(self.render_message, event)
+                                ))
                         else:
-                            self.chatbox.body.body.extend(self.render_messages([event]))
-                            self.chatbox.body.scroll_to_bottom()
-                    else:
-                        pass
+                            new_messages.append(event)
+                    elif event.get('subtype') in ('message_changed', 'message_deleted'):
+                        # The cached rows of that channel are outdated
+                        self.store.history.discard(event.get('channel'))
                 elif event['type'] == 'user_typing':
                     if not self.is_chatbox_rendered:
                         return
@@ -792,17 +1286,68 @@ class App:
                         return
 
                     # Message was sent, Slack confirmed it.
-                    self.chatbox.body.body.extend(self.render_messages([{
+                    if self.chatbox.body.body.find_ts(event['ts']) is not None:
+                        continue
+                    new_messages.append({
                         'text': event['text'],
                         'ts': event['ts'],
                         'user': self.store.state.auth['user_id']
-                    }]))
-                    self.chatbox.body.scroll_to_bottom()
+                    })
                     self.handle_mark_read(-1)
                 else:
                     pass
                     # print(json.dumps(event, indent=2))
-            yield from asyncio.sleep(0.5)
+
+            flush()
+
+    @asyncio.coroutine
+    def load_missed_messages(self, last_seen_ts):
+        """
+        Messages posted while the real time connection was down. Only the open
+        channel and the channels whose unread count grew are asked for, from
+        the newest message seen in them
+        :param last_seen_ts: newest ts seen by channel before the reconnection
+        :return: the message events
+        """
+        executor = self.scheduler.api
+        state = self.store.state
+        open_channel = state.channel['id']
+        changed = yield from loop.run_in_executor(executor, self.store.load_changed_unread_counts)
+        channel_ids = [
+            channel_id for channel_id in [open_channel] + sorted(set(changed) - {open_channel})
+            if channel_id in last_seen_ts and (
+                channel_id == open_channel or changed[channel_id] > state.unread_counts.get(channel_id, 0)
+            )
+        ]
+        results = yield from asyncio.gather(*[
+            loop.run_in_executor(
+                executor,
+                self.store.load_missed_messages,
+                channel_id,
+                last_seen_ts[channel_id]
+            )
+            for channel_id in channel_ids
+        ])
+
+        events = []
+        reload_open_channel = False
+        for channel_id, (missed, complete) in zip(channel_ids, results):
+            if complete:
+                events.extend(missed)
+                changed.pop(channel_id, None)
+            elif channel_id == open_channel:
+                reload_open_channel = True
+
+        # Channels the messages can't be merged into only get their badge
+        for channel_id, count in changed.items():
+            state.unread_counts[channel_id] = count
+            if self.is_chatbox_rendered:
+                self.sidebar.update_items(channel_id, count)
+
+        if reload_open_channel and state.channel['id'] == open_channel:
+            # Too much was missed, the rows on screen are replaced by a fresh load
+            self.go_to_channel(open_channel, use_cache=False)
+        return events
 
     def set_insert_mode(self):
         self.columns.focus_position = 1
@@ -838,19 +1383,78 @@ class App:
             self.quick_switcher = None
 
     def submit_message(self, message):
-        if self.store.state.editing_widget:
-            channel = self.store.state.channel['id']
-            ts = self.store.state.editing_widget.ts
-            edit_result = self.store.edit_message(channel, ts, message)
-            if edit_result['ok']:
-                self.store.state.editing_widget.original_text = edit_result['text']
-                self.store.state.editing_widget.set_text(MarkdownText(edit_result['text']))
+        """
+        Hand the message to the outbox and show it at once, marked as
+        pending until Slack confirms it
+        :param message:
+        :return:
+        """
+        channel = self.store.state.channel['id']
+        widget = self.store.state.editing_widget
+        if widget:
+            self.leave_edit_mode()
+            widget.set_text(MarkdownText(message))
+            widget.set_pending_mode()
+            self.outbox.submit(channel, message, edited_ts=widget.ts, widget=widget)
+        elif message.strip() != '':
+            widget = self.render_message({
+                'text': message,
+                'ts': str(time.time()),
+                'user': self.store.state.auth['user_id']
+            })
+            if widget is not None:
+                # Without a ts until Slack gives one, pending rows stay below the others
+                widget.ts = None
+                widget.set_pending_mode()
+                self.chatbox.body.body.append(widget)
+                self.chatbox.body.scroll_to_bottom()
+            self.outbox.submit(channel, message, widget=widget)
             self.leave_edit_mode()
-        else:
-            channel = self.store.state.channel['id']
-            if message.strip() != '':
-                self.store.post_message(channel, message)
-                self.leave_edit_mode()
+
+    def handle_message_sent(self, message):
+        """
+        Replace the pending row of a message by the one Slack confirmed
+        :param message: OutgoingMessage
+        :return:
+        """
+        widget = message.widget
+        if message.is_edit:
+            text = message.response.get('text', message.text)
+            widget.original_text = text
+            widget.set_text(MarkdownText(text))
+            if widget is not self.store.state.editing_widget:
+                widget.unset_edit_mode()
+            return
+
+        if not self.is_chatbox_rendered or message.channel_id != self.store.state.channel['id']:
+            # The pending row may be in the cached history of that channel
+            self.store.history.discard(message.channel_id)
+            return
+
+        walker = self.chatbox.body.body
+        if widget is not None:
+            position = walker.position_of(widget)
+            if position is not None:
+                del walker[position]
+
+        # The real time event of the message may have been there first
+        if walker.find_ts(message.ts) is None:
+            confirmed = dict(message.response.get('message') or {}, ts=message.ts)
+            confirmed.setdefault('text', message.text)
+            confirmed.setdefault('user', self.store.state.auth['user_id'])
+            confirmed_widget = self.render_message(confirmed, message.channel_id)
+            if confirmed_widget is not None:
+                walker.insert_message(confirmed_widget)
+                self.chatbox.body.scroll_to_bottom()
+        self.handle_mark_read(-1)
+
+    def handle_message_failed(self, message):
+        widget = message.widget
+        if widget is None:
+            return
+        if message.is_edit:
+            widget.set_text(MarkdownText(widget.original_text))
+        widget.set_failed_mode()
 
     def go_to_last_message(self):
         self.go_to_chatbox()
@@ -908,8 +1512,6 @@ class App:
                 return
             self.workspaces_line.select(selected_workspace)
 
-            # Stop rtm to switch workspace
-            self.real_time_task.cancel()
             return self.switch_to_workspace(selected_workspace)
         elif key == keymap['set_snooze']:
             return self.open_set_snooze()
@@ -937,10 +1539,33 @@ class App:
 
     def quit_application(self):
         self.urwid_loop.stop()
-        if hasattr(self, 'real_time_task'):
-            self.real_time_task.cancel()
+        self.stop_background_tasks()
+        self.stop_requests()
+        self.scheduler.shutdown()
+        self.store.session.close()
+        self.store.save_snapshot()
+        self.collect_metrics()
+        self.store.save_metrics()
         sys.exit()
 
+    def collect_metrics(self):
+        """
+        Copy the counters kept outside of the store into its metrics
+        :return:
+        """
+        metrics = self.store.metrics
+        metrics.gauge('markdown.cache_hits', markup_cache.hits)
+        metrics.gauge('markdown.cache_misses', markup_cache.misses)
+        metrics.gauge('markdown.cache_size', len(markup_cache))
+        if emoji_codemap.load_time is not None:
+            metrics.gauge('emoji.load_seconds', emoji_codemap.load_time)
+        pictures = self.store.pictures
+        if pictures is not None:
+            for name, value in pictures.stats.items():
+                metrics.gauge('pictures.{}'.format(name), value)
+            metrics.gauge('pictures.hit_rate', pictures.hit_rate())
+            metrics.gauge('pictures.memory_bytes', pictures.memory.size)
+
 
 def ask_for_token(json_config):
     if os.path.isfile(os.path.expanduser('~/.sclack')):
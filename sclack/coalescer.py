@@ -0,0 +1,131 @@
+import collections
+import copy
+import threading
+import time
+
+DEFAULT_CACHE_TTL = 5
+MAX_CACHED_RESPONSES = 1024
+
+# Reads that can be shared by concurrent identical calls
+READ_METHODS = frozenset([
+    'auth.test',
+    'bots.info',
+    'chat.getPermalink',
+    'conversations.history',
+    'conversations.info',
+    'conversations.list',
+    'conversations.members',
+    'dnd.info',
+    'emoji.list',
+    'im.info',
+    'stars.list',
+    'users.counts',
+    'users.getPresence',
+    'users.info',
+    'users.list',
+])
+
+# Reads whose answer may also be reused for `ttl` seconds. History and
+# counts change with every message, they are only shared while in flight
+CACHED_METHODS = READ_METHODS - frozenset([
+    'conversations.history',
+    'users.counts',
+])
+
+
+class InFlight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+        self.followers = 0
+
+
+class RequestCoalescer:
+    """
+    Identical read requests made at the same time share one request and its
+    response, and the successful responses of cacheable reads are kept for
+    `ttl` seconds. Any other method may change what the reads return, so it
+    empties the cache. Up to MAX_CACHED_RESPONSES are kept, the oldest go
+    first. Callers always get their own copy of a shared response, a
+    response nobody else needs isn't copied
+    """
+    def __init__(self, metrics, ttl=DEFAULT_CACHE_TTL, clock=time.monotonic):
+        self.metrics = metrics
+        self.ttl = ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self._cache = collections.OrderedDict()
+
+    def call(self, send, method, **kwargs):
+        """
+        :param send: function making the request, only called when it can't be shared
+        :param method:
+        :param kwargs:
+        :return:
+        """
+        if method not in READ_METHODS:
+            with self._lock:
+                self._cache.clear()
+            return send(method, **kwargs)
+
+        key = (method, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return send(method, **kwargs)
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] > self.clock():
+                self.metrics.incr('api.cache_hits')
+                self.metrics.incr('api.saved_calls')
+                return copy.deepcopy(cached[1])
+            flight = self._in_flight.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = self._in_flight[key] = InFlight()
+            else:
+                flight.followers += 1
+
+        if not is_leader:
+            self.metrics.incr('api.coalesced')
+            self.metrics.incr('api.saved_calls')
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.response)
+
+        response = None
+        try:
+            response = send(method, **kwargs)
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            cacheable = (
+                flight.error is None and self.ttl > 0 and method in CACHED_METHODS
+                and response.get('ok', False)
+            )
+            with self._lock:
+                del self._in_flight[key]
+                shared = flight.followers > 0 or cacheable
+                if cacheable:
+                    self._put(key, response)
+            flight.response = response
+            flight.done.set()
+        # The others copy the response as Slack sent it, the caller may change its own
+        return copy.deepcopy(response) if shared else response
+
+    def _put(self, key, response):
+        now = self.clock()
+        self._cache.pop(key, None)
+        # Every response has the same ttl, the first one kept expires first
+        while len(self._cache) >= MAX_CACHED_RESPONSES:
+            self._cache.popitem(last=False)
+        self._cache[key] = (now + self.ttl, response)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
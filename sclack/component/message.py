@@ -98,6 +98,18 @@ class Message(urwid.AttrMap):
             'message': 'editing_message'
         })
 
+    def set_pending_mode(self):
+        self.set_attr_map({
+            None: 'pending_message',
+            'message': 'pending_message'
+        })
+
+    def set_failed_mode(self):
+        self.set_attr_map({
+            None: 'failed_message',
+            'message': 'failed_message'
+        })
+
     def unset_edit_mode(self):
         self.set_attr_map({
             None: None,
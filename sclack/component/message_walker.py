@@ -0,0 +1,236 @@
+import bisect
+import collections
+
+import urwid
+
+WIDGET_CACHE_SIZE = 256
+
+
+class LazyMessage:
+    """
+    Row of the chat history whose widget is only built when it gets near the
+    viewport. It exposes the same `ts` and `channel_id` as a Message widget
+    """
+    def __init__(self, message, channel_id, build):
+        self.message = message
+        self.ts = message['ts']
+        self.channel_id = channel_id if channel_id is not None else message.get('channel')
+        self.build = build
+
+
+class MessageWalker(urwid.SimpleFocusListWalker):
+    """
+    List walker over the chat history. Items are either widgets or LazyMessage
+    rows, iterating or indexing it returns them as they are. Only the rows the
+    ListBox walks through are turned into widgets, and at most `cache_size`
+    of those are kept alive.
+
+    Rows with a `ts` are indexed by it and kept in ts order, rows without
+    one (dividers) sit between them, so a message is found by bisection.
+    The positions of the rows of `divider_types` are kept sorted as well
+    """
+    def __init__(self, contents=(), cache_size=WIDGET_CACHE_SIZE, divider_types=()):
+        self.cache_size = cache_size
+        self.divider_types = divider_types
+        self._widgets = collections.OrderedDict()
+        self._rows_by_ts = {}
+        contents = list(contents)
+        self._index_rows(contents)
+        self._dividers = self._divider_positions(contents, 0)
+        super(MessageWalker, self).__init__(contents)
+
+    def _index_rows(self, rows):
+        for row in rows:
+            ts = getattr(row, 'ts', None)
+            if ts is not None:
+                self._rows_by_ts[ts] = row
+
+    def _divider_positions(self, rows, start):
+        if not self.divider_types:
+            return []
+        return [
+            start + offset
+            for offset, row in enumerate(rows)
+            if isinstance(row, self.divider_types)
+        ]
+
+    def _adjust_focus_on_contents_modified(self, slc, new_items=()):
+        # Every change of the contents goes through here before it is applied
+        for row in self[slc]:
+            ts = getattr(row, 'ts', None)
+            if ts is not None and self._rows_by_ts.get(ts) is row:
+                del self._rows_by_ts[ts]
+            self._widgets.pop(row, None)
+        self._index_rows(new_items)
+        self._update_dividers(slc, new_items)
+        return super(MessageWalker, self)._adjust_focus_on_contents_modified(slc, new_items)
+
+    def _update_dividers(self, slc, new_items):
+        start, stop, step = slc.indices(len(self))
+        if step != 1:
+            contents = list(self)
+            contents[slc] = new_items
+            self._dividers = self._divider_positions(contents, 0)
+            return
+
+        stop = max(start, stop)
+        low = bisect.bisect_left(self._dividers, start)
+        high = bisect.bisect_left(self._dividers, stop)
+        shift = len(new_items) - (stop - start)
+        self._dividers[low:] = (
+            self._divider_positions(new_items, start)
+            + [position + shift for position in self._dividers[high:]]
+        )
+
+    def divider_before(self, position):
+        """
+        Closest divider above a position
+        :param position:
+        :return: the divider or None
+        """
+        index = bisect.bisect_left(self._dividers, position)
+        if index == 0:
+            return None
+        return self[self._dividers[index - 1]]
+
+    def _ts_from(self, position):
+        """
+        ts of the first row with one at or after position
+        :param position:
+        :return: (ts as a float or None, its position)
+        """
+        while position < len(self):
+            ts = getattr(self[position], 'ts', None)
+            if ts is not None:
+                return float(ts), position
+            position += 1
+        return None, position
+
+    def bisect_ts(self, ts):
+        """
+        Position where a message with this ts belongs, before any divider
+        that precedes the first newer row
+        :param ts:
+        :return:
+        """
+        target = float(ts)
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            value, position = self._ts_from(middle)
+            if value is None or value >= target:
+                high = middle
+            else:
+                low = position + 1
+        return low
+
+    def find_ts(self, ts):
+        """
+        Position of the row of a message
+        :param ts:
+        :return: the position or None
+        """
+        row = self._rows_by_ts.get(ts)
+        if row is None:
+            return None
+        _, position = self._ts_from(self.bisect_ts(ts))
+        if position < len(self) and self[position] is row:
+            return position
+        # Rows out of ts order, such as replies, are still found
+        for position, item in enumerate(self):
+            if item is row:
+                return position
+        return None
+
+    def insert_message(self, row):
+        """
+        Insert a row at its place in ts order, for messages arriving late
+        :param row:
+        :return: its position
+        """
+        position = self.bisect_ts(row.ts)
+        self.insert(position, row)
+        return position
+
+    def newest_ts(self):
+        for row in reversed(self):
+            ts = getattr(row, 'ts', None)
+            if ts is not None:
+                return ts
+        return None
+
+    def widget_at(self, position):
+        item = self[position]
+        if not isinstance(item, LazyMessage):
+            return item
+
+        widget = self._widgets.get(item)
+        if widget is None:
+            widget = item.build()
+            self._widgets[item] = widget
+            while len(self._widgets) > self.cache_size:
+                self._widgets.popitem(last=False)
+        else:
+            self._widgets.move_to_end(item)
+
+        return widget
+
+    def position_of(self, widget):
+        """
+        Position of a row, given either the row itself or the widget built for it
+        :param widget:
+        :return: the position or None
+        """
+        ts = getattr(widget, 'ts', None)
+        if ts is not None:
+            position = self.find_ts(ts)
+            if position is not None and (self[position] is widget
+                                         or self._widgets.get(self[position]) is widget):
+                return position
+        for position, item in enumerate(self):
+            if item is widget or self._widgets.get(item) is widget:
+                return position
+        return None
+
+    @property
+    def widgets(self):
+        """
+        Copy of the widgets built so far, by row
+        :return:
+        """
+        return collections.OrderedDict(self._widgets)
+
+    def set_contents(self, rows, widgets=None):
+        """
+        Replace every row, reusing the widgets already built for them
+        :param rows:
+        :param widgets: as returned by `widgets`
+        :return:
+        """
+        self[:] = rows
+        self._widgets = collections.OrderedDict(widgets or ())
+
+    @property
+    def built_widgets(self):
+        return len(self._widgets)
+
+    def get_focus(self):
+        try:
+            focus = self.focus
+            return self.widget_at(focus), focus
+        except (IndexError, KeyError, TypeError):
+            return None, None
+
+    def get_next(self, position):
+        try:
+            position = self.next_position(position)
+            return self.widget_at(position), position
+        except (IndexError, KeyError):
+            return None, None
+
+    def get_prev(self, position):
+        try:
+            position = self.prev_position(position)
+            return self.widget_at(position), position
+        except (IndexError, KeyError):
+            return None, None
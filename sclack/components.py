@@ -10,11 +10,15 @@ from datetime import datetime
 from .emoji import emoji_codemap
 from .markdown import MarkdownText
 from .store import Store
+from sclack.component.message_walker import MessageWalker
 from sclack.utils.channel import is_group, is_channel, is_dm
 from sclack.utils.message import format_date_time
 
 
 MARK_READ_ALARM_PERIOD = 3
+# Older messages are asked for while the focus is this close to the top,
+# so they are there before it is reached
+LOAD_OLDER_THRESHOLD = 50
 
 
 def get_icon(name):
@@ -244,7 +248,8 @@ class ChannelTopic(urwid.Edit):
 
 class ChatBox(urwid.Frame):
     __metaclass__ = urwid.MetaSignals
-    signals = ['go_to_sidebar', 'open_quick_switcher', 'set_insert_mode', 'mark_read', 'open_set_snooze']
+    signals = ['go_to_sidebar', 'open_quick_switcher', 'set_insert_mode', 'mark_read', 'open_set_snooze',
+               'load_older_messages']
 
     def __init__(self, messages, header, message_box, event_loop):
         self._header = header
@@ -254,6 +259,7 @@ class ChatBox(urwid.Frame):
         urwid.connect_signal(self.body, 'set_date', self._header.on_set_date)
         urwid.connect_signal(self.body, 'set_insert_mode', self.set_insert_mode)
         urwid.connect_signal(self.body, 'mark_read', self.mark_as_read)
+        urwid.connect_signal(self.body, 'load_older_messages', self.load_older_messages)
         super(ChatBox, self).__init__(self.body, header=header, footer=self.message_box)
 
     def set_insert_mode(self):
@@ -262,6 +268,9 @@ class ChatBox(urwid.Frame):
     def mark_as_read(self, data):
         urwid.emit_signal(self, 'mark_read', data)
 
+    def load_older_messages(self):
+        urwid.emit_signal(self, 'load_older_messages')
+
     def keypress(self, size, key):
         keymap = Store.instance.config['keymap']
         if key == keymap['open_quick_switcher']:
@@ -282,15 +291,18 @@ class ChatBox(urwid.Frame):
         urwid.disconnect_signal(self.body, 'set_date', self._header.on_set_date)
         self._header = header
         urwid.connect_signal(self.body, 'set_date', self._header.on_set_date)
+        self.body.floating_date = False
         self.set_header(self._header)
 
 
 class ChatBoxMessages(urwid.ListBox):
     __metaclass__ = urwid.MetaSignals
-    signals = ['set_auto_scroll', 'set_date', 'set_insert_mode', 'mark_read']
+    signals = ['set_auto_scroll', 'set_date', 'set_insert_mode', 'mark_read', 'load_older_messages']
 
     def __init__(self, messages=(), event_loop=None):
-        self.body = urwid.SimpleFocusListWalker(messages)
+        self.body = MessageWalker(messages, divider_types=(TextDivider,))
+        # Nothing sent yet, the first render always sets the date
+        self.floating_date = False
         super(ChatBoxMessages, self).__init__(self.body)
         self.auto_scroll = True
         self.last_keypress = (0, None, 0)
@@ -346,6 +358,17 @@ class ChatBoxMessages(urwid.ListBox):
         if key == keymap['cursor_down']:
             self.keypress(size, 'down')
 
+        self.check_older_messages()
+
+    def check_older_messages(self):
+        """
+        Ask for older messages when the focus gets near the top
+        :return:
+        """
+        focus = self.get_focus()[1]
+        if focus is not None and focus < LOAD_OLDER_THRESHOLD:
+            urwid.emit_signal(self, 'load_older_messages')
+
     def mouse_event(self, size, event, button, col, row, focus):
         self.handle_floating_date(size)
         if event == 'mouse press' and button in (4, 5):
@@ -380,19 +403,17 @@ class ChatBoxMessages(urwid.ListBox):
     def handle_floating_date(self, size):
         # No messages, no date
         if not self.focus:
-            urwid.emit_signal(self, 'set_date', None)
+            self.set_floating_date(None)
             return
         middle, top, _ = self.calculate_visible(size, self.focus)
         row_offset, widget, focus_position, _, _ = middle
         index = focus_position - row_offset + top[0]
-        all_before = self.body[:index]
-        all_before.reverse()
-        text_divider = None
-        for row in all_before:
-            if isinstance(row, TextDivider):
-                text_divider = row
-                break
-        urwid.emit_signal(self, 'set_date', text_divider)
+        self.set_floating_date(self.body.divider_before(index))
+
+    def set_floating_date(self, divider):
+        if divider is not self.floating_date:
+            self.floating_date = divider
+            urwid.emit_signal(self, 'set_date', divider)
 
 
 class Dm(urwid.AttrMap):
@@ -772,21 +793,18 @@ class SideBar(urwid.Frame):
             else:
                 dm.deselect()
 
-    def update_items(self, event):
+    def update_items(self, channel_id, unread_count):
         """
         Update unread count for side bar items
-        :param event:
+        :param channel_id:
+        :param unread_count:
         :return:
         """
-        channel_id = event.get('channel')
-        target = self.get_targets_by_id(channel_id)
-
-        chat_detail = Store.instance.get_channel_info(event.get('channel'))
-        new_count = chat_detail.get('unread_count_display', 0)
+        target = self.get_targets_by_id(channel_id) or ()
 
         for widget in target:
             if widget.id == channel_id:
-                widget.set_unread(new_count)
+                widget.set_unread(unread_count)
 
     def go_to_channel(self, channel):
         urwid.emit_signal(self, 'go_to_channel', channel)
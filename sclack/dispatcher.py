@@ -0,0 +1,218 @@
+import heapq
+import itertools
+import threading
+import time
+
+# Requests waiting for the same tier are sent in this order
+INTERACTIVE = 0
+VIEWPORT = 1
+BACKGROUND = 2
+
+# Requests per minute allowed by Slack for each tier, bursts up to the same
+# amount are tolerated. `post` stands for the special limit of chat.postMessage
+TIER_RATES = {
+    1: 1,
+    2: 20,
+    3: 50,
+    4: 100,
+    'post': 60,
+}
+DEFAULT_TIER = 3
+
+METHOD_TIERS = {
+    'auth.test': 4,
+    'bots.info': 3,
+    'channels.mark': 3,
+    'chat.delete': 3,
+    'chat.getPermalink': 4,
+    'chat.postMessage': 'post',
+    'chat.update': 3,
+    'conversations.history': 3,
+    'conversations.info': 3,
+    'conversations.list': 2,
+    'conversations.members': 4,
+    'conversations.setTopic': 2,
+    'dnd.info': 3,
+    'dnd.setSnooze': 2,
+    'emoji.list': 2,
+    'groups.mark': 3,
+    'im.info': 3,
+    'im.mark': 3,
+    'stars.list': 2,
+    'users.counts': 3,
+    'users.getPresence': 3,
+    'users.info': 4,
+    'users.list': 2,
+}
+
+# Methods not listed here show something in the viewport
+METHOD_PRIORITIES = {
+    'chat.delete': INTERACTIVE,
+    'chat.getPermalink': INTERACTIVE,
+    'chat.postMessage': INTERACTIVE,
+    'chat.update': INTERACTIVE,
+    'conversations.setTopic': INTERACTIVE,
+    'dnd.setSnooze': INTERACTIVE,
+    'channels.mark': BACKGROUND,
+    'conversations.list': BACKGROUND,
+    'dnd.info': BACKGROUND,
+    'emoji.list': BACKGROUND,
+    'groups.mark': BACKGROUND,
+    'im.mark': BACKGROUND,
+    'stars.list': BACKGROUND,
+    'users.counts': BACKGROUND,
+    'users.getPresence': BACKGROUND,
+    'users.list': BACKGROUND,
+}
+
+DEFAULT_MAX_RETRIES = 3
+
+
+class DispatcherClosed(Exception):
+    """
+    Raised to the requests waiting for their tier when the dispatcher closes
+    """
+
+
+class TokenBucket:
+    """
+    Allow `rate` requests per minute on average, up to `capacity` at once
+    """
+    def __init__(self, rate, capacity=None, clock=time.monotonic):
+        self.rate = rate / 60.0
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = float(self.capacity)
+        self.clock = clock
+        self.updated_at = clock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def delay(self, now):
+        """
+        Seconds until a token is available
+        :param now:
+        :return:
+        """
+        self._refill(now)
+        if self.tokens >= 1:
+            return 0
+        return (1 - self.tokens) / self.rate
+
+    def take(self):
+        self.tokens -= 1
+
+
+def retry_after(response):
+    """
+    Seconds to wait before trying again when Slack rate limited the request
+    :param response:
+    :return: the delay or None when the request wasn't limited
+    """
+    if response.get('ok', True) or response.get('error') != 'ratelimited':
+        return None
+    for name, value in response.get('headers', {}).items():
+        if name.lower() == 'retry-after':
+            try:
+                return float(value)
+            except ValueError:
+                break
+    return 1.0
+
+
+class ApiDispatcher:
+    """
+    Send Web API requests within the rate limits of their Slack tier.
+    Callers are threads, they block until their tier has a token and no
+    more important request of the same tier is waiting. A rate limited
+    response pauses the whole tier for `Retry-After` seconds, then the
+    request is sent again. Closing it wakes up every waiting request
+    """
+    def __init__(self, api_call, metrics, tier_rates=TIER_RATES,
+                 max_retries=DEFAULT_MAX_RETRIES, clock=time.monotonic):
+        self.api_call = api_call
+        self.metrics = metrics
+        self.max_retries = max_retries
+        self.clock = clock
+        self._condition = threading.Condition()
+        self._sequence = itertools.count()
+        self._buckets = {
+            tier: TokenBucket(rate, clock=clock)
+            for tier, rate in tier_rates.items()
+        }
+        self._waiting = {tier: [] for tier in tier_rates}
+        self._paused_until = {tier: 0 for tier in tier_rates}
+        self._closed = False
+
+    def close(self):
+        """
+        Fail the requests waiting for a token or a paused tier, and the next
+        ones, so no worker is left sleeping when leaving or switching workspace
+        :return:
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def call(self, method, priority=None, **kwargs):
+        """
+        :param method:
+        :param priority: INTERACTIVE, VIEWPORT or BACKGROUND, defaults to the one of the method
+        :param kwargs:
+        :return:
+        """
+        tier = METHOD_TIERS.get(method, DEFAULT_TIER)
+        if tier not in self._buckets:
+            tier = DEFAULT_TIER
+        if priority is None:
+            priority = METHOD_PRIORITIES.get(method, VIEWPORT)
+
+        for attempt in range(self.max_retries + 1):
+            self._acquire(tier, priority)
+            response = self.api_call(method, **kwargs)
+            delay = retry_after(response)
+            if delay is None:
+                break
+            self.metrics.incr('api.ratelimited')
+            self._pause(tier, delay)
+        return response
+
+    def _acquire(self, tier, priority):
+        started_at = self.clock()
+        bucket = self._buckets[tier]
+        waiting = self._waiting[tier]
+        entry = (priority, next(self._sequence))
+        with self._condition:
+            heapq.heappush(waiting, entry)
+            try:
+                while True:
+                    if self._closed:
+                        raise DispatcherClosed()
+                    now = self.clock()
+                    delay = max(self._paused_until[tier] - now, 0)
+                    if waiting[0] == entry:
+                        delay = max(delay, bucket.delay(now))
+                        if delay == 0:
+                            heapq.heappop(waiting)
+                            bucket.take()
+                            break
+                    else:
+                        # Woken up when the head of the queue is served
+                        delay = None
+                    self._condition.wait(delay)
+            except BaseException:
+                waiting.remove(entry)
+                heapq.heapify(waiting)
+                raise
+            finally:
+                self._condition.notify_all()
+
+        waited = self.clock() - started_at
+        if waited > 0:
+            self.metrics.incr('api.throttled_seconds', waited)
+
+    def _pause(self, tier, delay):
+        with self._condition:
+            self._paused_until[tier] = max(self._paused_until[tier], self.clock() + delay)
+            self._condition.notify_all()
@@ -0,0 +1,52 @@
+import urwid
+
+DEFAULT_MAX_FPS = 30
+
+
+class FrameMainLoop(urwid.MainLoop):
+    """
+    Main loop painting the screen only when a widget changed. The event loop
+    calls `entering_idle` at most `render.max_fps` times a second, every
+    change made in between, like a burst of real time events, ends up in the
+    same frame. A widget tree that wasn't invalidated renders to the canvas
+    cached the last time, then the terminal is left alone.
+    Frames painted are counted as `render.frames`, the others as
+    `render.frames_skipped`
+    """
+    def __init__(self, widget, metrics, **kwargs):
+        self.metrics = metrics
+        self._last_frame = None
+        super(FrameMainLoop, self).__init__(widget, **kwargs)
+
+    def start(self):
+        self.redraw()
+        return super(FrameMainLoop, self).start()
+
+    def process_input(self, keys):
+        # The screen is cleared before being painted again
+        if any(not urwid.is_mouse_event(key) and urwid.command_map[key] == urwid.REDRAW_SCREEN
+               for key in keys):
+            self.redraw()
+        return super(FrameMainLoop, self).process_input(keys)
+
+    def draw_screen(self):
+        if not self.screen_size:
+            self.screen_size = self.screen.get_cols_rows()
+            self._last_frame = None
+
+        canvas = self._topmost_widget.render(self.screen_size, focus=True)
+        if self._last_frame is not None and self._last_frame[0] is canvas \
+                and self._last_frame[1] == self.screen_size:
+            self.metrics.incr('render.frames_skipped')
+            return
+
+        self.screen.draw_screen(self.screen_size, canvas)
+        self._last_frame = (canvas, self.screen_size)
+        self.metrics.incr('render.frames')
+
+    def redraw(self):
+        """
+        Paint the next frame even if no widget changed
+        :return:
+        """
+        self._last_frame = None
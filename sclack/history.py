@@ -0,0 +1,76 @@
+import collections
+
+DEFAULT_HISTORY_MESSAGES = 2000
+
+
+class ChannelHistory:
+    """
+    What is needed to show a channel again without asking Slack: its info,
+    the rows of the chat body with the widgets already built for them and
+    where the focus was
+    """
+    def __init__(self, channel, members, pin_count, has_more, messages,
+                 rows, widgets, focus, last_date):
+        self.channel = channel
+        self.members = members
+        self.pin_count = pin_count
+        self.has_more = has_more
+        self.messages = messages
+        self.rows = rows
+        self.widgets = widgets
+        self.focus = focus
+        self.last_date = last_date
+
+    def newest_ts(self):
+        """
+        Timestamp of the newest message, including the ones received while
+        the channel was open
+        :return: the ts or None
+        """
+        for row in reversed(self.rows):
+            ts = getattr(row, 'ts', None)
+            if ts and ts != '0':
+                return ts
+        return None
+
+    def __len__(self):
+        return len(self.rows)
+
+
+class HistoryCache:
+    """
+    Least recently visited channels, bounded by their total number of rows
+    """
+    def __init__(self, max_messages=DEFAULT_HISTORY_MESSAGES):
+        self.max_messages = max_messages
+        self.size = 0
+        self._channels = collections.OrderedDict()
+
+    def put(self, channel_id, history):
+        self.discard(channel_id)
+        if len(history) > self.max_messages:
+            return
+        self._channels[channel_id] = history
+        self.size += len(history)
+        while self.size > self.max_messages:
+            _, evicted = self._channels.popitem(last=False)
+            self.size -= len(evicted)
+
+    def pop(self, channel_id):
+        history = self._channels.pop(channel_id, None)
+        if history is not None:
+            self.size -= len(history)
+        return history
+
+    def discard(self, channel_id):
+        self.pop(channel_id)
+
+    def clear(self):
+        self._channels.clear()
+        self.size = 0
+
+    def __contains__(self, channel_id):
+        return channel_id in self._channels
+
+    def __len__(self):
+        return len(self._channels)
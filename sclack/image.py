@@ -1,6 +1,19 @@
+import io
 import subprocess
+import tempfile
 import urwid
 
+try:
+    from PIL import Image as PILImage
+except ImportError:
+    PILImage = None
+
+# Upper half block, the foreground paints the top pixel and the background
+# the bottom one, so a cell shows two pixels
+HALF_BLOCK = '\u2580'
+# Transparent pixels are blended with the background of the chat (h235)
+BACKGROUND_RGB = (38, 38, 38)
+
 color_list = [
     'black',
     'dark red',
@@ -61,12 +74,101 @@ def img_to_ansi(path, width, height):
         ansi_text = None
     return ansi_text
 
+def downsample(data, width):
+    """
+    Decode the picture and resize it to `width` columns, keeping the aspect
+    ratio. Terminal cells are about twice as tall as wide, a cell holds two
+    pixel rows
+    :param data: encoded picture
+    :param width: columns
+    :return: a RGB PIL image
+    """
+    picture = PILImage.open(io.BytesIO(data))
+    picture.draft('RGB', (width, width * 4))
+    picture = picture.convert('RGBA')
+    height = max(2, round(width * picture.height / picture.width))
+    height += height % 2
+    picture = picture.resize((width, height), PILImage.BILINEAR)
+    background = PILImage.new('RGBA', picture.size, BACKGROUND_RGB + (255,))
+    return PILImage.alpha_composite(background, picture).convert('RGB')
+
+
+def hex_color(pixel):
+    return '#{:x}{:x}{:x}'.format(pixel[0] >> 4, pixel[1] >> 4, pixel[2] >> 4)
+
+
+def image_to_cells(picture):
+    """
+    Pair the pixel rows and merge the neighbouring cells with the same colors
+    :param picture: a RGB PIL image with an even height
+    :return: lines of (foreground, background, text) runs
+    """
+    width, height = picture.size
+    data = picture.tobytes()
+    row_size = width * 3
+    lines = []
+    for top in range(0, height, 2):
+        runs = []
+        upper = top * row_size
+        lower = upper + row_size
+        for offset in range(0, row_size, 3):
+            colors = (
+                hex_color(data[upper + offset:upper + offset + 3]),
+                hex_color(data[lower + offset:lower + offset + 3])
+            )
+            if runs and runs[-1][:2] == colors:
+                runs[-1] = colors + (runs[-1][2] + HALF_BLOCK,)
+            else:
+                runs.append(colors + (HALF_BLOCK,))
+        lines.append(runs)
+    return lines
+
+
+def render_picture(data, width=None, height=None):
+    """
+    Render an encoded picture for the terminal. It only returns plain data so
+    it can run in a process pool, `Image` turns it into markup. Pillow is used
+    when it is installed, `img2txt` otherwise
+    :param data: encoded picture
+    :param width: columns
+    :param height: rows, only honored by img2txt
+    :return: ('cells', lines), ('ansi', text) or None
+    """
+    width = int(width or 80)
+    if PILImage is not None:
+        try:
+            return ('cells', image_to_cells(downsample(data, width)))
+        except (OSError, ValueError, ZeroDivisionError):
+            pass
+
+    with tempfile.NamedTemporaryFile() as file:
+        file.write(data)
+        file.flush()
+        ansi_text = img_to_ansi(file.name, width, height)
+    if ansi_text:
+        return ('ansi', ansi_text)
+    return None
+
+
+def cells_to_urwid(lines):
+    result = []
+    for index, runs in enumerate(lines):
+        if index > 0:
+            result.append('\n')
+        for foreground, background, text in runs:
+            result.append((urwid.AttrSpec(foreground, background, colors=256), text))
+    return result
+
+
 class Image(urwid.Text):
-    def __init__(self, path, width=None, height=None):
-        ansi_text = img_to_ansi(path, width, height)
-        if ansi_text:
-            self.markup = ansi_to_urwid(ansi_text)
-        else:
+    def __init__(self, rendered):
+        """
+        :param rendered: result of `render_picture`
+        """
+        if rendered is None:
             self.markup = ['']
+        elif rendered[0] == 'cells':
+            self.markup = cells_to_urwid(rendered[1])
+        else:
+            self.markup = ansi_to_urwid(rendered[1])
         super(Image, self).__init__(self.markup)
-
@@ -72,7 +72,7 @@ class LoadingSideBar(urwid.Frame):
             for size in [5, 7, 19, 8, 0, 3, 22, 14, 11, 13]])
         super(LoadingSideBar, self).__init__(body, header=header, footer=divider)
 
-    def update_items(self, event):
+    def update_items(self, channel_id, unread_count):
         pass
 
     def get_all_channels(self):
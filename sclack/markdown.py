@@ -1,74 +1,141 @@
+import collections
 import re
 import urwid
 from .store import Store
 from .emoji import emoji_codemap
 
+EMOJI_PATTERN = re.compile(r':([\w_+-]+):')
+SPECIAL_CHARACTERS = re.compile(r'[<>|*_`]')
+MARKUP_CACHE_SIZE = 2048
 
-class MarkdownText(urwid.SelectableIcon):
-    _buffer = ''
-    _state = 'message'
-    _previous_state = 'message'
-    _result = []
 
+def render_emoji(result):
+    return emoji_codemap.get(result.group(1), result.group(0))
+
+
+class MarkupCache:
+    """
+    Bounded LRU of parsed markup, the same texts are parsed over and over
+    (attachment footers, bot messages, re-renders of edited messages)
+    """
+    def __init__(self, max_size=MARKUP_CACHE_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._markups = collections.OrderedDict()
+
+    def get(self, key):
+        markup = self._markups.get(key)
+        if markup is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._markups.move_to_end(key)
+        return list(markup)
+
+    def put(self, key, markup):
+        if self.max_size <= 0:
+            return
+        self._markups[key] = tuple(markup)
+        self._markups.move_to_end(key)
+        while len(self._markups) > self.max_size:
+            self._markups.popitem(last=False)
+
+    def clear(self):
+        self._markups.clear()
+
+    def __len__(self):
+        return len(self._markups)
+
+
+markup_cache = MarkupCache()
+
+
+class MarkdownText(urwid.SelectableIcon):
     def __init__(self, text):
         self.original_text = text
-        if Store.instance.config['features']['markdown']:
-            self.markup = self.parse_message(text)
-        else:
-            self.markup = [('message', text)]
+        features = Store.instance.config['features']
+        # Mentions are resolved from the users, only texts with them depend on it
+        users_version = Store.instance.users_version if '<@' in text else None
+        emoji_version = emoji_codemap.custom_version if features['emoji'] else None
+        key = (text, emoji_version, bool(features['markdown']), users_version)
+        self.markup = markup_cache.get(key)
+        if self.markup is None:
+            if features['markdown']:
+                self.markup = self.parse_message(text)
+            else:
+                self.markup = [('message', text)]
+            markup_cache.put(key, self.markup)
         super(MarkdownText, self).__init__(self.markup)
 
-    def decode_buffer(self):
-        return (self._buffer
+    def decode_buffer(self, buffer):
+        return (''.join(buffer)
             .replace('&lt;', '<')
             .replace('&gt;', '>')
             .replace('&amp;', '&'))
 
-    def change_state(self, buffer_state, next_state):
-        self._result.append((buffer_state, self.decode_buffer()))
-        self._buffer = ''
-        self._previous_state = self._state
-        self._state = next_state
-
-    def resolve_mention(self):
-        if self._buffer.startswith('@'):
-            user = Store.instance.find_user_by_id(self._buffer[1:])
+    def resolve_mention(self, buffer):
+        text = ''.join(buffer)
+        if text.startswith('@'):
+            user = Store.instance.find_user_by_id(text[1:])
             if user:
-                self._buffer = user.get('display_name') or user.get('real_name') or user['name']
+                return [user.get('display_name') or user.get('real_name') or user['name']]
+        return buffer
 
     def parse_message(self, text):
-        self._buffer = ''
-        self._state = 'message'
-        self._previous_state = 'message'
-        self._result = []
-        def render_emoji(result):
-            return emoji_codemap.get(result.group(1), result.group(0))
-
+        """
+        Single pass over the text: only the special characters are visited,
+        the plain text between them is copied as slices
+        :param text:
+        :return: list of (attr, text) markup
+        """
         if Store.instance.config['features']['emoji']:
-            text = re.sub(r':([\w_+-]+):', render_emoji, text)
+            text = EMOJI_PATTERN.sub(render_emoji, text)
         text = text.replace('```', '`')
-        for char in text:
-            if char == '<' and self._state != 'code':
-                self.change_state('message', 'link')
-            elif char == '>' and self._state == 'link':
-                self.resolve_mention()
-                self.change_state('link', 'message')
-            elif char == '|' and self._state == 'link':
-                self._buffer = ''
-            elif char == '*' and self._state == 'bold':
-                self.change_state('bold', self._previous_state)
-            elif char == '*' and self._state not in ('link', 'code'):
-                self.change_state(self._state, 'bold')
-            elif char == '_' and self._state == 'italics':
-                self.change_state('italics', self._previous_state)
-            elif char == '_' and self._state not in ('link', 'code', 'emoji'):
-                self.change_state(self._state, 'italics')
-            elif char == '`' and self._state == 'code':
-                self.change_state('code', self._previous_state)
-            elif char == '`' and self._state != 'link':
-                self.change_state(self._state, 'code')
+
+        result = []
+        buffer = []
+        state = 'message'
+        previous_state = 'message'
+        position = 0
+
+        for match in SPECIAL_CHARACTERS.finditer(text):
+            start = match.start()
+            if start > position:
+                buffer.append(text[position:start])
+            position = start + 1
+            char = text[start]
+
+            if char == '<' and state != 'code':
+                buffer_state, next_state = 'message', 'link'
+            elif char == '>' and state == 'link':
+                buffer = self.resolve_mention(buffer)
+                buffer_state, next_state = 'link', 'message'
+            elif char == '|' and state == 'link':
+                buffer = []
+                continue
+            elif char == '*' and state == 'bold':
+                buffer_state, next_state = 'bold', previous_state
+            elif char == '*' and state not in ('link', 'code'):
+                buffer_state, next_state = state, 'bold'
+            elif char == '_' and state == 'italics':
+                buffer_state, next_state = 'italics', previous_state
+            elif char == '_' and state not in ('link', 'code', 'emoji'):
+                buffer_state, next_state = state, 'italics'
+            elif char == '`' and state == 'code':
+                buffer_state, next_state = 'code', previous_state
+            elif char == '`' and state != 'link':
+                buffer_state, next_state = state, 'code'
             else:
-                self._buffer = self._buffer + char
+                buffer.append(char)
+                continue
+
+            result.append((buffer_state, self.decode_buffer(buffer)))
+            buffer = []
+            previous_state = state
+            state = next_state
 
-        self._result.append(('message', self.decode_buffer()))
-        return self._result
+        if position < len(text):
+            buffer.append(text[position:])
+        result.append(('message', self.decode_buffer(buffer)))
+        return result
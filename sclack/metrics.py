@@ -0,0 +1,37 @@
+import collections
+import json
+import threading
+
+
+class Metrics:
+    """
+    Thread-safe counters and gauges, written to `metrics.file` on exit
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = collections.Counter()
+        self.gauges = {}
+
+    def incr(self, name, value=1):
+        with self._lock:
+            self.counters[name] += value
+
+    def gauge(self, name, value):
+        with self._lock:
+            self.gauges[name] = value
+
+    def get(self, name, default=0):
+        with self._lock:
+            if name in self.gauges:
+                return self.gauges[name]
+            return self.counters.get(name, default)
+
+    def as_dict(self):
+        with self._lock:
+            result = dict(self.counters)
+            result.update(self.gauges)
+        return result
+
+    def save(self, path):
+        with open(path, 'w') as metrics_file:
+            json.dump(self.as_dict(), metrics_file, indent=2, sort_keys=True)
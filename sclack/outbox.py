@@ -0,0 +1,223 @@
+import collections
+import itertools
+
+import requests
+from urllib3.exceptions import ConnectTimeoutError
+
+DEFAULT_MAX_IN_FLIGHT = 4
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_BACKOFF = 0.5
+MAX_BACKOFF = 30
+
+PENDING = 'pending'
+SENT = 'sent'
+FAILED = 'failed'
+
+# Errors of Slack telling the message wasn't posted, so it can be sent
+# again. Any other one could have posted it or would happen again
+TRANSIENT_ERRORS = frozenset([
+    'ratelimited',
+    'request_timeout',
+    'service_unavailable',
+])
+
+
+def failed_before_sending(exception):
+    """
+    Whether a request failed while connecting, before Slack got anything.
+    Messages aren't idempotent, once sent a read timeout or a reset
+    connection may still have posted them
+    :param exception:
+    :return:
+    """
+    if isinstance(exception, requests.ConnectTimeout):
+        return True
+    if not isinstance(exception, requests.ConnectionError) or not exception.args:
+        return False
+    reason = getattr(exception.args[0], 'reason', None)
+    return isinstance(reason, ConnectTimeoutError)
+
+
+_ids = itertools.count(1)
+
+
+class OutgoingMessage:
+    """
+    Message typed by the user, shown before Slack confirmed it. `edited_ts`
+    is set when it replaces the text of a message already sent
+    """
+    def __init__(self, channel_id, text, edited_ts=None):
+        self.id = next(_ids)
+        self.channel_id = channel_id
+        self.text = text
+        self.edited_ts = edited_ts
+        self.state = PENDING
+        self.attempts = 0
+        self.response = None
+        self.error = None
+        self.widget = None
+
+    @property
+    def is_edit(self):
+        return self.edited_ts is not None
+
+    @property
+    def ts(self):
+        """
+        ts given by Slack once the message is sent
+        :return:
+        """
+        if self.response is not None:
+            return self.response.get('ts')
+        return None
+
+
+class Outbox:
+    """
+    Send messages from the executor without blocking the event loop. The
+    messages of a channel are sent one after the other, so they are posted
+    in the order they were typed and the last edit of a message wins. Up to
+    `max_in_flight` channels are sent to at the same time. Requests that
+    never reached Slack are retried with an exponential backoff
+    """
+    def __init__(self, post, edit, loop, executor, metrics,
+                 on_sent=None, on_failed=None,
+                 max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+                 max_attempts=DEFAULT_MAX_ATTEMPTS,
+                 backoff=DEFAULT_BACKOFF):
+        self.post = post
+        self.edit = edit
+        self.loop = loop
+        self.executor = executor
+        self.metrics = metrics
+        self.on_sent = on_sent
+        self.on_failed = on_failed
+        self.max_in_flight = max_in_flight
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self._queue = collections.deque()
+        self._in_flight = set()
+        self._retrying = {}
+        self._generation = 0
+
+    def submit(self, channel_id, text, edited_ts=None, widget=None):
+        """
+        Queue a message and start sending it if a slot is free
+        :param channel_id:
+        :param text:
+        :param edited_ts: ts of the message to edit
+        :param widget: shown while the message is pending
+        :return: the OutgoingMessage
+        """
+        message = OutgoingMessage(channel_id, text, edited_ts)
+        message.widget = widget
+        self._queue.append(message)
+        self._update_gauge()
+        self._send_next()
+        return message
+
+    @property
+    def pending(self):
+        """
+        Messages not confirmed yet, in the order they were submitted
+        :return:
+        """
+        messages = list(self._in_flight) + list(self._retrying) + list(self._queue)
+        return sorted(messages, key=lambda message: message.id)
+
+    def cancel(self):
+        """
+        Fail every message that isn't being sent right now, and the ones
+        being sent if they would need to be sent again. Used when the
+        workspace changes
+        :return:
+        """
+        self._generation += 1
+        for handle in self._retrying.values():
+            handle.cancel()
+        cancelled = list(self._retrying) + list(self._queue)
+        self._retrying.clear()
+        self._queue.clear()
+        for message in sorted(cancelled, key=lambda message: message.id):
+            self._fail(message, 'cancelled')
+        self._update_gauge()
+
+    def _send_next(self):
+        busy = {message.channel_id for message in self._in_flight}
+        busy.update(message.channel_id for message in self._retrying)
+        skipped = []
+        while self._queue and len(self._in_flight) < self.max_in_flight:
+            message = self._queue.popleft()
+            if message.channel_id in busy:
+                skipped.append(message)
+                continue
+            busy.add(message.channel_id)
+            self._start(message)
+        self._queue.extendleft(reversed(skipped))
+
+    def _start(self, message):
+        message.attempts += 1
+        self._in_flight.add(message)
+        if message.is_edit:
+            future = self.loop.run_in_executor(
+                self.executor, self.edit, message.channel_id, message.edited_ts, message.text
+            )
+        else:
+            future = self.loop.run_in_executor(
+                self.executor, self.post, message.channel_id, message.text
+            )
+        generation = self._generation
+        future.add_done_callback(lambda future: self._done(message, future, generation))
+
+    def _done(self, message, future, generation):
+        self._in_flight.discard(message)
+        retryable = False
+        if future.cancelled():
+            response, error = None, 'cancelled'
+        else:
+            try:
+                response = future.result()
+                error = None if response.get('ok', False) else response.get('error', 'unknown_error')
+                retryable = error in TRANSIENT_ERRORS
+            except Exception as exception:
+                response, error = None, str(exception) or type(exception).__name__
+                retryable = failed_before_sending(exception)
+
+        if error is None:
+            message.state = SENT
+            message.response = response
+            self.metrics.incr('outbox.sent')
+            if self.on_sent is not None:
+                self.on_sent(message)
+        elif retryable and message.attempts < self.max_attempts and generation == self._generation:
+            self._retry(message)
+        else:
+            message.response = response
+            self._fail(message, error)
+
+        self._update_gauge()
+        self._send_next()
+
+    def _retry(self, message):
+        self.metrics.incr('outbox.retries')
+        delay = min(self.backoff * 2 ** (message.attempts - 1), MAX_BACKOFF)
+
+        def requeue():
+            del self._retrying[message]
+            self._queue.appendleft(message)
+            self._send_next()
+
+        self._retrying[message] = self.loop.call_later(delay, requeue)
+
+    def _fail(self, message, error):
+        message.state = FAILED
+        message.error = error
+        self.metrics.incr('outbox.failed')
+        if self.on_failed is not None:
+            self.on_failed(message)
+
+    def _update_gauge(self):
+        self.metrics.gauge(
+            'outbox.pending',
+            len(self._queue) + len(self._in_flight) + len(self._retrying)
+        )
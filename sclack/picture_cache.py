@@ -0,0 +1,329 @@
+import collections
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+DEFAULT_MEMORY_SIZE = 16 * 1024 * 1024
+DEFAULT_DISK_SIZE = 256 * 1024 * 1024
+DEFAULT_MAX_AGE = 24 * 60 * 60
+# Eviction goes below the limit by this much, so it doesn't run on every write
+DISK_LOW_WATER = 0.9
+# Rough cost of a tuple and its strings, only used to bound the memory
+RUN_OVERHEAD = 64
+
+
+def rendered_size(rendered):
+    """
+    Approximate memory taken by the result of `render_picture`
+    :param rendered:
+    :return: bytes
+    """
+    if rendered is None:
+        return 0
+    kind, data = rendered
+    if kind == 'cells':
+        return sum(
+            RUN_OVERHEAD + len(foreground) + len(background) + len(text)
+            for runs in data
+            for foreground, background, text in runs
+        )
+    return len(data)
+
+
+def encode_rendered(rendered):
+    kind, data = rendered
+    if kind == 'ansi':
+        data = data.decode('utf-8')
+    return {'kind': kind, 'data': data}
+
+
+def decode_rendered(value):
+    kind, data = value['kind'], value['data']
+    if kind == 'ansi':
+        return (kind, data.encode('utf-8'))
+    return (kind, [[tuple(run) for run in runs] for runs in data])
+
+
+def is_picture_response(response):
+    """
+    Whether a download can be rendered and stored. Slack answers an expired
+    token or a deleted file with an HTML page
+    :param response:
+    :return:
+    """
+    content_type = response.headers.get('Content-Type', '')
+    return response.ok and content_type.split(';')[0].strip().lower().startswith('image/')
+
+
+def write_atomic(path, data):
+    directory = os.path.dirname(path)
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as temp_file:
+            temp_file.write(data)
+        os.replace(temp_path, path)
+    except Exception:
+        os.unlink(temp_path)
+        raise
+
+
+class MemoryLRU:
+    """
+    Least recently used mapping bounded by the approximate size of its values
+    """
+    def __init__(self, max_bytes, sizeof=rendered_size):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.size = 0
+        self._items = collections.OrderedDict()
+
+    def get(self, key):
+        item = self._items.get(key)
+        if item is None:
+            return None
+        self._items.move_to_end(key)
+        return item[0]
+
+    def put(self, key, value):
+        size = self.sizeof(value)
+        self.pop(key)
+        if size > self.max_bytes:
+            return
+        self._items[key] = (value, size)
+        self.size += size
+        while self.size > self.max_bytes:
+            _, (_, evicted_size) = self._items.popitem(last=False)
+            self.size -= evicted_size
+
+    def pop(self, key):
+        item = self._items.pop(key, None)
+        if item is not None:
+            self.size -= item[1]
+
+    def keys(self):
+        return list(self._items)
+
+    def clear(self):
+        self._items.clear()
+        self.size = 0
+
+    def __len__(self):
+        return len(self._items)
+
+
+class PictureCache:
+    """
+    Two tier cache of pictures. The disk keeps the downloaded bytes by URL
+    digest and the rendered pictures by URL digest and width, the memory
+    keeps the most recently shown rendered pictures. Entries older than
+    `max_age` are revalidated with the ETag or Last-Modified sent by Slack.
+    Private files are only readable with the token of their workspace, so
+    each workspace has its own directory, holding up to `disk_size` bytes.
+    The least recently used pictures are removed first
+    """
+    def __init__(self, directory, token, memory_size=DEFAULT_MEMORY_SIZE,
+                 max_age=DEFAULT_MAX_AGE, disk_size=DEFAULT_DISK_SIZE):
+        # Never write the token itself to the disk, only its digest
+        workspace_key = hashlib.sha1(token.encode('utf-8')).hexdigest()
+        self.directory = os.path.join(os.path.expanduser(directory), workspace_key, 'pictures')
+        self.max_age = max_age
+        self.disk_size = disk_size
+        self.memory = MemoryLRU(memory_size)
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        # Bytes used on disk, counted the first time something is written
+        self._disk_usage = None
+        self.stats = collections.Counter()
+
+    def _path(self, url, suffix):
+        digest = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest + suffix)
+
+    def _read_json(self, path):
+        try:
+            with open(path, 'r') as json_file:
+                return json.load(json_file)
+        except (OSError, ValueError):
+            return None
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def metadata(self, url):
+        return self._read_json(self._path(url, '.json'))
+
+    def is_fresh(self, url):
+        metadata = self.metadata(url)
+        return metadata is not None and time.time() - metadata['fetched_at'] < self.max_age
+
+    def lookup(self, url, width):
+        """
+        Rendered picture from the memory, or from the disk while it is fresh,
+        counting the hits
+        :param url:
+        :param width:
+        :return: the result of `render_picture` or None
+        """
+        with self._lock:
+            rendered = self.memory.get((url, width))
+        if rendered is not None:
+            self._count('memory_hits')
+            return rendered
+
+        value = None
+        if self.is_fresh(url):
+            value = self._read_json(self._path(url, '-{}.json'.format(width)))
+        if value is None:
+            self._count('misses')
+            return None
+
+        rendered = decode_rendered(value)
+        with self._lock:
+            self.memory.put((url, width), rendered)
+        self._touch(self._path(url, '-{}.json'.format(width)))
+        self._count('disk_hits')
+        return rendered
+
+    def get_data(self, url):
+        try:
+            with open(self._path(url, '.data'), 'rb') as data_file:
+                return data_file.read()
+        except OSError:
+            return None
+
+    def conditional_headers(self, url):
+        """
+        Headers turning the download into a revalidation of the stored copy
+        :param url:
+        :return:
+        """
+        metadata = self.metadata(url)
+        if metadata is None:
+            return {}
+        headers = {}
+        if metadata.get('etag'):
+            headers['If-None-Match'] = metadata['etag']
+        if metadata.get('last_modified'):
+            headers['If-Modified-Since'] = metadata['last_modified']
+        return headers
+
+    def put_data(self, url, data, headers):
+        """
+        Store a downloaded picture, dropping what was rendered from the old one
+        :param url:
+        :param data:
+        :param headers: response headers
+        :return:
+        """
+        with self._lock:
+            for key in [key for key in self.memory.keys() if key[0] == url]:
+                self.memory.pop(key)
+        prefix = os.path.basename(self._path(url, '-'))
+        directory = os.path.dirname(self._path(url, ''))
+        if os.path.isdir(directory):
+            for name in os.listdir(directory):
+                if name.startswith(prefix):
+                    self._remove(os.path.join(directory, name))
+
+        self._write(self._path(url, '.data'), data)
+        self._write_metadata(url, headers.get('ETag'), headers.get('Last-Modified'))
+        self._count('downloads')
+
+    def revalidated(self, url):
+        """
+        The server answered 304, the stored copy is good for another `max_age`
+        :param url:
+        :return:
+        """
+        metadata = self.metadata(url) or {}
+        self._write_metadata(url, metadata.get('etag'), metadata.get('last_modified'))
+        self._count('revalidations')
+
+    def _write_metadata(self, url, etag, last_modified):
+        metadata = {'etag': etag, 'last_modified': last_modified, 'fetched_at': time.time()}
+        self._write(self._path(url, '.json'), json.dumps(metadata).encode('utf-8'))
+
+    def put_rendered(self, url, width, rendered):
+        if rendered is None:
+            return
+        with self._lock:
+            self.memory.put((url, width), rendered)
+        value = json.dumps(encode_rendered(rendered)).encode('utf-8')
+        self._write(self._path(url, '-{}.json'.format(width)), value)
+
+    def _touch(self, path):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _remove(self, path):
+        try:
+            size = os.path.getsize(path)
+            os.unlink(path)
+        except OSError:
+            return
+        with self._disk_lock:
+            if self._disk_usage is not None:
+                self._disk_usage -= size
+
+    def _write(self, path, data):
+        try:
+            replaced = os.path.getsize(path)
+        except OSError:
+            replaced = 0
+        write_atomic(path, data)
+        with self._disk_lock:
+            if self._disk_usage is None:
+                self._disk_usage = sum(size for _, size, _ in self._entries())
+            else:
+                self._disk_usage += len(data) - replaced
+            if self._disk_usage > self.disk_size:
+                self._evict()
+
+    def _entries(self):
+        """
+        Files of the cache grouped by URL digest
+        :return: (last use, bytes, paths) of each picture
+        """
+        groups = {}
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                # Being written by another thread
+                if name.endswith('.tmp'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                used_at, size, paths = groups.get(name[:40], (0, 0, []))
+                paths.append(path)
+                groups[name[:40]] = (max(used_at, stat.st_mtime), size + stat.st_size, paths)
+        return list(groups.values())
+
+    def _evict(self):
+        entries = sorted(self._entries(), key=lambda entry: entry[0])
+        usage = sum(size for _, size, _ in entries)
+        for _, size, paths in entries:
+            if usage <= self.disk_size * DISK_LOW_WATER:
+                break
+            for path in paths:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+            usage -= size
+            self._count('evictions')
+        self._disk_usage = usage
+
+    def hit_rate(self):
+        with self._lock:
+            hits = self.stats['memory_hits'] + self.stats['disk_hits']
+            lookups = hits + self.stats['misses']
+        return hits / lookups if lookups else 0.0
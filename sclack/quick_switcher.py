@@ -1,16 +1,12 @@
+import threading
+
 import urwid
-import time
-import unicodedata
 from .store import Store
 from sclack.components import get_icon
+from sclack.utils.search import TitleIndex, normalize, remove_diacritic
 
-
-def remove_diacritic(input):
-    '''
-    Accept a unicode string, and return a normal string (bytes in Python 3)
-    without any diacritical marks.
-    '''
-    return unicodedata.normalize('NFKD', input).encode('ASCII', 'ignore').decode()
+# Below this, scanning every title is as fast as the trigram index
+TRIGRAM_MIN_ITEMS = 5000
 
 
 class QuickSwitcherItem(urwid.AttrMap):
@@ -28,9 +24,56 @@ class QuickSwitcherItem(urwid.AttrMap):
         )
 
 
+class QuickSwitcherWalker(urwid.ListWalker):
+    """
+    Walker over the positions of the matching items. Widgets are only built
+    when shown and are kept for the next filter passes
+    """
+    def __init__(self, items):
+        self.items = items
+        self.positions = list(range(len(items)))
+        self.focus = 0
+        self._widgets = {}
+
+    def set_positions(self, positions):
+        self.positions = positions
+        self.focus = 0
+        self._modified()
+
+    def widget_at(self, position):
+        index = self.positions[position]
+        widget = self._widgets.get(index)
+        if widget is None:
+            item = self.items[index]
+            widget = self._widgets[index] = QuickSwitcherItem(item['icon'], item['title'], item['id'])
+        return widget
+
+    def get_focus(self):
+        if not self.positions:
+            return None, None
+        return self.widget_at(self.focus), self.focus
+
+    def set_focus(self, position):
+        self.focus = position
+        self._modified()
+
+    def get_next(self, position):
+        if position + 1 >= len(self.positions):
+            return None, None
+        return self.widget_at(position + 1), position + 1
+
+    def get_prev(self, position):
+        if position <= 0:
+            return None, None
+        return self.widget_at(position - 1), position - 1
+
+    def __len__(self):
+        return len(self.positions)
+
+
 class QuickSwitcherList(urwid.ListBox):
     def __init__(self, items):
-        self.body = urwid.SimpleFocusListWalker(items)
+        self.body = QuickSwitcherWalker(items)
         super(QuickSwitcherList, self).__init__(self.body)
 
 
@@ -75,8 +118,12 @@ class QuickSwitcher(urwid.AttrWrap):
         lines.sort(key=lambda item: item['title'])
         self.header = urwid.Edit('')
         self.original_items = priority + lines
-        widgets = [QuickSwitcherItem(item['icon'], item['title'], item['id']) for item in self.original_items]
-        self.quick_switcher_list = QuickSwitcherList(widgets)
+        # Titles are normalized once, each keystroke only searches the index
+        self.index = TitleIndex([item['title'] for item in self.original_items])
+        if len(self.original_items) > TRIGRAM_MIN_ITEMS:
+            threading.Thread(target=self.index.build_trigrams, daemon=True).start()
+        self.last_search = None
+        self.quick_switcher_list = QuickSwitcherList(self.original_items)
         switcher = urwid.LineBox(
             urwid.Frame(self.quick_switcher_list, header=self.header),
             title='Jump to...',
@@ -90,41 +137,43 @@ class QuickSwitcher(urwid.AttrWrap):
             valign='middle',
             height=15
         )
-        self.last_keypress = (time.time() - 0.3, None)
         super(QuickSwitcher, self).__init__(overlay, 'quick_switcher_dialog')
 
     @property
     def filtered_items(self):
-        return self.original_items
-
-    @filtered_items.setter
-    def filtered_items(self, items):
-        self.quick_switcher_list.body[:] = [
-            QuickSwitcherItem(item['icon'], item['title'], item['id'])
-            for item in items
-        ]
-
-    def set_filter(self, loop, data):
-        text = self.header.get_edit_text()
-        if len(text) > 0:
-            text = remove_diacritic(text)
-            if text[0] == '@':
-                self.filtered_items = [
-                    item for item in self.original_items
-                    if (item['type'] == 'user' and (text[1:].lower() in remove_diacritic(item['title'].lower()) or text[1:].strip() == ''))
-                ]
-            elif text[0] == '#':
-                self.filtered_items = [
-                    item for item in self.original_items
-                    if (item['type'] == 'channel' and (text[1:].lower() in remove_diacritic(item['title'].lower()) or text[1:].strip() == ''))
-                ]
-            else:
-                self.filtered_items = [
-                    item for item in self.original_items
-                    if text.lower() in remove_diacritic(item['title'].lower())
-                ]
+        return [self.original_items[position] for position in self.quick_switcher_list.body.positions]
+
+    def search(self, text):
+        """
+        Positions of the items matching the filter. `@` only matches users and
+        `#` channels. When the query grows, only the previous matches are checked
+        :param text:
+        :return:
+        """
+        text = normalize(text)
+        item_type = None
+        query = text
+        if text[:1] == '@':
+            item_type, query = 'user', text[1:]
+        elif text[:1] == '#':
+            item_type, query = 'channel', text[1:]
+        if not query.strip():
+            query = ''
+
+        if self.last_search is not None and self.last_search[0] == item_type and self.last_search[1] in query:
+            positions = self.index.search(query, self.last_search[2])
         else:
-            self.filtered_items = self.original_items
+            positions = self.index.search(query)
+            if item_type is not None:
+                positions = [
+                    position for position in positions
+                    if self.original_items[position]['type'] == item_type
+                ]
+        self.last_search = (item_type, query, positions)
+        return positions
+
+    def set_filter(self, *args):
+        self.quick_switcher_list.body.set_positions(self.search(self.header.get_edit_text()))
 
     def keypress(self, size, key):
         reserved_keys = ('up', 'down', 'esc', 'page up', 'page down')
@@ -136,7 +185,4 @@ class QuickSwitcher(urwid.AttrWrap):
                 urwid.emit_signal(self, 'go_to_channel', focus[0].id)
                 return True
         self.header.keypress((size[0],), key)
-        now = time.time()
-        if now - self.last_keypress[0] < 0.3 and self.last_keypress[1] is not None:
-            self.event_loop.remove_alarm(self.last_keypress[1])
-        self.last_keypress = (now, self.event_loop.set_alarm_in(0.3, self.set_filter))
+        self.set_filter()
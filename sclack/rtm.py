@@ -0,0 +1,198 @@
+import asyncio
+import functools
+import json
+import ssl
+import time
+
+from websocket import WebSocketConnectionClosedException
+
+RECONNECTED_EVENT = 'sclack_reconnected'
+CAUGHT_UP_EVENT = 'sclack_caught_up'
+# Set on the message events rebuilt from the history after a reconnection
+CATCH_UP_KEY = 'sclack_catch_up'
+# Queued to wake up the reader when the connection couldn't be restored
+_FAILED = object()
+RECONNECT_ATTEMPTS = 5
+DEFAULT_RECONNECT_BACKOFF = 1
+MAX_RECONNECT_BACKOFF = 30
+
+
+class RealTimeReader:
+    """
+    Watch the RTM websocket with the event loop instead of polling it.
+    Frames are parsed and put on `queue` as soon as the socket is readable,
+    a quiet workspace doesn't cause any wakeup of its own. When the
+    connection is lost it is restored in the executor, a few times with an
+    exponential backoff. If that fails too the error is raised by `read`
+    """
+    def __init__(self, slack, loop, metrics, executor=None,
+                 reconnect_backoff=DEFAULT_RECONNECT_BACKOFF):
+        self.slack = slack
+        self.loop = loop
+        self.metrics = metrics
+        self.executor = executor
+        self.reconnect_backoff = reconnect_backoff
+        self.queue = asyncio.Queue()
+        self._fd = None
+        self._closed = False
+        self._reconnecting = None
+        self._error = None
+        self._rate_window = (time.time(), 0)
+
+    @property
+    def server(self):
+        return self.slack.server
+
+    @asyncio.coroutine
+    def connect(self):
+        connected = yield from self.loop.run_in_executor(
+            self.executor,
+            functools.partial(self.slack.rtm_connect, auto_reconnect=True)
+        )
+        if connected and not self._closed:
+            self._watch()
+        return connected
+
+    @asyncio.coroutine
+    def read(self):
+        """
+        Wait for the next event and return it along with every other event
+        already queued
+        :return:
+        """
+        if self._error is not None:
+            raise self._error
+        events = [(yield from self.queue.get())]
+        while not self.queue.empty():
+            events.append(self.queue.get_nowait())
+        self.metrics.gauge('rtm.queue_depth', 0)
+        # Events received before the failure are handled first
+        events = [event for event in events if event is not _FAILED]
+        if not events:
+            raise self._error
+        return events
+
+    def put(self, events):
+        """
+        Queue events that didn't come from the websocket, they are read with the others
+        :param events:
+        :return:
+        """
+        for event in events:
+            self.queue.put_nowait(event)
+
+    @asyncio.coroutine
+    def catch_up(self, missed_events):
+        """
+        Queue the events missed while the connection was down as if they had
+        just been received, then CAUGHT_UP_EVENT. That one is queued even when
+        they couldn't be loaded, the reader stops waiting for them
+        :param missed_events: awaitable returning the missed events
+        :return:
+        """
+        events = []
+        try:
+            events = yield from missed_events
+        finally:
+            self.metrics.incr('rtm.caught_up_messages', len(events))
+            self.put([dict(event, **{CATCH_UP_KEY: True}) for event in events])
+            self.put([{'type': CAUGHT_UP_EVENT}])
+
+    def close(self):
+        self._closed = True
+        if self._reconnecting is not None:
+            self._reconnecting.cancel()
+        self._unwatch()
+        websocket = self.server.websocket
+        if websocket is not None:
+            websocket.shutdown()
+        self.server.connected = False
+
+    def _watch(self):
+        self._fd = self.server.websocket.fileno()
+        self.loop.add_reader(self._fd, self._on_readable)
+        # Frames may have arrived between the handshake and the registration
+        self._on_readable()
+
+    def _unwatch(self):
+        if self._fd is not None:
+            self.loop.remove_reader(self._fd)
+            self._fd = None
+
+    def _on_readable(self):
+        # Drain everything, decrypted SSL data may be pending without the
+        # socket being readable again
+        while self._fd is not None:
+            try:
+                frame = self.server.websocket.recv()
+            except (ssl.SSLWantReadError, BlockingIOError):
+                return
+            except (WebSocketConnectionClosedException, OSError):
+                self._unwatch()
+                self.server.connected = False
+                if self.server.auto_reconnect and not self._closed:
+                    self._reconnecting = self.loop.create_task(self._reconnect())
+                    self._reconnecting.add_done_callback(self._reconnected)
+                return
+
+            if frame:
+                self._put_frame(frame)
+
+    def _put_frame(self, frame):
+        for line in frame.split('\n'):
+            if not line:
+                continue
+            event = json.loads(line)
+            self.slack.process_changes(event)
+            self.queue.put_nowait(event)
+            self.metrics.incr('rtm.events')
+        self.metrics.incr('rtm.frames')
+        self.metrics.gauge('rtm.queue_depth', self.queue.qsize())
+        self.metrics.gauge(
+            'rtm.queue_depth_max',
+            max(self.queue.qsize(), self.metrics.get('rtm.queue_depth_max'))
+        )
+        self._update_frame_rate()
+
+    def _update_frame_rate(self):
+        started_at, frames = self._rate_window
+        frames = frames + 1
+        elapsed = time.time() - started_at
+        if elapsed >= 1:
+            self.metrics.gauge('rtm.frames_per_second', frames / elapsed)
+            self._rate_window = (time.time(), 0)
+        else:
+            self._rate_window = (started_at, frames)
+
+    @asyncio.coroutine
+    def _reconnect(self):
+        lost = self.server.websocket
+        for attempt in range(RECONNECT_ATTEMPTS):
+            if attempt:
+                self.metrics.incr('rtm.reconnect_retries')
+                yield from asyncio.sleep(
+                    min(self.reconnect_backoff * 2 ** (attempt - 1), MAX_RECONNECT_BACKOFF)
+                )
+            yield from self.loop.run_in_executor(
+                self.executor,
+                functools.partial(self.server.rtm_connect, reconnect=True)
+            )
+            if self._closed:
+                return
+            # Failures to open the websocket aren't always raised, the old
+            # socket must not be watched again
+            if self.server.connected and self.server.websocket not in (None, lost):
+                break
+        else:
+            raise ConnectionError('The real time connection could not be restored')
+        self.metrics.incr('rtm.reconnects')
+        self.queue.put_nowait({'type': RECONNECTED_EVENT})
+        self._watch()
+
+    def _reconnected(self, task):
+        self._reconnecting = None
+        if task.cancelled() or task.exception() is None:
+            return
+        self.metrics.incr('rtm.reconnect_failures')
+        self._error = task.exception()
+        self.queue.put_nowait(_FAILED)
@@ -0,0 +1,173 @@
+import concurrent.futures
+import threading
+import time
+
+DEFAULT_API_WORKERS = 8
+DEFAULT_INTERACTIVE_WORKERS = 2
+DEFAULT_DOWNLOAD_WORKERS = 4
+DEFAULT_RENDER_WORKERS = 2
+
+
+class MeteredExecutor(concurrent.futures.Executor):
+    """
+    Executor reporting how many tasks wait for a worker and for how long,
+    under `pools.<name>.*`. Only thread pools can tell when a task starts,
+    process pools report the time until the task is done instead. Tasks not
+    done yet are kept, so shutting down can cancel the ones still queued
+    """
+    def __init__(self, name, executor, metrics):
+        self.name = name
+        self.executor = executor
+        self.metrics = metrics
+        self.measures_start = isinstance(executor, concurrent.futures.ThreadPoolExecutor)
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._pending = set()
+
+    def _metric(self, name):
+        return 'pools.{}.{}'.format(self.name, name)
+
+    def _update_depth(self, change):
+        with self._lock:
+            self._waiting += change
+            depth = self._waiting
+        self.metrics.gauge(self._metric('queue_depth'), depth)
+        if depth > self.metrics.get(self._metric('queue_depth_max')):
+            self.metrics.gauge(self._metric('queue_depth_max'), depth)
+
+    def _record_wait(self, submitted_at):
+        wait = time.time() - submitted_at
+        self.metrics.incr(self._metric('wait_seconds'), wait)
+        if wait > self.metrics.get(self._metric('wait_seconds_max')):
+            self.metrics.gauge(self._metric('wait_seconds_max'), wait)
+
+    def submit(self, fn, *args, **kwargs):
+        submitted_at = time.time()
+        self.metrics.incr(self._metric('tasks'))
+        self._update_depth(1)
+
+        if self.measures_start:
+            def run():
+                self._update_depth(-1)
+                self._record_wait(submitted_at)
+                return fn(*args, **kwargs)
+
+            def cancelled(future):
+                if future.cancelled():
+                    self._update_depth(-1)
+            future = self.executor.submit(run)
+            future.add_done_callback(cancelled)
+        else:
+            def done(future):
+                self._update_depth(-1)
+                self._record_wait(submitted_at)
+            future = self.executor.submit(fn, *args, **kwargs)
+            future.add_done_callback(done)
+
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._discard)
+        return future
+
+    def _discard(self, future):
+        with self._lock:
+            self._pending.discard(future)
+
+    def shutdown(self, wait=True):
+        """
+        :param wait: whether to wait for the running tasks, the queued ones
+            are cancelled either way
+        :return:
+        """
+        with self._lock:
+            pending = list(self._pending)
+        for future in pending:
+            future.cancel()
+        self.executor.shutdown(wait=wait)
+
+
+def parallel_map(executor, function, items, workers):
+    """
+    Call `function` on every item with up to `workers` threads, the calling
+    thread being one of them. It only waits for the workers that started, so
+    it can't deadlock when called from a busy worker of the same pool
+    :param executor:
+    :param function:
+    :param items:
+    :param workers:
+    :return: the results in the order of the items
+    """
+    items = list(items)
+    results = [None] * len(items)
+    indexes = iter(range(len(items)))
+    lock = threading.Lock()
+
+    def work():
+        while True:
+            with lock:
+                index = next(indexes, None)
+            if index is None:
+                return
+            results[index] = function(items[index])
+
+    helpers = []
+    if executor is not None:
+        helpers = [executor.submit(work) for _ in range(min(workers, len(items)) - 1)]
+    try:
+        work()
+    finally:
+        for helper in helpers:
+            if not helper.cancel():
+                helper.result()
+    return results
+
+
+class Scheduler:
+    """
+    Application-wide worker pools: `api` for Web API requests, `interactive`
+    for the requests of the user such as sending a message, `download` for
+    pictures and `render` for the CPU-bound picture rendering. Requests wait
+    in their worker while their rate limit tier is paused, a separate pool
+    keeps the ones of the user from queuing behind background requests
+    """
+    def __init__(self, config, metrics):
+        workers = config.get('workers', {})
+        self.api = MeteredExecutor(
+            'api',
+            concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers.get('api', DEFAULT_API_WORKERS)
+            ),
+            metrics
+        )
+        self.interactive = MeteredExecutor(
+            'interactive',
+            concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers.get('interactive', DEFAULT_INTERACTIVE_WORKERS)
+            ),
+            metrics
+        )
+        self.download = MeteredExecutor(
+            'download',
+            concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers.get('download', DEFAULT_DOWNLOAD_WORKERS)
+            ),
+            metrics
+        )
+        # Processes are only forked on the first picture
+        self.render = MeteredExecutor(
+            'render',
+            concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers.get('render', DEFAULT_RENDER_WORKERS)
+            ),
+            metrics
+        )
+
+    def shutdown(self):
+        """
+        Stop every pool without waiting, the application is leaving. Queued
+        tasks are cancelled, running ones are left to finish, so the API
+        dispatcher is closed first for none to wait for a rate limit
+        :return:
+        """
+        for pool in (self.api, self.interactive, self.download, self.render):
+            pool.shutdown(wait=False)
@@ -0,0 +1,56 @@
+import hashlib
+import json
+import os
+import tempfile
+
+SNAPSHOT_VERSION = 1
+
+
+class Snapshot:
+    """
+    Versioned on-disk copy of the workspace data needed to paint the sidebar
+    """
+    def __init__(self, directory, token):
+        # Never write the token itself to the disk, only its digest
+        workspace_key = hashlib.sha1(token.encode('utf-8')).hexdigest()
+        self.directory = os.path.join(os.path.expanduser(directory), workspace_key)
+        self.path = os.path.join(self.directory, 'snapshot.json')
+
+    def load(self):
+        """
+        Read the snapshot, returning None when it is missing, corrupted or outdated
+        :return:
+        """
+        try:
+            with open(self.path, 'r') as snapshot_file:
+                data = json.load(snapshot_file)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get('version') != SNAPSHOT_VERSION:
+            return None
+
+        return data
+
+    def save(self, data):
+        """
+        Atomically replace the snapshot so a crash never leaves a partial file
+        :param data:
+        :return:
+        """
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        data = dict(data, version=SNAPSHOT_VERSION)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as temp_file:
+                json.dump(data, temp_file)
+            os.replace(temp_path, self.path)
+        except Exception:
+            os.unlink(temp_path)
+            raise
+
+    def clear(self):
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
@@ -1,5 +1,42 @@
+import collections
+import functools
+import itertools
+import os
+
 from slackclient import SlackClient
 
+from .coalescer import DEFAULT_CACHE_TTL, RequestCoalescer
+from .dispatcher import ApiDispatcher, BACKGROUND
+from .emoji import emoji_codemap
+from .history import DEFAULT_HISTORY_MESSAGES, HistoryCache
+from .metrics import Metrics
+from .picture_cache import DEFAULT_DISK_SIZE, DEFAULT_MAX_AGE, DEFAULT_MEMORY_SIZE, PictureCache
+from .scheduler import parallel_map
+from .snapshot import Snapshot
+from .transport import DEFAULT_POOL_SIZE, SessionSlackRequest, create_session
+from .utils.pagination import iter_cursor_pages, prefetch
+
+DEFAULT_CACHE_DIRECTORY = '~/.cache/sclack'
+DEFAULT_PAGE_SIZE = 200
+DEFAULT_PREFETCH_PAGES = 1
+DEFAULT_MAX_MEMBER_PAGES = 5
+DEFAULT_INFO_WORKERS = 8
+DEFAULT_CATCH_UP_PAGES = 5
+
+# Shared by every store, so two workspaces never get the same users version
+_users_versions = itertools.count(1)
+
+# Messages that never count as unread
+UNCOUNTED_SUBTYPES = (
+    'message_changed',
+    'message_deleted',
+    'message_replied',
+    'channel_join',
+    'channel_leave',
+    'group_join',
+    'group_leave',
+)
+
 
 class State:
     def __init__(self):
@@ -19,12 +56,10 @@ class State:
         self.did_render_new_messages = False
         self.online_users = set()
         self.is_snoozed = False
-
-
-class Cache:
-    def __init__(self):
-        self.avatar = {}
-        self.picture = {}
+        self.last_seen_ts = {}
+        self.unread_counts = {}
+        # Lists that couldn't be loaded entirely, the snapshot isn't saved while some are
+        self.failed_loads = set()
 
 
 class Store:
@@ -32,17 +67,191 @@ class Store:
         self.workspaces = workspaces
         slack_token = workspaces[0][1]
         self.slack_token = slack_token
+        self.config = config
+        api_config = config.get('api', {})
+        self.session = create_session(
+            pool_size=api_config.get('connections', DEFAULT_POOL_SIZE),
+            compression=api_config.get('compression', True)
+        )
         self.slack = SlackClient(slack_token)
+        self.slack.server.api_requester = SessionSlackRequest(self.session)
         self.state = State()
-        self.cache = Cache()
-        self.config = config
+        self._users_dict = {}
+        self.users_version = next(_users_versions)
+        self.snapshot = self.create_snapshot()
+        self.pictures = self.create_picture_cache()
+        self.history = self.create_history()
+        self.metrics = Metrics()
+        # Pool running the parallel requests, such as prefetched pages. Set
+        # by the application, without it they are sent one after the other
+        self.executor = None
+        self.dispatcher = self.create_dispatcher()
+        self.coalescer = self.create_coalescer()
+
+    def api_call(self, method, priority=None, **kwargs):
+        """
+        Every Web API request of the store goes through here
+        :param method:
+        :param priority: INTERACTIVE, VIEWPORT or BACKGROUND, defaults to the one of the method
+        :param kwargs:
+        :return:
+        """
+        send = functools.partial(self.send_request, priority=priority)
+        if self.coalescer is None:
+            return send(method, **kwargs)
+        return self.coalescer.call(send, method, **kwargs)
+
+    def send_request(self, method, priority=None, **kwargs):
+        if self.dispatcher is None:
+            return self.post_request(method, **kwargs)
+        return self.dispatcher.call(method, priority=priority, **kwargs)
+
+    def post_request(self, method, **kwargs):
+        """
+        Requests actually sent to Slack are counted here, the ones answered
+        by the coalescer are counted as `api.saved_calls` instead
+        :param method:
+        :param kwargs:
+        :return:
+        """
+        self.metrics.incr('api.calls')
+        self.metrics.incr('api.calls.{}'.format(method))
+        return self.slack.api_call(method, **kwargs)
+
+    def create_dispatcher(self):
+        """
+        Rate limits are counted per workspace token
+        :return:
+        """
+        if not self.config.get('api', {}).get('rate_limit', True):
+            return None
+        return ApiDispatcher(self.post_request, self.metrics)
+
+    def create_coalescer(self):
+        ttl = self.config.get('api', {}).get('cache_ttl', DEFAULT_CACHE_TTL)
+        return RequestCoalescer(self.metrics, ttl=ttl)
+
+    def create_snapshot(self):
+        cache_config = self.config.get('cache', {})
+        if not cache_config.get('snapshot', False):
+            return None
+        return Snapshot(cache_config.get('directory', DEFAULT_CACHE_DIRECTORY), self.slack_token)
+
+    def create_picture_cache(self):
+        """
+        Private files are downloaded with the workspace token, so every
+        workspace has its own pictures
+        :return:
+        """
+        cache_config = self.config.get('cache', {})
+        if not cache_config.get('pictures', False):
+            return None
+        return PictureCache(
+            cache_config.get('directory', DEFAULT_CACHE_DIRECTORY),
+            self.slack_token,
+            memory_size=cache_config.get('picture_memory_size', DEFAULT_MEMORY_SIZE),
+            max_age=cache_config.get('picture_max_age', DEFAULT_MAX_AGE),
+            disk_size=cache_config.get('picture_disk_size', DEFAULT_DISK_SIZE)
+        )
+
+    def create_history(self):
+        max_messages = self.config.get('cache', {}).get('history_messages', DEFAULT_HISTORY_MESSAGES)
+        return HistoryCache(max_messages)
 
     def switch_to_workspace(self, workspace_number):
         self.slack_token = self.workspaces[workspace_number - 1][1]
         self.slack.token = self.slack_token
         self.slack.server.token = self.slack_token
         self.state = State()
-        self.cache = Cache()
+        self._users_dict = {}
+        self.users_version = next(_users_versions)
+        self.snapshot = self.create_snapshot()
+        self.pictures = self.create_picture_cache()
+        self.history = self.create_history()
+        self.dispatcher = self.create_dispatcher()
+        self.coalescer = self.create_coalescer()
+        emoji_codemap.set_custom({})
+
+    def load_snapshot(self):
+        """
+        Fill the state from the on-disk snapshot of this workspace
+        :return: whether a usable snapshot was found
+        """
+        if self.snapshot is None:
+            return False
+
+        data = self.snapshot.load()
+        if data is None:
+            return False
+
+        try:
+            self.state.auth = data['auth']
+            self.state.channels = data['channels']
+            self.state.dms = data['dms']
+            self.state.stars = data['stars']
+            self.state.bots = data['bots']
+            self.state.last_seen_ts = data['last_seen_ts']
+            self.state.users = data['users']
+        except KeyError:
+            return False
+        self.index_users()
+
+        return True
+
+    def save_snapshot(self):
+        if self.snapshot is None or not getattr(self.state, 'auth', None) or self.state.failed_loads:
+            return
+
+        try:
+            self.snapshot.save({
+                'auth': self.state.auth,
+                'channels': self.state.channels,
+                'dms': self.state.dms,
+                'stars': self.state.stars,
+                'bots': self.state.bots,
+                'last_seen_ts': self.state.last_seen_ts,
+                'users': self.state.users,
+            })
+        except OSError:
+            pass
+
+    def save_metrics(self):
+        metrics_file = self.config.get('metrics', {}).get('file')
+        if not metrics_file:
+            return
+
+        try:
+            self.metrics.save(os.path.expanduser(metrics_file))
+        except OSError:
+            pass
+
+    def sidebar_signature(self):
+        """
+        Everything the sidebar is built from, used to tell whether a reconciled
+        state needs the sidebar to be rendered again
+        :return:
+        """
+        auth = getattr(self.state, 'auth', None) or {}
+        return (
+            auth.get('user_id'),
+            auth.get('team'),
+            tuple((channel['id'], channel['name'], channel.get('is_private')) for channel in self.state.channels),
+            tuple(
+                (dm['id'], dm['user'], self.get_user_display_name(self.find_user_by_id(dm['user'])))
+                for dm in self.state.dms
+            ),
+            tuple(star.get('channel') for star in self.state.stars),
+        )
+
+    def set_last_seen_ts(self, channel_id, ts):
+        """
+        Remember the newest message timestamp seen for a channel
+        :param channel_id:
+        :param ts:
+        :return:
+        """
+        if channel_id and ts and float(ts) > float(self.state.last_seen_ts.get(channel_id, '0')):
+            self.state.last_seen_ts[channel_id] = ts
 
     def find_user_by_id(self, user_id):
         return self._users_dict.get(user_id)
@@ -60,26 +269,92 @@ class Store:
         return user_detail.get('display_name') or user_detail.get('real_name') or user_detail['name']
 
     def load_auth(self):
-        self.state.auth = self.slack.api_call('auth.test')
+        self.state.auth = self.api_call('auth.test')
 
     def find_or_load_bot(self, bot_id):
         if bot_id in self.state.bots:
             return self.state.bots[bot_id]
-        request = self.slack.api_call('bots.info', bot=bot_id)
+        request = self.api_call('bots.info', bot=bot_id)
         if request['ok']:
             self.state.bots[bot_id] = request['bot']
             return self.state.bots[bot_id]
 
+    def find_unknown_bots(self, messages):
+        """
+        Bots of messages that rendering would have to ask Slack about
+        :param messages:
+        :return: set of bot ids
+        """
+        return {
+            message['bot_id'] for message in messages
+            if message.get('subtype') == 'bot_message' and message.get('bot_id')
+            and message['bot_id'] not in self.state.bots
+            and self.find_user_by_id(message['bot_id']) is None
+        }
+
+    def load_bots(self, messages):
+        """
+        Load the unknown bots of messages, so rendering them doesn't wait for Slack
+        :param messages:
+        :return:
+        """
+        for bot_id in self.find_unknown_bots(messages):
+            self.find_or_load_bot(bot_id)
+
     def load_messages(self, channel_id):
-        history = self.slack.api_call(
+        self.set_messages(channel_id, self.fetch_messages(channel_id))
+
+    def fetch_messages(self, channel_id):
+        return self.api_call(
             'conversations.history',
             channel=channel_id
         )
+
+    def set_messages(self, channel_id, history):
         self.state.messages = history['messages']
         self.state.has_more = history.get('has_more', False)
         self.state.is_limited = history.get('is_limited', False)
         self.state.pin_count = history['pin_count']
         self.state.messages.reverse()
+        if self.state.messages:
+            self.set_last_seen_ts(channel_id, self.state.messages[-1]['ts'])
+
+    def load_newer_messages(self, channel_id, oldest):
+        """
+        Messages posted after `oldest`, to catch up a channel shown from the history cache
+        :param channel_id:
+        :param oldest: ts of the newest message already shown
+        :return: the messages, oldest first, or None when more than a page was missed
+        """
+        history = self.api_call(
+            'conversations.history',
+            channel=channel_id,
+            oldest=oldest,
+            limit=self.config.get('api', {}).get('page_size', DEFAULT_PAGE_SIZE)
+        )
+        if not history.get('ok', False) or history.get('has_more', False):
+            return None
+        messages = list(reversed(history['messages']))
+        if messages:
+            self.set_last_seen_ts(channel_id, messages[-1]['ts'])
+        return messages
+
+    def load_older_messages(self, channel_id, latest):
+        """
+        The page of messages posted before `latest`
+        :param channel_id:
+        :param latest: ts of the oldest message already shown
+        :return: the messages, oldest first, and whether there are older ones
+        """
+        history = self.api_call(
+            'conversations.history',
+            channel=channel_id,
+            latest=latest,
+            limit=self.config.get('api', {}).get('page_size', DEFAULT_PAGE_SIZE)
+        )
+        if not history.get('ok', False):
+            return [], True
+        return list(reversed(history['messages'])), history.get('has_more', False)
 
     def is_valid_channel_id(self, channel_id):
         """
@@ -113,59 +388,251 @@ class Store:
         """
         return channel_id[0] == 'G'
 
-    def get_channel_info(self, channel_id):
+    def get_channel_info(self, channel_id, priority=None):
         if channel_id[0] in ('C', 'G'):
-            return self.slack.api_call('conversations.info', channel=channel_id)['channel']
+            return self.api_call('conversations.info', priority=priority, channel=channel_id)['channel']
         elif channel_id[0] == 'D':
-            return self.slack.api_call('im.info', channel=channel_id)['channel']
+            return self.api_call('im.info', priority=priority, channel=channel_id)['channel']
+
+    def paginate(self, method, page_size=None, **kwargs):
+        """
+        Generator over the response pages of a cursor-paginated method. The
+        next pages keep downloading while the caller handles the current one
+        :param method:
+        :param page_size:
+        :param kwargs:
+        :return:
+        """
+        api_config = self.config.get('api', {})
+        pages = iter_cursor_pages(
+            self.api_call,
+            method,
+            page_size or api_config.get('page_size', DEFAULT_PAGE_SIZE),
+            **kwargs
+        )
+        return prefetch(pages, api_config.get('prefetch_pages', DEFAULT_PREFETCH_PAGES), self.executor)
+
+    def get_channels_info(self, channel_ids):
+        """
+        Info of many channels at once, deduplicated and fetched by up to
+        `api.info_workers` threads of the executor
+        :param channel_ids:
+        :return: dict of channel id to channel info, failed ones are left out
+        """
+        channel_ids = list(collections.OrderedDict.fromkeys(channel_ids))
+        if not channel_ids:
+            return {}
+
+        def get_info(channel_id):
+            try:
+                return self.get_channel_info(channel_id, priority=BACKGROUND)
+            except KeyError:
+                return None
+
+        workers = self.config.get('api', {}).get('info_workers', DEFAULT_INFO_WORKERS)
+        infos = parallel_map(self.executor, get_info, channel_ids, workers)
+        return {
+            channel_id: info
+            for channel_id, info in zip(channel_ids, infos)
+            if info is not None
+        }
+
+    def load_unread_counts(self, channel_ids):
+        """
+        Unread counts of every channel, group and DM using the bulk `users.counts`
+        method. Conversations missing from it fall back to `get_channels_info`
+        :param channel_ids:
+        :return: dict of channel id to unread_count_display
+        """
+        counts = self.fetch_unread_counts()
+        missing = [channel_id for channel_id in channel_ids if channel_id not in counts]
+        for channel_id, info in self.get_channels_info(missing).items():
+            counts[channel_id] = info.get('unread_count_display', 0)
+
+        self.state.unread_counts.update(counts)
+        return counts
+
+    def fetch_unread_counts(self):
+        """
+        Unread counts from the bulk `users.counts` method, the state is left as it is
+        :return: dict of channel id to unread_count_display, empty when it failed
+        """
+        counts = {}
+        response = self.api_call(
+            'users.counts',
+            simple_unreads=True,
+            mpim_aware=True,
+            only_relevant_ims=True
+        )
+        if response.get('ok', False):
+            for key in ('channels', 'groups', 'ims', 'mpims'):
+                for item in response.get(key, []):
+                    counts[item['id']] = item.get('unread_count_display', item.get('unread_count', 0))
+        return counts
+
+    def load_changed_unread_counts(self):
+        """
+        Unread counts that changed while the real time connection was down
+        :return: dict of channel id to the count given by Slack
+        """
+        return {
+            channel_id: count
+            for channel_id, count in self.fetch_unread_counts().items()
+            if count != self.state.unread_counts.get(channel_id, 0)
+        }
+
+    def load_missed_messages(self, channel_id, oldest):
+        """
+        Messages of a channel posted after `oldest`, up to `api.catch_up_pages`
+        pages, shaped as the real time events that were missed
+        :param channel_id:
+        :param oldest: newest ts seen before the connection was lost
+        :return: (events oldest first, False when older messages were left out)
+        """
+        max_pages = self.config.get('api', {}).get('catch_up_pages', DEFAULT_CATCH_UP_PAGES)
+        messages = []
+        complete = True
+        pages = self.paginate('conversations.history', channel=channel_id, oldest=oldest)
+        for index, response in enumerate(pages):
+            if not response.get('ok', False):
+                pages.close()
+                complete = False
+                break
+            messages.extend(response.get('messages', []))
+            if response.get('has_more', False) and index + 1 >= max_pages:
+                pages.close()
+                complete = False
+                break
+
+        messages.sort(key=lambda message: float(message['ts']))
+        return [dict(message, type='message', channel=channel_id) for message in messages], complete
+
+    def apply_unread_event(self, event):
+        """
+        Keep the unread counts up to date from RTM events, without asking the API
+        :param event:
+        :return: id of the channel whose count was updated, or None
+        """
+        channel_id = event.get('channel')
+        if not channel_id:
+            return None
+
+        if event.get('type') in ('channel_marked', 'group_marked', 'im_marked', 'mpim_marked'):
+            self.state.unread_counts[channel_id] = event.get('unread_count_display', 0)
+            return channel_id
+
+        if event.get('type') != 'message' or event.get('hidden', False):
+            return None
+        if event.get('subtype') in UNCOUNTED_SUBTYPES:
+            return None
+        # Thread replies only count when they are also sent to the channel
+        thread_ts = event.get('thread_ts')
+        if thread_ts and thread_ts != event.get('ts') and event.get('subtype') != 'thread_broadcast':
+            return None
+
+        auth = getattr(self.state, 'auth', None) or {}
+        if event.get('user') == auth.get('user_id'):
+            # Writing to a conversation reads it
+            self.state.unread_counts[channel_id] = 0
+        else:
+            self.state.unread_counts[channel_id] = self.state.unread_counts.get(channel_id, 0) + 1
+        return channel_id
 
     def get_channel_members(self, channel_id):
-        return self.slack.api_call('conversations.members', channel=channel_id)
+        """
+        Members of a channel, following the cursor up to `api.max_member_pages`
+        pages. When there are more, `response_metadata.next_cursor` is kept
+        :param channel_id:
+        :return:
+        """
+        max_pages = self.config.get('api', {}).get('max_member_pages', DEFAULT_MAX_MEMBER_PAGES)
+        members = []
+        response = {}
+        pages = self.paginate('conversations.members', channel=channel_id)
+        for index, response in enumerate(pages):
+            members.extend(response.get('members', []))
+            if index + 1 >= max_pages:
+                pages.close()
+                break
+        return dict(response, members=members)
 
     def mark_read(self, channel_id, ts):
         if self.is_group(channel_id):
-            return self.slack.api_call('groups.mark', channel=channel_id, ts=ts)
+            return self.api_call('groups.mark', channel=channel_id, ts=ts)
         elif self.is_channel(channel_id):
-            return self.slack.api_call('channels.mark', channel=channel_id, ts=ts)
+            return self.api_call('channels.mark', channel=channel_id, ts=ts)
         elif self.is_dm(channel_id):
-            return self.slack.api_call('im.mark', channel=channel_id, ts=ts)
+            return self.api_call('im.mark', channel=channel_id, ts=ts)
 
     def get_permalink(self, channel_id, ts):
         # https://api.slack.com/methods/chat.getPermalink
-        return self.slack.api_call('chat.getPermalink', channel=channel_id, message_ts=ts)
+        return self.api_call('chat.getPermalink', channel=channel_id, message_ts=ts)
 
     def set_snooze(self, snoozed_time):
-        return self.slack.api_call('dnd.setSnooze', num_minutes=snoozed_time)
+        return self.api_call('dnd.setSnooze', num_minutes=snoozed_time)
 
     def load_channel(self, channel_id):
         if channel_id[0] in ('C', 'G', 'D'):
-            self.state.channel = self.get_channel_info(channel_id)
-            self.state.members = self.get_channel_members(channel_id)
-            self.state.did_render_new_messages = self.state.channel.get('unread_count_display', 0) == 0
+            self.set_channel(*self.fetch_channel(channel_id))
 
-    def load_channels(self):
-        conversations = self.slack.api_call(
+    def fetch_channel(self, channel_id):
+        """
+        Info and members of a channel, the state is left as it is
+        :param channel_id:
+        :return: (channel, members)
+        """
+        return self.get_channel_info(channel_id), self.get_channel_members(channel_id)
+
+    def set_channel(self, channel, members):
+        self.state.channel = channel
+        self.state.members = members
+        self.state.did_render_new_messages = channel.get('unread_count_display', 0) == 0
+
+    def iter_channels(self, on_page=None):
+        """
+        Load channels and DMs page by page. The state is only replaced once
+        every page arrived, a failed page leaves the previous lists as they are
+        :param on_page: called after each page with the channels and DMs loaded so far
+        :return:
+        """
+        channels = []
+        dms = []
+        pages = self.paginate(
             'users.conversations',
             exclude_archived=True,
-            limit=1000,  # 1k is max limit
             types='public_channel,private_channel,im'
-        )['channels']
-
-        for channel in conversations:
-            # Public channel
-            if channel.get('is_channel', False):
-                self.state.channels.append(channel)
-            # Private channel
-            elif channel.get('is_group', False):
-                self.state.channels.append(channel)
-            # Direct message
-            elif channel.get('is_im', False) and not channel.get('is_user_deleted', False):
-                self.state.dms.append(channel)
-        self.state.channels.sort(key=lambda channel: channel['name'])
-        self.state.dms.sort(key=lambda dm: dm['created'])
+        )
+        for page in pages:
+            if not page.get('ok', False):
+                pages.close()
+                self.state.failed_loads.add('channels')
+                return
+            for channel in page.get('channels', []):
+                # Public channel
+                if channel.get('is_channel', False):
+                    channels.append(channel)
+                # Private channel
+                elif channel.get('is_group', False):
+                    channels.append(channel)
+                # Direct message
+                elif channel.get('is_im', False) and not channel.get('is_user_deleted', False):
+                    dms.append(channel)
+            channels.sort(key=lambda channel: channel['name'])
+            dms.sort(key=lambda dm: dm['created'])
+            if on_page is not None:
+                on_page(list(channels), list(dms))
+            yield page
+
+        self.state.channels = channels
+        self.state.dms = dms
+        self.state.failed_loads.discard('channels')
+
+    def load_channels(self, on_page=None):
+        for _ in self.iter_channels(on_page):
+            pass
 
     def load_groups(self):
-        self.state.groups = filter(lambda c: c['is_group'] is True, self.slack.api_call('conversations.list'))
+        self.state.groups = filter(lambda c: c['is_group'] is True, self.api_call('conversations.list'))
 
     def load_stars(self):
         """
@@ -174,32 +641,79 @@ class Store:
         """
         self.state.stars = list(filter(
             lambda star: star.get('type', '') in ('channel', 'im', 'group',),
-            self.slack.api_call('stars.list')['items']
+            self.api_call('stars.list')['items']
         ))
 
-    def load_users(self):
-        self.state.users = list(filter(
-            lambda user: not user.get('deleted', False),
-            self.slack.api_call('users.list')['members']
-        ))
-        self._users_dict = {}
-        self._bots_dict = {}
-        for user in self.state.users:
+    def iter_users(self, on_page=None):
+        """
+        Load users page by page. Each page is indexed as soon as it arrives,
+        so lookups work before the whole directory is downloaded. The users
+        are only replaced once every page arrived
+        :param on_page: called after each page with the users loaded so far
+        :return:
+        """
+        users = []
+        pages = self.paginate('users.list')
+        for page in pages:
+            if not page.get('ok', False):
+                pages.close()
+                self.state.failed_loads.add('users')
+                return
+            page_users = list(filter(
+                lambda user: not user.get('deleted', False),
+                page.get('members', [])
+            ))
+            users.extend(page_users)
+            self._users_dict.update(self.build_users_index(page_users))
+            self.users_version = next(_users_versions)
+            if on_page is not None:
+                on_page(list(users))
+            yield page
+
+        # Drop users deleted since the previous load
+        self.state.users = users
+        self.index_users()
+        self.state.failed_loads.discard('users')
+
+    def load_users(self, on_page=None):
+        for _ in self.iter_users(on_page):
+            pass
+
+    def build_users_index(self, users):
+        users_dict = {}
+        for user in users:
             if user.get('is_bot', False):
-                self._users_dict[user['profile']['bot_id']] = user
-            self._users_dict[user['id']] = user
+                users_dict[user['profile']['bot_id']] = user
+            users_dict[user['id']] = user
+        return users_dict
+
+    def index_users(self):
+        """
+        Rebuild the users lookup. `users_version` changes with it, so anything
+        rendered from the previous users, such as mentions, can be told apart
+        :return:
+        """
+        self._users_dict = self.build_users_index(self.state.users)
+        self.users_version = next(_users_versions)
+
+    def load_custom_emoji(self):
+        if not self.config['features']['emoji']:
+            return
+        response = self.api_call('emoji.list')
+        if response.get('ok', False):
+            emoji_codemap.set_custom(response.get('emoji', {}))
 
     def load_user_dnd(self):
-        self.state.is_snoozed = self.slack.api_call('dnd.info').get('snooze_enabled')
+        self.state.is_snoozed = self.api_call('dnd.info').get('snooze_enabled')
 
     def set_topic(self, channel_id, topic):
-        return self.slack.api_call('conversations.setTopic', channel=channel_id, topic=topic)
+        return self.api_call('conversations.setTopic', channel=channel_id, topic=topic)
 
     def delete_message(self, channel_id, ts):
-        return self.slack.api_call('chat.delete', channel=channel_id, ts=ts, as_user=True)
+        return self.api_call('chat.delete', channel=channel_id, ts=ts, as_user=True)
 
     def edit_message(self, channel_id, ts, text):
-        return self.slack.api_call(
+        return self.api_call(
             'chat.update',
             channel=channel_id,
             ts=ts,
@@ -209,7 +723,7 @@ class Store:
         )
 
     def post_message(self, channel_id, message):
-        return self.slack.api_call(
+        return self.api_call(
             'chat.postMessage',
             channel=channel_id,
             as_user=True,
@@ -218,7 +732,7 @@ class Store:
         )
 
     def get_presence(self, user_id):
-        response = self.slack.api_call('users.getPresence', user=user_id)
+        response = self.api_call('users.getPresence', user=user_id)
 
         if response.get('ok', False):
             if response['presence'] == 'active':
@@ -35,6 +35,8 @@ themes = {
         ('loading_active_block', '', '', '', 'h99', 'h235'),
         ('edit_topic_focus', '', '', '', 'h27', 'h235'),
         ('editing_message', '', '', '', 'black', 'h178'),
+        ('pending_message', '', '', '', 'h244', 'h235'),
+        ('failed_message', '', '', '', 'h197', 'h235'),
         ('new_messages_text', '', '', '', 'h249', 'h197'),
         ('new_messages_line', '', '', '', 'h197', 'h235'),
         ('workspace_line', '', '', '', 'white', 'h54'),
@@ -84,6 +86,8 @@ themes = {
         ('loading_message', '', '', '', 'black', 'h254'),
         ('loading_active_block', '', '', '', 'h99', 'h254'),
         ('edit_topic_focus', '', '', '', 'h27', 'h254'),
-        ('editing_message', '', '', '', 'black', 'h178')
+        ('editing_message', '', '', '', 'black', 'h178'),
+        ('pending_message', '', '', '', 'h244', 'h254'),
+        ('failed_message', '', '', '', 'h197', 'h254')
     ]
 }
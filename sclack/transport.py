@@ -0,0 +1,65 @@
+import json
+
+import requests
+from requests.adapters import HTTPAdapter
+from slackclient.slackrequest import SlackRequest
+
+DEFAULT_POOL_SIZE = 10
+
+
+def create_session(pool_size=DEFAULT_POOL_SIZE, compression=True):
+    """
+    One session for every request of the application, connections to Slack
+    and its file servers are kept alive and reused
+    :param pool_size: connections kept per host
+    :param compression: whether gzip responses are accepted
+    :return:
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['Accept-Encoding'] = 'gzip, deflate' if compression else 'identity'
+    return session
+
+
+class SessionSlackRequest(SlackRequest):
+    """
+    Web API requester of slackclient sending through a shared session
+    instead of a new connection for each `requests.post`
+    """
+    def __init__(self, session, proxies=None):
+        super(SessionSlackRequest, self).__init__(proxies=proxies)
+        self.session = session
+
+    def do(self, token, request='?', post_data=None, domain='slack.com', timeout=None):
+        url = 'https://{0}/api/{1}'.format(domain, request)
+        post_data = dict(post_data or {})
+        if 'token' in post_data:
+            token = post_data['token']
+
+        headers = {
+            'user-agent': self.get_user_agent(),
+            'Authorization': 'Bearer {}'.format(token)
+        }
+
+        files = None
+        if request == 'files.upload' and 'file' in post_data:
+            files = {'file': post_data.pop('file')}
+
+        for field in {'channels', 'users', 'types'} & set(post_data.keys()):
+            if isinstance(post_data[field], list):
+                post_data[field] = ','.join(post_data[field])
+
+        for key, value in post_data.items():
+            if isinstance(value, (list, dict)):
+                post_data[key] = json.dumps(value)
+
+        return self.session.post(
+            url,
+            headers=headers,
+            data=post_data,
+            files=files,
+            timeout=timeout,
+            proxies=self.proxies
+        )
@@ -0,0 +1,85 @@
+import queue
+import threading
+
+
+def iter_cursor_pages(api_call, method, page_size, **kwargs):
+    """
+    Walk a cursor-paginated Slack method, yielding every response page
+    :param api_call: function with the same signature as SlackClient.api_call
+    :param method:
+    :param page_size:
+    :param kwargs: extra arguments sent with every page
+    :return:
+    """
+    cursor = None
+    while True:
+        if cursor:
+            response = api_call(method, limit=page_size, cursor=cursor, **kwargs)
+        else:
+            response = api_call(method, limit=page_size, **kwargs)
+        yield response
+
+        if not response.get('ok', False):
+            return
+
+        cursor = response.get('response_metadata', {}).get('next_cursor')
+        if not cursor:
+            return
+
+
+def prefetch(pages, depth, executor):
+    """
+    Keep up to `depth` pages downloading on a worker of `executor` while the
+    caller is still consuming the previous ones. When no worker picks it up
+    soon, because the pool is busy, the pages are downloaded by the caller
+    :param pages:
+    :param depth:
+    :param executor:
+    :return:
+    """
+    if depth <= 0 or executor is None:
+        yield from pages
+        return
+
+    done = object()
+    buffer = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+
+    def put(item):
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for page in pages:
+                if not put((page, None)):
+                    return
+        except Exception as exc:
+            put((done, exc))
+            return
+        put((done, None))
+
+    producer = executor.submit(produce)
+    try:
+        while True:
+            try:
+                page, error = buffer.get(timeout=0.1)
+            except queue.Empty:
+                if producer.cancel():
+                    # The pool is full, possibly of callers like this one
+                    yield from pages
+                    return
+                continue
+            if page is done:
+                if error is not None:
+                    raise error
+                return
+            yield page
+    finally:
+        stopped.set()
+        producer.cancel()
@@ -0,0 +1,69 @@
+import unicodedata
+
+
+def remove_diacritic(input):
+    '''
+    Accept a unicode string, and return a normal string (bytes in Python 3)
+    without any diacritical marks.
+    '''
+    return unicodedata.normalize('NFKD', input).encode('ASCII', 'ignore').decode()
+
+
+def normalize(text):
+    return remove_diacritic(text).lower()
+
+
+def trigrams(text):
+    return {text[index:index + 3] for index in range(len(text) - 2)}
+
+
+class TitleIndex:
+    """
+    Substring search over titles normalized once. Once `build_trigrams`
+    is done, queries of three characters or more only check the titles
+    sharing all their trigrams
+    """
+    def __init__(self, titles):
+        self.titles = [normalize(title) for title in titles]
+        self.trigrams = None
+
+    def build_trigrams(self):
+        """
+        Index the titles by trigram. It takes a while for many titles, it
+        may run in another thread, searches scan every title until it is done
+        :return:
+        """
+        index = {}
+        for position, title in enumerate(self.titles):
+            for trigram in trigrams(title):
+                index.setdefault(trigram, []).append(position)
+        self.trigrams = index
+
+    def search(self, query, candidates=None):
+        """
+        Positions of the titles containing the query, in order
+        :param query: already normalized
+        :param candidates: positions to search in, such as the result for a
+            shorter query, all of them by default
+        :return:
+        """
+        if not query:
+            return list(range(len(self.titles))) if candidates is None else list(candidates)
+
+        index = self.trigrams
+        if candidates is None and len(query) >= 3 and index is not None:
+            postings = sorted(
+                (index.get(trigram, []) for trigram in trigrams(query)),
+                key=len
+            )
+            matches = set(postings[0])
+            for positions in postings[1:]:
+                matches.intersection_update(positions)
+                if not matches:
+                    break
+            candidates = sorted(matches)
+        elif candidates is None:
+            candidates = range(len(self.titles))
+
+        titles = self.titles
+        return [position for position in candidates if query in titles[position]]
@@ -0,0 +1,29 @@
+class LatestTask:
+    """
+    Keep only the most recent of a kind of task running. Starting one cancels
+    the previous, which stops at its current `yield from`: executor jobs it
+    was waiting for are dropped if they haven't started yet, and the results
+    of the running ones are ignored
+    """
+    def __init__(self, loop):
+        self.loop = loop
+        self.task = None
+
+    @property
+    def running(self):
+        return self.task is not None and not self.task.done()
+
+    def start(self, coroutine):
+        """
+        :param coroutine:
+        :return: True when a previous task was cancelled
+        """
+        cancelled = self.cancel()
+        self.task = self.loop.create_task(coroutine)
+        return cancelled
+
+    def cancel(self):
+        if self.running:
+            self.task.cancel()
+            return True
+        return False
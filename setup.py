@@ -18,7 +18,7 @@ setup(
         ],
     },
     package_data={
-        'sclack': ['config.json']
+        'sclack': ['config.json', 'emoji.tsv']
     },
     packages=find_packages(),
     install_requires=[
@@ -28,5 +28,8 @@ setup(
         'requests',
         'slackclient',
         'urwid_readline'
-    ]
+    ],
+    extras_require={
+        'pictures': ['Pillow']
+    }
 )
@@ -0,0 +1,19 @@
+import pytest
+
+from sclack.store import Store
+
+
+@pytest.fixture
+def create_store():
+    """
+    Build a store of one workspace whose Web API answers from `responses`,
+    a dict of method name to a function called with the request arguments
+    """
+    def create(responses=None, config=None):
+        store = Store([["a", "b"]], dict({"features": {}}, **(config or {})))
+        if responses is not None:
+            def api_call(method, **kwargs):
+                return responses[method](**kwargs)
+            store.slack.api_call = api_call
+        return store
+    return create
@@ -0,0 +1,303 @@
+import asyncio
+import json
+import os
+import threading
+
+import pytest
+
+if not hasattr(asyncio, 'coroutine'):
+    pytest.skip('generator-based coroutines need Python < 3.11', allow_module_level=True)
+
+from sclack import app as app_module
+from sclack.app import App
+
+CONFIG_PATH = os.path.join(os.path.dirname(app_module.__file__), 'config.json')
+
+
+@pytest.fixture
+def create_app(tmp_path):
+    """
+    Build the application for one workspace whose Web API answers from
+    `responses`, a dict of method name to a function called with the
+    request arguments. The requests are kept in `app.api_calls`. Nothing
+    is painted nor kept on disk
+    """
+    apps = []
+
+    def create(responses, workers=None):
+        with open(CONFIG_PATH) as config_file:
+            config = json.load(config_file)
+        config['workspaces'] = {'default': 'xoxp-1'}
+        config['features']['pictures'] = False
+        config['cache'].update({'directory': str(tmp_path), 'snapshot': False, 'pictures': False})
+        config['api']['prefetch_pages'] = 0
+        config['workers'].update(workers or {})
+        app = App(config)
+        app.api_calls = []
+
+        def api_call(method, **kwargs):
+            app.api_calls.append((method, kwargs))
+            return responses[method](**kwargs)
+        app.store.slack.api_call = api_call
+        app.store.state.auth = {'user_id': 'U1', 'user': 'me', 'team': 'team'}
+        app.store.state.users = [{'id': 'U1', 'name': 'me', 'profile': {'display_name': 'me'}}]
+        app.store.index_users()
+        apps.append(app)
+        return app
+
+    yield create
+    for app in apps:
+        app.scheduler.shutdown()
+
+
+class FakeSideBar:
+    """
+    Remembers the selected channel, the sidebar itself isn't under test
+    """
+    def __init__(self):
+        self.selected = None
+
+    def select_channel(self, channel_id):
+        self.selected = channel_id
+
+    def update_items(self, channel_id, count):
+        pass
+
+
+def create_message(ts, text=''):
+    return {'ts': ts, 'user': 'U1', 'text': text or ts}
+
+
+def channel_responses(histories):
+    """
+    Web API of the channels of `histories`, a dict of channel id to its
+    messages oldest first
+    """
+    def history(channel, oldest='0', **kwargs):
+        messages = [message for message in histories[channel] if float(message['ts']) > float(oldest)]
+        return {'ok': True, 'messages': list(reversed(messages)), 'has_more': False, 'pin_count': 0}
+
+    return {
+        'conversations.info': lambda channel, **kwargs: {
+            'ok': True,
+            'channel': {'id': channel, 'name': channel.lower(), 'topic': {'value': ''}},
+        },
+        'conversations.members': lambda **kwargs: {'ok': True, 'members': ['U1']},
+        'conversations.history': history,
+        'channels.mark': lambda **kwargs: {'ok': True},
+        'users.counts': lambda **kwargs: {'ok': True, 'channels': []},
+    }
+
+
+@asyncio.coroutine
+def idle():
+    pass
+
+
+def run(coroutine, timeout=2):
+    return app_module.loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+
+def mount(app, channel_id):
+    """
+    Open the chat of a channel, without the real time connection
+    """
+    app.sidebar = FakeSideBar()
+    app.start_real_time = idle
+    app.reconcile_unread_counts = idle
+    run(app.mount_chatbox(app.scheduler.api, channel_id))
+
+
+def shown_ts(app):
+    return [row.ts for row in app.chatbox.body.body if getattr(row, 'ts', None)]
+
+
+def test_rendering_a_message_again_keeps_its_files(create_app):
+    app = create_app({})
+    message = {
+        'ts': '1.0',
+        'user': 'U1',
+        'text': '',
+        'files': [{'title': 'one', 'url_private': 'https://files.slack.com/one.png'}],
+        'file': {'title': 'two', 'url_private': 'https://files.slack.com/two.png'},
+    }
+    loaded = []
+    app.lazy_load_images = lambda files, widget: loaded.append(len(files))
+
+    app.render_message(message)
+    app.render_message(message)
+    assert len(message['files']) == 1
+    assert loaded == [2, 2]
+
+
+def test_missed_messages_show_after_an_incomplete_catch_up(create_app):
+    histories = {'C1': [create_message('1.0'), create_message('2.0')]}
+    responses = channel_responses(histories)
+    app = create_app(responses)
+    mount(app, 'C1')
+
+    # Missed while offline, then one received once the connection was back
+    histories['C1'] += [create_message('3.0'), create_message('4.0'), create_message('5.0')]
+    app.store.state.messages.append(create_message('5.0'))
+    app.chatbox.body.body.extend(app.render_messages([create_message('5.0')], 'C1'))
+
+    history = responses['conversations.history']
+    failures = [{'ok': False, 'error': 'internal_error'}]
+    responses['conversations.history'] = lambda **kwargs: failures.pop() if failures else history(**kwargs)
+    assert run(app.load_missed_messages({'C1': '2.0'})) == []
+    run(app.channel_switch.task)
+    assert shown_ts(app) == ['1.0', '2.0', '3.0', '4.0', '5.0']
+
+
+def test_sidebar_is_painted_as_the_channels_arrive(create_app):
+    pages = [
+        [{'id': 'C2', 'name': 'random', 'is_channel': True, 'is_private': False}],
+        [{'id': 'C1', 'name': 'general', 'is_channel': True, 'is_private': False}],
+    ]
+
+    authenticated = threading.Event()
+
+    def conversations(cursor=None, **kwargs):
+        # The profile goes on top of the sidebar, the first page waits for it
+        authenticated.wait(1)
+        index = int(cursor or 0)
+        response = {'ok': True, 'channels': pages[index]}
+        if index + 1 < len(pages):
+            response['response_metadata'] = {'next_cursor': str(index + 1)}
+        return response
+
+    app = create_app({
+        'auth.test': lambda **kwargs: {'ok': True, 'user_id': 'U1', 'user': 'me', 'team': 'team'},
+        'users.conversations': conversations,
+        'stars.list': lambda **kwargs: {'ok': True, 'items': []},
+        'conversations.list': lambda **kwargs: {'ok': True, 'channels': []},
+        'users.list': lambda **kwargs: {'ok': True, 'members': [{'id': 'U1', 'name': 'me', 'profile': {}}]},
+        'dnd.info': lambda **kwargs: {'ok': True, 'snooze_enabled': False},
+        'emoji.list': lambda **kwargs: {'ok': True, 'emoji': {}},
+    })
+    load_auth = app.store.load_auth
+
+    def authenticate():
+        load_auth()
+        authenticated.set()
+    app.store.load_auth = authenticate
+    app._loading = True
+    painted = []
+    render_partial_sidebar = app.render_partial_sidebar
+
+    def record(channels, dms):
+        render_partial_sidebar(channels, dms)
+        painted.append([channel.name for channel in app.sidebar.channels])
+    app.render_partial_sidebar = record
+
+    run(app.mount_sidebar(app.scheduler.api))
+    assert painted[0] == ['random']
+    assert [channel.name for channel in app.sidebar.channels] == ['general', 'random']
+
+
+def test_long_history_is_rendered_a_slice_at_a_time(create_app):
+    messages = [create_message('{}.0'.format(ts)) for ts in range(1, 151)]
+    app = create_app(channel_responses({'C1': messages}))
+    mount(app, 'C1')
+    assert shown_ts(app) == [message['ts'] for message in messages]
+    assert app.store.metrics.get('render.history_slices') > 1
+    assert app._history_rendered
+
+
+def test_history_render_stops_when_another_channel_is_shown(create_app):
+    app = create_app(channel_responses({'C1': [create_message('1.0')]}))
+    mount(app, 'C1')
+    messages = [create_message('{}.0'.format(ts)) for ts in range(1, 151)]
+    app.store.state.messages = messages
+    render_message_rows = app.render_message_rows
+
+    def render_then_switch(*args):
+        rows = render_message_rows(*args)
+        # Another channel is opened while the first slice is shown
+        app.store.state.messages = [create_message('151.0')]
+        return rows
+    app.render_message_rows = render_then_switch
+
+    run(app.render_history(app.chatbox.body.body, messages, 'C1'))
+    assert shown_ts(app) == [message['ts'] for message in messages[-app_module.RENDER_FIRST_SLICE:]]
+    assert not app._history_rendered
+
+
+def requested(app, method, **kwargs):
+    """
+    Channels asked for with `method`, and with `kwargs` among the arguments
+    """
+    return [
+        arguments['channel'] for called, arguments in app.api_calls
+        if called == method and all(arguments.get(key) == value for key, value in kwargs.items())
+    ]
+
+
+def test_rapid_switching_only_loads_and_renders_the_last_channel(create_app):
+    histories = {channel_id: [create_message('1.0', channel_id)] for channel_id in ('C1', 'C2', 'C3', 'C4')}
+    responses = channel_responses(histories)
+    # A single worker, the requests of a switch queue up behind each other
+    app = create_app(responses, workers={'api': 1})
+    mount(app, 'C1')
+
+    started = threading.Event()
+    release = threading.Event()
+    info = responses['conversations.info']
+
+    def slow_info(channel, **kwargs):
+        if channel == 'C2':
+            started.set()
+            release.wait(2)
+        return info(channel=channel, **kwargs)
+    responses['conversations.info'] = slow_info
+
+    rendered = []
+    render_history = app.render_history
+
+    def record_render(walker, messages, channel_id=None):
+        rendered.append(channel_id)
+        return render_history(walker, messages, channel_id)
+    app.render_history = record_render
+
+    app.go_to_channel('C2')
+    run(asyncio.sleep(0))
+    assert started.wait(2)
+    app.go_to_channel('C3')
+    app.go_to_channel('C4')
+    # The queued requests of C2 are cancelled from the event loop
+    run(asyncio.sleep(0.05))
+    release.set()
+    run(app.channel_switch.task)
+
+    # C2 was being fetched, its history was still queued. C3 never started
+    assert requested(app, 'conversations.info') == ['C1', 'C2', 'C4']
+    assert requested(app, 'conversations.history') == ['C1', 'C4']
+    # The late answer about C2 is dropped
+    assert app.store.state.channel['id'] == 'C4'
+    assert [message['text'] for message in app.store.state.messages] == ['C4']
+    assert app.sidebar.selected == 'C4'
+    assert rendered == ['C4']
+    assert app.store.metrics.get('channels.cancelled_switches') == 2
+
+
+def test_coming_back_to_a_channel_only_asks_for_the_new_messages(create_app):
+    histories = {'C1': [create_message('1.0'), create_message('2.0')], 'C2': [create_message('1.0')]}
+    app = create_app(channel_responses(histories))
+    mount(app, 'C1')
+    rows = list(app.chatbox.body.body)
+
+    app.go_to_channel('C2')
+    run(app.channel_switch.task)
+    assert 'C1' in app.store.history
+    histories['C1'].append(create_message('3.0'))
+    del app.api_calls[:]
+
+    app.go_to_channel('C1')
+    run(app.channel_switch.task)
+    assert requested(app, 'conversations.history') == ['C1']
+    assert requested(app, 'conversations.history', oldest='2.0') == ['C1']
+    assert requested(app, 'conversations.info') == []
+    # The rows built before are shown again, the new message goes after them
+    assert list(app.chatbox.body.body)[:len(rows)] == rows
+    assert shown_ts(app) == ['1.0', '2.0', '3.0']
+    assert 'C2' in app.store.history
@@ -0,0 +1,16 @@
+def test_bots_are_looked_up_once_before_rendering(create_store):
+    calls = []
+    def bots_info(bot):
+        calls.append(bot)
+        return {'ok': True, 'bot': {'id': bot, 'name': 'deploy'}}
+    store = create_store({'bots.info': bots_info})
+    messages = [
+        {'ts': '1', 'subtype': 'bot_message', 'bot_id': 'B1'},
+        {'ts': '2', 'subtype': 'bot_message', 'bot_id': 'B1'},
+        {'ts': '3', 'user': 'U1'},
+    ]
+    assert store.find_unknown_bots(messages) == {'B1'}
+    store.load_bots(messages)
+    assert store.find_unknown_bots(messages) == set()
+    assert store.find_or_load_bot('B1')['name'] == 'deploy'
+    assert calls == ['B1']
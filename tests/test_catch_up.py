@@ -0,0 +1,44 @@
+def history_pages(pages):
+    def conversations_history(channel, oldest, limit, cursor=None):
+        index = int(cursor or 0)
+        return {
+            'ok': True,
+            'messages': pages[index],
+            'has_more': index + 1 < len(pages),
+            'response_metadata': {'next_cursor': str(index + 1) if index + 1 < len(pages) else ''},
+        }
+    return conversations_history
+
+def test_missed_messages_become_events_in_order(create_store):
+    store = create_store({
+        'conversations.history': history_pages([
+            [{'ts': '5', 'text': 'e'}, {'ts': '4', 'text': 'd'}],
+            [{'ts': '3', 'text': 'c'}, {'ts': '2', 'text': 'b'}],
+        ]),
+    })
+    events, complete = store.load_missed_messages('C1', '1')
+    assert complete
+    assert [event['ts'] for event in events] == ['2', '3', '4', '5']
+    assert events[0] == {'type': 'message', 'channel': 'C1', 'ts': '2', 'text': 'b'}
+
+def test_too_many_missed_messages_are_left_out(create_store):
+    store = create_store({
+        'conversations.history': history_pages([[{'ts': '3'}], [{'ts': '2'}], [{'ts': '1'}]]),
+    }, {'api': {'catch_up_pages': 2, 'prefetch_pages': 0}})
+    events, complete = store.load_missed_messages('C1', '0')
+    assert not complete
+    assert [event['ts'] for event in events] == ['2', '3']
+    assert store.metrics.get('api.calls.conversations.history') == 2
+
+def test_only_changed_counts_are_returned(create_store):
+    store = create_store({
+        'users.counts': lambda **kwargs: {
+            'ok': True,
+            'channels': [{'id': 'C1', 'unread_count_display': 3}, {'id': 'C2', 'unread_count_display': 1}],
+            'ims': [{'id': 'D1', 'unread_count_display': 0}],
+        },
+    })
+    store.state.unread_counts = {'C1': 1, 'C2': 1, 'D1': 2}
+    assert store.load_changed_unread_counts() == {'C1': 3, 'D1': 0}
+    # Left for the missed events to update
+    assert store.state.unread_counts == {'C1': 1, 'C2': 1, 'D1': 2}
@@ -0,0 +1,99 @@
+import threading
+
+from sclack import coalescer as coalescer_module
+from sclack.coalescer import RequestCoalescer
+from sclack.metrics import Metrics
+
+
+class SlowApi:
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+
+    def __call__(self, method, **kwargs):
+        self.calls.append((method, kwargs))
+        self.release.wait(1)
+        return {'ok': True, 'channel': {'id': kwargs.get('channel'), 'members': []}}
+
+
+def test_concurrent_identical_reads_share_one_request():
+    metrics = Metrics()
+    coalescer = RequestCoalescer(metrics, ttl=0)
+    api = SlowApi()
+    responses = []
+
+    def call():
+        responses.append(coalescer.call(api, 'conversations.info', channel='C1'))
+
+    threads = [threading.Thread(target=call) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    while metrics.get('api.coalesced') < 4:
+        pass
+    api.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert api.calls == [('conversations.info', {'channel': 'C1'})]
+    assert len(responses) == 5
+    assert metrics.get('api.saved_calls') == 4
+    # Every caller gets its own copy
+    responses[0]['channel']['members'].append('U1')
+    assert responses[1]['channel']['members'] == []
+
+
+def test_reads_are_cached_until_a_write():
+    metrics = Metrics()
+    now = [0]
+    coalescer = RequestCoalescer(metrics, ttl=5, clock=lambda: now[0])
+    api = SlowApi()
+    api.release.set()
+
+    coalescer.call(api, 'conversations.info', channel='C1')
+    coalescer.call(api, 'conversations.info', channel='C1')
+    coalescer.call(api, 'conversations.info', channel='C2')
+    assert len(api.calls) == 2
+    assert metrics.get('api.cache_hits') == 1
+
+    now[0] = 6
+    coalescer.call(api, 'conversations.info', channel='C1')
+    assert len(api.calls) == 3
+
+    coalescer.call(api, 'conversations.setTopic', channel='C1', topic='News')
+    coalescer.call(api, 'conversations.info', channel='C1')
+    assert len(api.calls) == 5
+
+
+def test_writes_and_history_are_never_cached():
+    coalescer = RequestCoalescer(Metrics(), ttl=5)
+    api = SlowApi()
+    api.release.set()
+    for _ in range(2):
+        coalescer.call(api, 'chat.postMessage', channel='C1', text='hi')
+        coalescer.call(api, 'conversations.history', channel='C1')
+    assert len(api.calls) == 4
+
+
+def test_the_oldest_responses_make_room_for_new_ones(monkeypatch):
+    monkeypatch.setattr(coalescer_module, 'MAX_CACHED_RESPONSES', 2)
+    coalescer = RequestCoalescer(Metrics(), ttl=5, clock=lambda: 0)
+    api = SlowApi()
+    api.release.set()
+
+    for channel in ['C1', 'C2', 'C3']:
+        coalescer.call(api, 'conversations.info', channel=channel)
+    assert len(coalescer._cache) == 2
+    coalescer.call(api, 'conversations.info', channel='C3')
+    coalescer.call(api, 'conversations.info', channel='C1')
+    assert [kwargs['channel'] for _, kwargs in api.calls] == ['C1', 'C2', 'C3', 'C1']
+
+
+def test_response_nobody_else_needs_is_not_copied():
+    coalescer = RequestCoalescer(Metrics(), ttl=5)
+    response = {'ok': True, 'messages': []}
+    assert coalescer.call(lambda method, **kwargs: response, 'conversations.history', channel='C1') is response
+
+    # The cached one is kept as Slack sent it
+    cached = coalescer.call(lambda method, **kwargs: response, 'conversations.info', channel='C1')
+    cached['messages'].append({'ts': '1'})
+    assert coalescer.call(None, 'conversations.info', channel='C1') == {'ok': True, 'messages': []}
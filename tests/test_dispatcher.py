@@ -0,0 +1,135 @@
+import threading
+import time
+
+import pytest
+
+from sclack.dispatcher import (
+    ApiDispatcher, DispatcherClosed, INTERACTIVE, TokenBucket, retry_after
+)
+from sclack.metrics import Metrics
+from sclack.scheduler import Scheduler
+
+
+def test_token_bucket_refills_over_time():
+    now = [0.0]
+    bucket = TokenBucket(60, capacity=2, clock=lambda: now[0])
+    assert bucket.delay(now[0]) == 0
+    bucket.take()
+    bucket.take()
+    assert bucket.delay(now[0]) == 1
+    now[0] = 0.5
+    assert bucket.delay(now[0]) == 0.5
+    now[0] = 10
+    assert bucket.delay(now[0]) == 0
+    assert bucket.tokens == 2
+
+
+def test_retry_after_reads_the_header():
+    assert retry_after({'ok': True}) is None
+    assert retry_after({'ok': False, 'error': 'channel_not_found'}) is None
+    assert retry_after({'ok': False, 'error': 'ratelimited', 'headers': {'Retry-After': '3'}}) == 3
+    assert retry_after({'ok': False, 'error': 'ratelimited', 'headers': {}}) == 1
+
+
+def test_rate_limited_requests_are_retried():
+    responses = [
+        {'ok': False, 'error': 'ratelimited', 'headers': {'retry-after': '0.05'}},
+        {'ok': True, 'channel': {'id': 'C1'}},
+    ]
+    calls = []
+
+    def api_call(method, **kwargs):
+        calls.append((method, kwargs))
+        return responses.pop(0)
+
+    metrics = Metrics()
+    dispatcher = ApiDispatcher(api_call, metrics)
+    started_at = time.monotonic()
+    response = dispatcher.call('conversations.info', channel='C1')
+    assert response['ok']
+    assert time.monotonic() - started_at >= 0.05
+    assert calls == [('conversations.info', {'channel': 'C1'})] * 2
+    assert metrics.get('api.ratelimited') == 1
+
+
+def test_interactive_requests_go_first():
+    order = []
+    dispatcher = ApiDispatcher(
+        lambda method, **kwargs: order.append(kwargs['name']) or {'ok': True},
+        Metrics(),
+        tier_rates={3: 240}
+    )
+    # Empty the bucket, the next token comes in 0.25s
+    dispatcher._buckets[3].tokens = 0
+
+    background = threading.Thread(
+        target=dispatcher.call,
+        args=('users.getPresence',),
+        kwargs={'name': 'presence'}
+    )
+    background.start()
+    time.sleep(0.05)
+    interactive = threading.Thread(
+        target=dispatcher.call,
+        args=('chat.update',),
+        kwargs={'name': 'edit', 'priority': INTERACTIVE}
+    )
+    interactive.start()
+    background.join()
+    interactive.join()
+    assert order == ['edit', 'presence']
+
+
+def test_messages_are_sent_while_background_requests_wait():
+    sent = []
+    dispatcher = ApiDispatcher(lambda method, **kwargs: sent.append(method) or {'ok': True}, Metrics())
+    scheduler = Scheduler({}, dispatcher.metrics)
+    # Presence requests got rate limited, their tier waits for a while
+    dispatcher._pause(3, 1)
+    try:
+        parked = [
+            scheduler.api.submit(dispatcher.call, 'users.getPresence', user='U{}'.format(index))
+            for index in range(20)
+        ]
+        time.sleep(0.05)
+        assert dispatcher.metrics.get('pools.api.queue_depth') == 12
+
+        started_at = time.monotonic()
+        response = scheduler.interactive.submit(
+            dispatcher.call, 'chat.postMessage', channel='C1', text='hi'
+        ).result(1)
+        assert response['ok']
+        assert time.monotonic() - started_at < 0.5
+        assert sent == ['chat.postMessage']
+        assert not any(future.done() for future in parked)
+    finally:
+        with dispatcher._condition:
+            dispatcher._paused_until[3] = 0
+            dispatcher._condition.notify_all()
+        scheduler.shutdown()
+
+
+def test_closing_wakes_up_the_waiting_requests():
+    dispatcher = ApiDispatcher(lambda method, **kwargs: {'ok': True}, Metrics())
+    # Slack asked to wait for a minute
+    dispatcher._pause(3, 60)
+    errors = []
+
+    def call():
+        try:
+            dispatcher.call('conversations.info', channel='C1')
+        except DispatcherClosed as exception:
+            errors.append(exception)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    started_at = time.monotonic()
+    dispatcher.close()
+    for thread in threads:
+        thread.join(1)
+    assert time.monotonic() - started_at < 0.5
+    assert len(errors) == 3
+    with pytest.raises(DispatcherClosed):
+        dispatcher.call('chat.postMessage', channel='C1', text='hi')
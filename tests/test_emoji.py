@@ -0,0 +1,20 @@
+from sclack.emoji import EmojiTable
+
+def test_table_is_loaded_on_first_use():
+    table = EmojiTable()
+    assert table.load_time is None
+    assert table.get('+1') == '\U0001f44d'
+    assert table.load_time is not None
+    assert len(table) > 1000
+
+def test_prefix_lookup():
+    table = EmojiTable()
+    assert table.complete('par', limit=3) == ['paraguay', 'parasol_on_ground', 'parking']
+    assert table.complete('no_such_emoji') == []
+
+def test_custom_emoji():
+    table = EmojiTable()
+    table.set_custom({'party_parrot': 'https://emoji.slack-edge.com/parrot.gif', 'yes': 'alias:+1'})
+    assert table.get('yes') == '\U0001f44d'
+    assert table.get('party_parrot') is None
+    assert 'party_parrot' in table.complete('par')
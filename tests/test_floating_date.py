@@ -0,0 +1,22 @@
+import urwid
+
+from sclack.components import ChatBoxMessages, TextDivider
+
+
+def test_set_date_is_only_sent_when_the_divider_changes():
+    today = TextDivider(('history_date', 'Today'), 'center')
+    rows = [TextDivider(('history_date', 'Monday'), 'center')]
+    rows += [urwid.Text('message {}'.format(index)) for index in range(20)]
+    rows += [today] + [urwid.Text('message {}'.format(index)) for index in range(20)]
+    messages = ChatBoxMessages(messages=rows)
+    dates = []
+    urwid.connect_signal(messages, 'set_date', dates.append)
+
+    messages.set_focus(len(rows) - 1)
+    for _ in range(3):
+        messages.render((40, 5))
+    assert dates == [today]
+
+    messages.set_focus(5)
+    messages.render((40, 5))
+    assert dates == [today, rows[0]]
@@ -0,0 +1,46 @@
+import urwid
+
+from sclack.frames import FrameMainLoop
+from sclack.metrics import Metrics
+
+
+class FakeScreen:
+    started = True
+
+    def __init__(self):
+        self.frames = []
+
+    def get_cols_rows(self):
+        return (20, 5)
+
+    def draw_screen(self, size, canvas):
+        self.frames.append(canvas)
+
+    def register_palette(self, palette):
+        pass
+
+    def clear(self):
+        pass
+
+
+def test_only_changes_are_painted():
+    walker = urwid.SimpleFocusListWalker([urwid.Text('first')])
+    screen = FakeScreen()
+    main_loop = FrameMainLoop(urwid.ListBox(walker), Metrics(), screen=screen)
+
+    main_loop.draw_screen()
+    main_loop.draw_screen()
+    assert len(screen.frames) == 1
+
+    # A burst of changes between two frames is painted once
+    for index in range(100):
+        walker.append(urwid.Text('message {}'.format(index)))
+    main_loop.draw_screen()
+    main_loop.draw_screen()
+    assert len(screen.frames) == 2
+
+    main_loop.process_input(['ctrl l'])
+    main_loop.draw_screen()
+    assert len(screen.frames) == 3
+    assert main_loop.metrics.get('render.frames') == 3
+    assert main_loop.metrics.get('render.frames_skipped') == 2
@@ -0,0 +1,58 @@
+import urwid
+
+from sclack.component.message_walker import LazyMessage, MessageWalker
+from sclack.history import ChannelHistory, HistoryCache
+
+
+def create_history(channel_id, size):
+    rows = [
+        LazyMessage({'ts': '{}.0'.format(index)}, channel_id, lambda: urwid.Text(''))
+        for index in range(size)
+    ]
+    return ChannelHistory(
+        channel={'id': channel_id},
+        members={'members': []},
+        pin_count=0,
+        has_more=False,
+        messages=[row.message for row in rows],
+        rows=rows + [urwid.Divider()],
+        widgets={},
+        focus=size - 1,
+        last_date=None
+    )
+
+
+def test_least_recently_visited_channels_are_evicted():
+    cache = HistoryCache(max_messages=25)
+    cache.put('C1', create_history('C1', 9))
+    cache.put('C2', create_history('C2', 9))
+    cache.put('C3', create_history('C3', 9))
+    assert 'C1' not in cache
+    assert cache.size == 20
+    assert cache.pop('C2').channel['id'] == 'C2'
+    assert cache.size == 10
+    cache.put('C4', create_history('C4', 30))
+    assert 'C4' not in cache
+
+
+def test_newest_ts_skips_dividers():
+    assert create_history('C1', 3).newest_ts() == '2.0'
+    assert create_history('C1', 0).newest_ts() is None
+
+
+def test_restored_rows_keep_their_widgets():
+    built = []
+
+    def build():
+        built.append(1)
+        return urwid.Text('message')
+
+    rows = [LazyMessage({'ts': str(index)}, 'C1', build) for index in range(3)]
+    walker = MessageWalker(rows)
+    widget = walker.widget_at(2)
+    widgets = walker.widgets
+
+    walker.set_contents([urwid.Text('other channel')])
+    walker.set_contents(rows, widgets)
+    assert walker.widget_at(2) is widget
+    assert len(built) == 1
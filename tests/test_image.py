@@ -0,0 +1,56 @@
+import io
+import pickle
+
+import pytest
+
+from sclack.image import HALF_BLOCK, Image, render_picture
+
+PILImage = pytest.importorskip('PIL.Image')
+
+
+def encode(picture, format='PNG'):
+    output = io.BytesIO()
+    picture.save(output, format=format)
+    return output.getvalue()
+
+
+def test_render_picture_keeps_aspect_ratio():
+    picture = PILImage.new('RGB', (100, 50), (255, 0, 0))
+    kind, lines = render_picture(encode(picture), width=20)
+    assert kind == 'cells'
+    # 20x10 pixels, two pixel rows per line
+    assert len(lines) == 5
+    for runs in lines:
+        assert runs == [('#f00', '#f00', HALF_BLOCK * 20)]
+
+
+def test_render_picture_pairs_pixel_rows():
+    picture = PILImage.new('RGB', (2, 2), (0, 0, 255))
+    picture.putpixel((0, 0), (255, 255, 255))
+    picture.putpixel((1, 0), (255, 255, 255))
+    kind, lines = render_picture(encode(picture), width=2)
+    assert lines == [[('#fff', '#00f', HALF_BLOCK * 2)]]
+
+
+def test_render_picture_blends_transparency():
+    picture = PILImage.new('RGBA', (4, 4), (255, 255, 255, 0))
+    kind, lines = render_picture(encode(picture), width=4)
+    assert lines[0] == [('#222', '#222', HALF_BLOCK * 4)]
+
+
+def test_render_result_can_cross_processes():
+    picture = PILImage.new('RGB', (8, 8), (10, 200, 30))
+    rendered = render_picture(encode(picture, 'JPEG'), width=8)
+    assert pickle.loads(pickle.dumps(rendered)) == rendered
+
+
+def test_image_markup():
+    picture = PILImage.new('RGB', (4, 4), (0, 255, 0))
+    image = Image(render_picture(encode(picture), width=4))
+    assert image.text == '\n'.join([HALF_BLOCK * 4] * 2)
+    attr, text = image.markup[0]
+    assert attr.foreground == '#0f0'
+
+
+def test_image_without_picture():
+    assert Image(None).text == ''
@@ -1,4 +1,4 @@
-from sclack.markdown import MarkdownText
+from sclack.markdown import MarkdownText, MarkupCache, markup_cache
 from sclack.store import Store
 
 def create_markdown():
@@ -27,3 +27,44 @@ def test_markdown():
     assert parse_message("*something bold*") == [
       ("message", ""), ("bold","something bold"), ("message", "")
     ]
+
+def test_nested_markup():
+    assert parse_message("*a _b_ c*") == [
+      ("message", ""), ("bold", "a "), ("italics", "b"), ("bold", " c"), ("message", "")
+    ]
+
+def test_code_keeps_markup_characters():
+    assert parse_message("`x*y*`") == [("message", ""), ("code", "x*y*"), ("message", "")]
+
+def test_link_label():
+    assert parse_message("<http://a|b> &lt;") == [("message", ""), ("link", "b"), ("message", " <")]
+
+def test_long_text_is_kept_whole():
+    text = "plain text " * 10000
+    assert parse_message(text) == [("message", text)]
+
+def test_parsed_markup_is_cached():
+    create_markdown()
+    markup_cache.clear()
+    hits = markup_cache.hits
+    MarkdownText("*cached*")
+    assert MarkdownText("*cached*").markup == [("message", ""), ("bold", "cached"), ("message", "")]
+    assert markup_cache.hits == hits + 1
+
+def test_cache_is_bounded():
+    cache = MarkupCache(max_size=2)
+    for text in ("a", "b", "c"):
+        cache.put(text, [("message", text)])
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.get("c") == [("message", "c")]
+
+def test_mentions_follow_users_changes():
+    create_markdown()
+    store = Store.instance
+    store.state.users = [{"id": "U1", "name": "before", "profile": {}}]
+    store.index_users()
+    assert MarkdownText("<@U1>").markup[1] == ("link", "before")
+    store.state.users = [{"id": "U1", "name": "after", "profile": {}}]
+    store.index_users()
+    assert MarkdownText("<@U1>").markup[1] == ("link", "after")
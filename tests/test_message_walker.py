@@ -0,0 +1,108 @@
+import urwid
+
+from sclack.component.message_walker import LazyMessage, MessageWalker
+
+def create_walker(size, cache_size=50):
+    built = []
+    def build(index):
+        built.append(index)
+        return urwid.Text('message {}'.format(index))
+    rows = [
+        LazyMessage({'ts': str(index)}, 'C1', lambda index=index: build(index))
+        for index in range(size)
+    ]
+    return MessageWalker(rows, cache_size=cache_size), built
+
+def test_only_visible_rows_are_built():
+    walker, built = create_walker(5000)
+    walker.set_focus(4999)
+    urwid.ListBox(walker).render((40, 10))
+    assert 0 < len(built) <= 20
+    assert all(index >= 4980 for index in built)
+
+def test_built_widgets_are_bounded_and_reused():
+    walker, built = create_walker(500, cache_size=10)
+    listbox = urwid.ListBox(walker)
+    for position in range(0, 500, 5):
+        listbox.set_focus(position)
+        listbox.render((40, 5))
+    assert walker.built_widgets == 10
+    count = len(built)
+    listbox.render((40, 5))
+    assert len(built) == count
+
+def test_rows_keep_message_identity():
+    walker, _ = create_walker(3)
+    widget = walker.widget_at(1)
+    assert walker[1].ts == '1' and walker[1].channel_id == 'C1'
+    assert walker.position_of(widget) == 1
+    assert walker.position_of(urwid.Text('')) is None
+
+def test_prepended_rows_keep_the_focus_and_widgets():
+    walker, built = create_walker(100)
+    walker.set_focus(10)
+    listbox = urwid.ListBox(walker)
+    listbox.render((40, 5))
+    focus_widget = walker.get_focus()[0]
+    count = len(built)
+
+    older = [
+        LazyMessage({'ts': 'old{}'.format(index)}, 'C1', lambda: urwid.Text('older'))
+        for index in range(50)
+    ]
+    walker[0:0] = older
+    assert walker.focus == 60
+    assert listbox.get_focus()[0] is focus_widget
+    assert len(built) == count
+
+def test_messages_are_found_and_inserted_by_ts():
+    walker, _ = create_walker(1000)
+    walker[500:500] = [urwid.Divider()]
+    assert walker.find_ts('700') == 701
+    assert walker.find_ts('499') == 499
+    assert walker.find_ts('1000') is None
+
+    late = LazyMessage({'ts': '499.5'}, 'C1', lambda: urwid.Text('late'))
+    assert walker.insert_message(late) == 500
+    assert walker.find_ts('499.5') == 500
+    assert walker.find_ts('700') == 702
+
+    del walker[walker.find_ts('10')]
+    assert walker.find_ts('10') is None
+    assert walker.find_ts('11') == 10
+
+    widget = walker.widget_at(20)
+    walker[20] = urwid.Text('edited')
+    assert walker.position_of(widget) is None
+    assert walker.newest_ts() == '999'
+
+class DateDivider(urwid.Divider):
+    pass
+
+
+def test_divider_index_follows_changes():
+    import random
+    random.seed(3)
+    walker = MessageWalker(
+        [DateDivider() if index % 7 == 0 else urwid.Text(str(index)) for index in range(50)],
+        divider_types=(DateDivider,)
+    )
+    for _ in range(300):
+        position = random.randint(0, len(walker))
+        operation = random.choice(['insert', 'delete', 'replace', 'prepend', 'extend'])
+        if operation == 'insert':
+            walker.insert(position, DateDivider())
+        elif operation == 'delete' and position < len(walker):
+            del walker[position]
+        elif operation == 'replace' and position < len(walker):
+            walker[position] = urwid.Text('edited')
+        elif operation == 'prepend':
+            walker[0:0] = [DateDivider(), urwid.Text('older')]
+        elif operation == 'extend':
+            walker.extend([urwid.Text('newer'), DateDivider()])
+        expected = [index for index, row in enumerate(walker) if isinstance(row, DateDivider)]
+        assert walker._dividers == expected
+
+    first = walker._dividers[0]
+    assert walker.divider_before(first) is None
+    assert walker.divider_before(first + 1) is walker[first]
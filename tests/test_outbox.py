@@ -0,0 +1,172 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from sclack.metrics import Metrics
+from sclack.outbox import FAILED, SENT, Outbox, failed_before_sending
+
+
+def run_until(loop, condition, timeout=2):
+    async def wait():
+        deadline = time.monotonic() + timeout
+        while not condition():
+            assert time.monotonic() < deadline, 'timed out'
+            await asyncio.sleep(0.001)
+    loop.run_until_complete(wait())
+
+
+def create_outbox(post, edit=None, **kwargs):
+    loop = asyncio.new_event_loop()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+    sent, failed = [], []
+    outbox = Outbox(
+        post,
+        edit,
+        loop,
+        executor,
+        Metrics(),
+        on_sent=sent.append,
+        on_failed=failed.append,
+        backoff=0.001,
+        **kwargs
+    )
+    return outbox, loop, sent, failed
+
+
+def refused_connection():
+    reason = NewConnectionError(None, 'Connection refused')
+    return requests.ConnectionError(MaxRetryError(None, '/api/chat.postMessage', reason))
+
+
+def test_sends_to_channels_are_pipelined_and_get_their_ts():
+    barrier = threading.Barrier(3, timeout=2)
+
+    def post(channel_id, text):
+        # Only passes when the three messages are sent at the same time
+        barrier.wait()
+        return {'ok': True, 'ts': text, 'channel': channel_id, 'message': {'text': text}}
+
+    outbox, loop, sent, failed = create_outbox(post)
+    messages = [outbox.submit('C{}'.format(index), '{}.0'.format(index)) for index in range(3)]
+    assert len(outbox.pending) == 3
+
+    run_until(loop, lambda: len(sent) == 3)
+    assert failed == []
+    assert [message.state for message in messages] == [SENT] * 3
+    assert [message.ts for message in messages] == ['0.0', '1.0', '2.0']
+    assert outbox.pending == []
+    assert outbox.metrics.get('outbox.sent') == 3
+    assert outbox.metrics.get('outbox.pending') == 0
+
+
+def test_messages_of_a_channel_are_sent_in_order():
+    lock = threading.Lock()
+    sending = set()
+    requests_sent = []
+
+    def send(channel_id, text):
+        with lock:
+            # Never two requests for the same channel at once
+            assert channel_id not in sending
+            sending.add(channel_id)
+        time.sleep(0.01)
+        with lock:
+            sending.discard(channel_id)
+            requests_sent.append(text)
+        return {'ok': True, 'ts': text}
+
+    outbox, loop, sent, failed = create_outbox(send, lambda channel_id, ts, text: send(channel_id, text))
+    outbox.submit('C1', 'first')
+    outbox.submit('C1', 'second')
+    outbox.submit('C1', 'first edited', edited_ts='first')
+    outbox.submit('C2', 'other')
+    run_until(loop, lambda: len(sent) + len(failed) == 4)
+    assert failed == []
+    assert [text for text in requests_sent if text != 'other'] == ['first', 'second', 'first edited']
+    # The other channel didn't wait
+    assert requests_sent.index('other') < 2
+
+
+def test_requests_that_never_reached_slack_are_retried_with_backoff():
+    responses = [
+        refused_connection(),
+        requests.ConnectTimeout(),
+        {'ok': False, 'error': 'ratelimited'},
+        {'ok': True, 'ts': '1.0'},
+    ]
+
+    def post(channel_id, text):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    outbox, loop, sent, failed = create_outbox(post)
+    message = outbox.submit('C1', 'hello')
+    run_until(loop, lambda: sent)
+    assert message.attempts == 4
+    assert message.ts == '1.0'
+    assert outbox.metrics.get('outbox.retries') == 3
+
+
+def test_requests_that_may_have_posted_are_not_retried():
+    assert failed_before_sending(refused_connection())
+    assert not failed_before_sending(requests.ReadTimeout())
+    assert not failed_before_sending(requests.ConnectionError(ProtocolError('Connection aborted.')))
+
+    errors = {
+        'C1': requests.ReadTimeout('read timed out'),
+        'C2': requests.ConnectionError(ProtocolError('Connection aborted.')),
+        'C3': ValueError('not JSON'),
+    }
+
+    def post(channel_id, text):
+        if channel_id == 'C4':
+            return {'ok': False, 'error': 'internal_error'}
+        raise errors[channel_id]
+
+    outbox, loop, sent, failed = create_outbox(post)
+    messages = [outbox.submit(channel_id, 'hello') for channel_id in ('C1', 'C2', 'C3', 'C4')]
+    run_until(loop, lambda: len(failed) == 4)
+    assert [message.state for message in messages] == [FAILED] * 4
+    assert [message.attempts for message in messages] == [1] * 4
+    assert messages[2].error == 'not JSON'
+    assert outbox.metrics.get('outbox.retries') == 0
+
+
+def test_permanent_errors_and_exhausted_retries_fail():
+    def post(channel_id, text):
+        if channel_id == 'C1':
+            return {'ok': False, 'error': 'channel_not_found'}
+        raise refused_connection()
+
+    outbox, loop, sent, failed = create_outbox(post, max_attempts=3)
+    not_found = outbox.submit('C1', 'hello')
+    refused = outbox.submit('C2', 'hello')
+    run_until(loop, lambda: len(failed) == 2)
+    assert not_found.state == FAILED and not_found.error == 'channel_not_found'
+    assert not_found.attempts == 1
+    assert refused.state == FAILED and refused.attempts == 3
+    assert sent == []
+
+
+def test_cancel_fails_the_queued_messages():
+    release = threading.Event()
+
+    def post(channel_id, text):
+        release.wait(2)
+        return {'ok': True, 'ts': '1.0'}
+
+    outbox, loop, sent, failed = create_outbox(post, max_in_flight=1)
+    in_flight = outbox.submit('C1', 'first')
+    queued = outbox.submit('C1', 'second')
+    outbox.cancel()
+    assert failed == [queued] and queued.error == 'cancelled'
+
+    release.set()
+    run_until(loop, lambda: sent)
+    assert sent == [in_flight]
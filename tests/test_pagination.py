@@ -0,0 +1,145 @@
+import concurrent.futures
+import threading
+import time
+
+from sclack.utils.pagination import iter_cursor_pages, prefetch
+
+def fake_api(pages):
+    calls = []
+    def api_call(method, **kwargs):
+        calls.append(kwargs)
+        index = int(kwargs.get('cursor') or 0)
+        response = {'ok': True, 'members': pages[index]}
+        if index + 1 < len(pages):
+            response['response_metadata'] = {'next_cursor': str(index + 1)}
+        return response
+    return api_call, calls
+
+def test_follows_cursor():
+    api_call, calls = fake_api([['a'], ['b'], ['c']])
+    pages = list(iter_cursor_pages(api_call, 'users.list', 2))
+    assert [page['members'] for page in pages] == [['a'], ['b'], ['c']]
+    assert [call.get('cursor') for call in calls] == [None, '1', '2']
+    assert all(call['limit'] == 2 for call in calls)
+
+def test_stops_on_error():
+    pages = list(iter_cursor_pages(lambda method, **kwargs: {'ok': False}, 'users.list', 2))
+    assert pages == [{'ok': False}]
+
+def test_prefetch_keeps_order_and_errors():
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    assert list(prefetch(iter(range(10)), 3, executor)) == list(range(10))
+
+    def broken():
+        yield 1
+        raise ValueError('boom')
+    result = []
+    try:
+        for item in prefetch(broken(), 1, executor):
+            result.append(item)
+    except ValueError:
+        result.append('error')
+    assert result == [1, 'error']
+    executor.shutdown()
+
+def test_prefetch_downloads_ahead():
+    produced = []
+    def pages():
+        for index in range(2):
+            produced.append(index)
+            yield index
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    iterator = prefetch(pages(), 1, executor)
+    assert next(iterator) == 0
+    for _ in range(100):
+        if len(produced) == 2:
+            break
+        time.sleep(0.01)
+    assert produced == [0, 1]
+    iterator.close()
+    executor.shutdown()
+
+def test_prefetch_from_a_busy_pool_downloads_itself():
+    # Every worker is already paginating, none is left to prefetch
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+    barrier = threading.Barrier(2)
+    def paginate(name):
+        barrier.wait(1)
+        return list(prefetch(iter([name, name]), 1, executor))
+    futures = [executor.submit(paginate, name) for name in 'ab']
+    assert [future.result(2) for future in futures] == [['a', 'a'], ['b', 'b']]
+    executor.shutdown()
+
+def test_users_are_indexed_across_pages(create_store):
+    store = create_store(config={'api': {'page_size': 1}})
+    store.slack.api_call, _ = fake_api([
+        [{'id': 'U1', 'name': 'one', 'profile': {}}],
+        [{'id': 'U2', 'name': 'two', 'profile': {}}, {'id': 'U3', 'deleted': True, 'profile': {}}],
+    ])
+    store.load_users()
+    assert [user['id'] for user in store.state.users] == ['U1', 'U2']
+    assert store.find_user_by_id('U2')['name'] == 'two'
+    assert store.find_user_by_id('U3') is None
+
+def test_members_are_capped(create_store):
+    store = create_store(config={'api': {'max_member_pages': 2, 'prefetch_pages': 0}})
+    store.slack.api_call, calls = fake_api([['U1'], ['U2'], ['U3']])
+    members = store.get_channel_members('C1')
+    assert members['members'] == ['U1', 'U2']
+    assert members['response_metadata']['next_cursor'] == '2'
+    assert len(calls) == 2
+
+def test_failed_page_keeps_previous_lists(tmp_path, create_store):
+    store = create_store(config={
+        "api": {"prefetch_pages": 0},
+        "cache": {"directory": str(tmp_path), "snapshot": True},
+    })
+    store.state.auth = {"user": "me", "user_id": "U1", "team": "team"}
+    store.state.channels = [{'id': 'C0', 'name': 'old'}]
+    store.state.users = [{'id': 'U0', 'name': 'old', 'profile': {}}]
+    store.index_users()
+
+    def api_call(method, **kwargs):
+        if kwargs.get('cursor'):
+            return {'ok': False, 'error': 'internal_error'}
+        return {
+            'ok': True,
+            'channels': [{'id': 'C1', 'name': 'new', 'is_channel': True}],
+            'members': [{'id': 'U1', 'name': 'new', 'profile': {}}],
+            'response_metadata': {'next_cursor': '1'},
+        }
+    store.slack.api_call = api_call
+
+    store.load_channels()
+    store.load_users()
+    assert store.state.channels == [{'id': 'C0', 'name': 'old'}]
+    assert [user['id'] for user in store.state.users] == ['U0']
+    assert store.find_user_by_id('U0') is not None
+    assert store.state.failed_loads == {'channels', 'users'}
+
+    store.save_snapshot()
+    assert store.snapshot.load() is None
+
+def test_pages_loaded_so_far_are_handed_out(create_store):
+    store = create_store(config={'api': {'prefetch_pages': 0}})
+    pages = [
+        [{'id': 'C2', 'name': 'random', 'is_channel': True}],
+        [{'id': 'C1', 'name': 'general', 'is_channel': True}, {'id': 'D1', 'user': 'U1', 'is_im': True, 'created': 1}],
+    ]
+
+    def api_call(method, **kwargs):
+        index = int(kwargs.get('cursor') or 0)
+        response = {'ok': True, 'channels': pages[index]}
+        if index + 1 < len(pages):
+            response['response_metadata'] = {'next_cursor': str(index + 1)}
+        return response
+    store.slack.api_call = api_call
+
+    loaded = []
+    def on_page(channels, dms):
+        loaded.append(([channel['name'] for channel in channels], [dm['id'] for dm in dms]))
+        # Nothing is committed before the last page
+        assert store.state.channels == []
+    store.load_channels(on_page)
+    assert loaded == [(['random'], []), (['general', 'random'], ['D1'])]
+    assert [channel['id'] for channel in store.state.channels] == ['C1', 'C2']
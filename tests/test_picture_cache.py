@@ -0,0 +1,105 @@
+import os
+
+from sclack.picture_cache import MemoryLRU, PictureCache, is_picture_response
+
+URL = 'https://files.slack.com/files-pri/T1-F1/screenshot.png'
+TOKEN = 'xoxp-1'
+RENDERED = ('cells', [[('#f00', '#00f', '▀▀')]])
+
+
+def test_memory_lru_is_bounded_by_size():
+    lru = MemoryLRU(10, sizeof=len)
+    lru.put('a', 'xxxx')
+    lru.put('b', 'xxxx')
+    lru.get('a')
+    lru.put('c', 'xxxx')
+    assert lru.get('b') is None
+    assert lru.get('a') == 'xxxx'
+    assert lru.size == 8
+    lru.put('d', 'x' * 20)
+    assert lru.get('d') is None
+
+
+def test_rendered_pictures_survive_a_restart(tmpdir):
+    cache = PictureCache(str(tmpdir), TOKEN)
+    cache.put_data(URL, b'png', {'ETag': '"v1"'})
+    cache.put_rendered(URL, 30, RENDERED)
+    assert cache.lookup(URL, 30) == RENDERED
+    assert cache.stats['memory_hits'] == 1
+
+    cache = PictureCache(str(tmpdir), TOKEN)
+    assert cache.lookup(URL, 30) == RENDERED
+    assert cache.lookup(URL, 40) is None
+    assert cache.get_data(URL) == b'png'
+    assert cache.stats['disk_hits'] == 1
+    assert cache.stats['misses'] == 1
+    assert cache.hit_rate() == 0.5
+
+
+def test_stale_pictures_are_revalidated(tmpdir):
+    cache = PictureCache(str(tmpdir), TOKEN, max_age=0)
+    cache.put_data(URL, b'png', {'ETag': '"v1"', 'Last-Modified': 'Mon, 01 Jan 2018 00:00:00 GMT'})
+    cache.put_rendered(URL, 30, RENDERED)
+    cache.memory.clear()
+    assert not cache.is_fresh(URL)
+    assert cache.lookup(URL, 30) is None
+    assert cache.conditional_headers(URL) == {
+        'If-None-Match': '"v1"',
+        'If-Modified-Since': 'Mon, 01 Jan 2018 00:00:00 GMT',
+    }
+
+    cache.max_age = 60
+    cache.revalidated(URL)
+    assert cache.lookup(URL, 30) == RENDERED
+
+
+def test_new_download_drops_old_renders(tmpdir):
+    cache = PictureCache(str(tmpdir), TOKEN)
+    cache.put_data(URL, b'v1', {})
+    cache.put_rendered(URL, 30, RENDERED)
+    cache.put_data(URL, b'v2', {})
+    assert cache.lookup(URL, 30) is None
+    assert cache.get_data(URL) == b'v2'
+    files = [name for _, _, names in os.walk(str(tmpdir)) for name in names]
+    assert len(files) == 2
+
+
+def test_disk_usage_is_bounded(tmpdir):
+    cache = PictureCache(str(tmpdir), TOKEN, disk_size=1000)
+    urls = ['{}?{}'.format(URL, index) for index in range(3)]
+    for index, url in enumerate(urls):
+        cache.put_data(url, b'x' * 200, {})
+        # Last shown a second apart
+        for path in (cache._path(url, '.data'), cache._path(url, '.json')):
+            os.utime(path, (index, index))
+    # Shown again, so it becomes the most recently used
+    cache.put_rendered(urls[0], 30, RENDERED)
+    assert cache.stats['evictions'] == 0
+
+    cache.put_data(URL, b'x' * 200, {})
+    assert cache.stats['evictions'] == 1
+    assert cache.get_data(urls[1]) is None
+    assert cache.get_data(urls[0]) is not None
+    assert cache.get_data(URL) is not None
+    files = [os.path.join(root, name) for root, _, names in os.walk(str(tmpdir)) for name in names]
+    assert sum(os.path.getsize(path) for path in files) <= 1000
+
+
+def test_workspaces_have_their_own_pictures(tmpdir):
+    cache = PictureCache(str(tmpdir), TOKEN)
+    cache.put_data(URL, b'png', {})
+    assert PictureCache(str(tmpdir), 'xoxp-2').get_data(URL) is None
+    assert PictureCache(str(tmpdir), TOKEN).get_data(URL) == b'png'
+
+
+class FakeResponse:
+    def __init__(self, status_code, content_type):
+        self.ok = status_code < 400
+        self.headers = {'Content-Type': content_type}
+
+
+def test_only_pictures_are_kept():
+    assert is_picture_response(FakeResponse(200, 'image/png'))
+    assert is_picture_response(FakeResponse(200, 'IMAGE/JPEG; charset=binary'))
+    assert not is_picture_response(FakeResponse(200, 'text/html; charset=utf-8'))
+    assert not is_picture_response(FakeResponse(404, 'image/png'))
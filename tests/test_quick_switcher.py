@@ -2,3 +2,42 @@ from sclack.quick_switcher import remove_diacritic
 
 def test_remove_diacritic():
     assert remove_diacritic("sábado") == "sabado"
+
+def create_switcher():
+    import urwid
+    from sclack.quick_switcher import QuickSwitcher
+    from sclack.store import Store
+
+    store = Store([('default', 'xoxp-1')], {'icons': {
+        'channel': '#', 'private_channel': '*', 'heart': '<3', 'online': '+', 'offline': '-'
+    }})
+    store.state.channels = [
+        {'id': 'C1', 'name': 'general', 'is_channel': True},
+        {'id': 'C2', 'name': 'gêneros', 'is_channel': True},
+        {'id': 'G1', 'name': 'design', 'is_group': True},
+    ]
+    store.state.dms = [{'id': 'D1', 'user': 'U1'}]
+    store.state.users = [{'id': 'U1', 'name': 'genevieve'}]
+    store.index_users()
+    Store.instance = store
+    return QuickSwitcher(urwid.SolidFill(), None)
+
+def test_filter_narrows_and_reuses_widgets():
+    switcher = create_switcher()
+    walker = switcher.quick_switcher_list.body
+
+    switcher.header.set_edit_text('gen')
+    switcher.set_filter()
+    assert [item['id'] for item in switcher.filtered_items] == ['C1', 'D1', 'C2']
+    general = walker.widget_at(0)
+    switcher.header.set_edit_text('gener')
+    switcher.set_filter()
+    assert [item['id'] for item in switcher.filtered_items] == ['C1', 'C2']
+    assert walker.widget_at(0) is general
+
+    switcher.header.set_edit_text('@gen')
+    switcher.set_filter()
+    assert [item['id'] for item in switcher.filtered_items] == ['D1']
+    switcher.header.set_edit_text('#')
+    switcher.set_filter()
+    assert [item['id'] for item in switcher.filtered_items] == ['G1', 'C1', 'C2']
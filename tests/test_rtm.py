@@ -0,0 +1,203 @@
+import asyncio
+import json
+import socket
+import ssl
+
+import pytest
+from slackclient.server import SlackConnectionError
+from websocket import WebSocketConnectionClosedException
+
+if not hasattr(asyncio, 'coroutine'):
+    pytest.skip('generator-based coroutines need Python < 3.11', allow_module_level=True)
+
+from sclack.metrics import Metrics
+from sclack.rtm import CATCH_UP_KEY, CAUGHT_UP_EVENT, RECONNECTED_EVENT, RealTimeReader
+
+
+class FakeWebSocket:
+    """
+    Hands out the queued frames, then raises what a non-blocking socket
+    raises when nothing is left to read
+    """
+    def __init__(self, frames, empty=ssl.SSLWantReadError):
+        self.frames = list(frames)
+        self.empty = empty
+        self.sockets = socket.socketpair()
+
+    def fileno(self):
+        return self.sockets[0].fileno()
+
+    def recv(self):
+        if not self.frames:
+            raise self.empty()
+        frame = self.frames.pop(0)
+        if isinstance(frame, Exception):
+            raise frame
+        return frame
+
+    def shutdown(self):
+        for sock in self.sockets:
+            sock.close()
+
+
+class FakeServer:
+    def __init__(self, websocket, reconnect):
+        self.websocket = websocket
+        self.connected = True
+        self.auto_reconnect = True
+        self.reconnect = reconnect
+
+    def rtm_connect(self, reconnect=False):
+        websocket = self.reconnect()
+        # slackclient may log a failed websocket instead of raising
+        if websocket is not None:
+            self.websocket = websocket
+            self.connected = True
+
+
+class FakeSlack:
+    def __init__(self, websocket, reconnect=None):
+        self.server = FakeServer(websocket, reconnect)
+        self.changes = []
+
+    def process_changes(self, event):
+        self.changes.append(event)
+
+
+def frame(*events):
+    return '\n'.join(json.dumps(event) for event in events)
+
+
+def create_loop():
+    loop = asyncio.new_event_loop()
+    # The queue of the reader belongs to the current loop
+    asyncio.set_event_loop(loop)
+    return loop
+
+
+def read(loop, reader):
+    return loop.run_until_complete(asyncio.wait_for(reader.read(), 1))
+
+
+@pytest.mark.parametrize('empty', [ssl.SSLWantReadError, BlockingIOError])
+def test_frames_are_read_until_the_socket_would_block(empty):
+    loop = create_loop()
+    websocket = FakeWebSocket([
+        frame({'type': 'hello'}),
+        frame({'type': 'message', 'ts': '1'}, {'type': 'message', 'ts': '2'}),
+    ], empty)
+    slack = FakeSlack(websocket)
+    reader = RealTimeReader(slack, loop, Metrics())
+
+    reader._watch()
+    assert [event['type'] for event in read(loop, reader)] == ['hello', 'message', 'message']
+    assert len(slack.changes) == 3
+    assert reader.metrics.get('rtm.frames') == 2
+
+    # Woken up by the event loop once more data arrived
+    websocket.frames.append(frame({'type': 'user_typing'}))
+    websocket.sockets[1].send(b'x')
+    assert read(loop, reader) == [{'type': 'user_typing'}]
+    reader.close()
+    loop.close()
+
+
+def test_lost_connection_is_restored():
+    loop = create_loop()
+    websocket = FakeWebSocket([WebSocketConnectionClosedException()])
+    new_websocket = FakeWebSocket([frame({'type': 'hello'})])
+    reader = RealTimeReader(FakeSlack(websocket, lambda: new_websocket), loop, Metrics())
+
+    reader._watch()
+    assert not reader.server.connected
+    assert read(loop, reader) == [{'type': RECONNECTED_EVENT}, {'type': 'hello'}]
+    assert reader.server.websocket is new_websocket
+    assert reader.metrics.get('rtm.reconnects') == 1
+    reader.close()
+    loop.close()
+
+
+def test_reconnection_is_retried_until_the_websocket_opens():
+    loop = create_loop()
+    websocket = FakeWebSocket([WebSocketConnectionClosedException()])
+    new_websocket = FakeWebSocket([frame({'type': 'hello'})])
+    attempts = [None, None, new_websocket]
+    slack = FakeSlack(websocket, lambda: attempts.pop(0))
+    reader = RealTimeReader(slack, loop, Metrics(), reconnect_backoff=0.001)
+
+    reader._watch()
+    assert read(loop, reader) == [{'type': RECONNECTED_EVENT}, {'type': 'hello'}]
+    assert reader.metrics.get('rtm.reconnect_retries') == 2
+    reader.close()
+    loop.close()
+
+
+def test_websocket_that_never_opens_is_raised_by_the_reader():
+    loop = create_loop()
+    websocket = FakeWebSocket([OSError()])
+    reader = RealTimeReader(FakeSlack(websocket, lambda: None), loop, Metrics(), reconnect_backoff=0.001)
+
+    reader._watch()
+    with pytest.raises(ConnectionError):
+        read(loop, reader)
+    # The dead socket isn't watched again
+    assert reader._fd is None
+    reader.close()
+    loop.close()
+
+
+def test_failed_reconnection_is_raised_by_the_reader():
+    loop = create_loop()
+
+    def reconnect():
+        raise SlackConnectionError('RTM connection failed, reached max reconnects.')
+
+    websocket = FakeWebSocket([frame({'type': 'hello'}), OSError()])
+    reader = RealTimeReader(FakeSlack(websocket, reconnect), loop, Metrics())
+
+    reader._watch()
+    # Events received before the connection was lost still come first
+    assert read(loop, reader) == [{'type': 'hello'}]
+    with pytest.raises(SlackConnectionError):
+        read(loop, reader)
+    with pytest.raises(SlackConnectionError):
+        read(loop, reader)
+    assert reader.metrics.get('rtm.reconnect_failures') == 1
+    reader.close()
+    loop.close()
+
+
+def test_missed_messages_are_queued_before_the_end_of_catch_up():
+    loop = create_loop()
+    reader = RealTimeReader(FakeSlack(FakeWebSocket([])), loop, Metrics())
+
+    async def missed_events():
+        return [{'type': 'message', 'ts': '2'}]
+
+    loop.run_until_complete(reader.catch_up(missed_events()))
+    assert read(loop, reader) == [
+        {'type': 'message', 'ts': '2', CATCH_UP_KEY: True},
+        {'type': CAUGHT_UP_EVENT},
+    ]
+    assert reader.metrics.get('rtm.caught_up_messages') == 1
+    loop.close()
+
+
+def test_catch_up_ends_even_when_it_fails():
+    loop = create_loop()
+    reader = RealTimeReader(FakeSlack(FakeWebSocket([])), loop, Metrics())
+
+    async def missed_events():
+        raise ConnectionError('still offline')
+
+    with pytest.raises(ConnectionError):
+        loop.run_until_complete(reader.catch_up(missed_events()))
+    assert read(loop, reader) == [{'type': CAUGHT_UP_EVENT}]
+
+    # Replaced by the catch up of a newer reconnection
+    task = loop.create_task(reader.catch_up(asyncio.sleep(10)))
+    loop.call_soon(task.cancel)
+    with pytest.raises(asyncio.CancelledError):
+        loop.run_until_complete(task)
+    assert read(loop, reader) == [{'type': CAUGHT_UP_EVENT}]
+    loop.close()
@@ -0,0 +1,71 @@
+import concurrent.futures
+import threading
+import time
+
+from sclack.metrics import Metrics
+from sclack.scheduler import MeteredExecutor, Scheduler, parallel_map
+
+
+def test_metered_executor_reports_queue_depth_and_wait():
+    metrics = Metrics()
+    executor = MeteredExecutor(
+        'api',
+        concurrent.futures.ThreadPoolExecutor(max_workers=1),
+        metrics
+    )
+    release = threading.Event()
+    blocked = executor.submit(release.wait)
+    queued = [executor.submit(lambda value=value: value * 2) for value in range(3)]
+    assert metrics.get('pools.api.queue_depth_max') >= 3
+
+    release.set()
+    assert [future.result() for future in queued] == [0, 2, 4]
+    assert blocked.result() is True
+    executor.shutdown()
+    assert metrics.get('pools.api.tasks') == 4
+    assert metrics.get('pools.api.queue_depth') == 0
+    assert metrics.get('pools.api.wait_seconds_max') > 0
+
+
+def test_scheduler_pools_are_sized_from_config():
+    scheduler = Scheduler({'workers': {'api': 3, 'download': 1}}, Metrics())
+    try:
+        assert scheduler.api.executor._max_workers == 3
+        assert scheduler.download.executor._max_workers == 1
+        assert scheduler.render.executor._max_workers == 2
+    finally:
+        scheduler.shutdown()
+
+
+def test_shutdown_cancels_the_queued_tasks():
+    scheduler = Scheduler({'workers': {'api': 1}}, Metrics())
+    release = threading.Event()
+    running = scheduler.api.submit(release.wait, 2)
+    queued = [scheduler.api.submit(time.sleep, 5) for _ in range(4)]
+
+    started_at = time.time()
+    scheduler.shutdown()
+    release.set()
+    assert running.result(1) is True
+    assert all(future.cancelled() for future in queued)
+    scheduler.api.executor.shutdown(wait=True)
+    assert time.time() - started_at < 1
+    assert scheduler.api.metrics.get('pools.api.queue_depth') == 0
+
+
+def test_parallel_map_runs_on_the_pool_it_is_called_from():
+    executor = MeteredExecutor(
+        'api',
+        concurrent.futures.ThreadPoolExecutor(max_workers=2),
+        Metrics()
+    )
+    # Both workers call it, the items are handled by the callers themselves
+    barrier = threading.Barrier(2)
+    def fetch_all(offset):
+        barrier.wait(1)
+        return parallel_map(executor, lambda item: item + offset, range(5), 4)
+    futures = [executor.submit(fetch_all, offset) for offset in (0, 10)]
+    assert futures[0].result(2) == [0, 1, 2, 3, 4]
+    assert futures[1].result(2) == [10, 11, 12, 13, 14]
+    executor.shutdown()
+    assert executor.metrics.get('pools.api.queue_depth') == 0
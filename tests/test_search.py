@@ -0,0 +1,31 @@
+from sclack.utils.search import TitleIndex, normalize
+
+
+TITLES = ['general', 'random', 'Ãlvaro', 'dev-general', 'devops', 'álgebra']
+
+
+def brute_force(query):
+    return [position for position, title in enumerate(TITLES) if query in normalize(title)]
+
+
+def test_search_matches_substrings_without_diacritics():
+    index = TitleIndex(TITLES)
+    index.build_trigrams()
+    assert index.search('alv') == [2]
+    assert index.search('general') == [0, 3]
+    assert index.search('al') == [0, 2, 3, 5]
+    assert index.search('') == list(range(len(TITLES)))
+    for query in ('e', 'de', 'dev', 'neral', 'ops', 'xyz', 'a', 'lge'):
+        assert index.search(query) == brute_force(query)
+
+
+def test_search_narrows_previous_matches():
+    index = TitleIndex(TITLES)
+    previous = index.search('de')
+    assert index.search('dev', previous) == [3, 4]
+    assert index.search('devo', [3]) == []
+
+
+def test_search_without_trigrams_scans_every_title():
+    index = TitleIndex(TITLES)
+    assert index.search('neral') == brute_force('neral')
@@ -0,0 +1,44 @@
+from sclack.snapshot import Snapshot, SNAPSHOT_VERSION
+
+def snapshot_config(directory):
+    return {
+      "features": {
+        "markdown": True,
+        "emoji": {}
+      },
+      "cache": {
+        "directory": str(directory),
+        "snapshot": True
+      }
+    }
+
+def test_missing_snapshot(tmp_path):
+    assert Snapshot(str(tmp_path), "token").load() is None
+
+def test_outdated_snapshot(tmp_path):
+    snapshot = Snapshot(str(tmp_path), "token")
+    snapshot.save({})
+    with open(snapshot.path, "w") as snapshot_file:
+        snapshot_file.write('{"version": %d}' % (SNAPSHOT_VERSION + 1))
+    assert snapshot.load() is None
+
+def test_snapshot_does_not_store_token(tmp_path):
+    snapshot = Snapshot(str(tmp_path), "secret-token")
+    assert "secret-token" not in snapshot.path
+
+def test_store_snapshot_round_trip(tmp_path, create_store):
+    store = create_store(config=snapshot_config(tmp_path))
+    store.state.auth = {"user": "me", "user_id": "U1", "team": "team"}
+    store.state.channels = [{"id": "C1", "name": "general", "is_private": False}]
+    store.state.dms = [{"id": "D1", "user": "U2", "created": 0}]
+    store.state.users = [{"id": "U2", "name": "someone", "profile": {}}]
+    store.index_users()
+    store.set_last_seen_ts("C1", "1500000000.000100")
+    store.save_snapshot()
+
+    restored = create_store(config=snapshot_config(tmp_path))
+    assert restored.load_snapshot()
+    assert restored.state.channels == store.state.channels
+    assert restored.find_user_by_id("U2")["name"] == "someone"
+    assert restored.state.last_seen_ts == {"C1": "1500000000.000100"}
+    assert restored.sidebar_signature() == store.sidebar_signature()
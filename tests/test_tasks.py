@@ -0,0 +1,42 @@
+import asyncio
+import concurrent.futures
+import threading
+
+from sclack.utils.tasks import LatestTask
+
+
+def test_rapid_channel_switching_renders_only_the_last_channel():
+    loop = asyncio.new_event_loop()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    release = threading.Event()
+    fetched = []
+    rendered = []
+
+    def fetch(channel_id):
+        release.wait(2)
+        fetched.append(channel_id)
+        return {'channel': channel_id}
+
+    async def go_to_channel(channel_id):
+        response = await loop.run_in_executor(executor, fetch, channel_id)
+        rendered.append(response['channel'])
+
+    switch = LatestTask(loop)
+
+    async def hammer_sidebar():
+        cancelled = []
+        for channel_id in ('C1', 'C2', 'C3', 'C4'):
+            cancelled.append(switch.start(go_to_channel(channel_id)))
+            # One key press per loop iteration, every task gets to submit its fetch
+            await asyncio.sleep(0)
+        assert cancelled == [False, True, True, True]
+        release.set()
+        await asyncio.wait_for(switch.task, 2)
+
+    loop.run_until_complete(hammer_sidebar())
+    executor.shutdown()
+
+    assert rendered == ['C4']
+    # C1 was already being fetched, its response is dropped. C2 and C3 never left the queue
+    assert fetched == ['C1', 'C4']
+    assert not switch.running
@@ -0,0 +1,35 @@
+from sclack.store import Store
+from sclack.transport import SessionSlackRequest, create_session
+
+
+class FakeSession:
+    def __init__(self):
+        self.posts = []
+
+    def post(self, url, **kwargs):
+        self.posts.append((url, kwargs))
+        return kwargs
+
+
+def test_requests_go_through_the_session():
+    session = FakeSession()
+    requester = SessionSlackRequest(session)
+    requester.do('xoxp-1', 'users.info', {'user': 'U1', 'users': ['U1', 'U2'], 'attachments': [{'text': 'a'}]})
+    url, kwargs = session.posts[0]
+    assert url == 'https://slack.com/api/users.info'
+    assert kwargs['headers']['Authorization'] == 'Bearer xoxp-1'
+    assert kwargs['data'] == {'user': 'U1', 'users': 'U1,U2', 'attachments': '[{"text": "a"}]'}
+
+
+def test_session_pool_size():
+    session = create_session(pool_size=3, compression=False)
+    adapter = session.get_adapter('https://files.slack.com/')
+    assert adapter._pool_maxsize == 3
+    assert session.headers['Accept-Encoding'] == 'identity'
+
+
+def test_store_client_uses_the_store_session():
+    store = Store([('default', 'xoxp-1')], {'api': {'connections': 2}})
+    requester = store.slack.server.api_requester
+    assert isinstance(requester, SessionSlackRequest)
+    assert requester.session is store.session
@@ -0,0 +1,48 @@
+def test_counts_come_from_one_request(create_store):
+    store = create_store({
+        'users.counts': lambda **kwargs: {
+            'ok': True,
+            'channels': [{'id': 'C1', 'unread_count_display': 3}],
+            'groups': [{'id': 'G1', 'unread_count_display': 0}],
+            'ims': [{'id': 'D1', 'unread_count_display': 1}],
+        },
+    })
+    assert store.load_unread_counts(['C1', 'G1', 'D1']) == {'C1': 3, 'G1': 0, 'D1': 1}
+    assert store.metrics.get('api.calls') == 1
+
+def test_missing_counts_are_fetched_once(create_store):
+    store = create_store({
+        'users.counts': lambda **kwargs: {'ok': False, 'error': 'unknown_method'},
+        'conversations.info': lambda channel: {'ok': True, 'channel': {'id': channel, 'unread_count_display': 2}},
+        'im.info': lambda channel: {'ok': False, 'error': 'channel_not_found'},
+    })
+    assert store.load_unread_counts(['C1', 'C1', 'C2', 'D1']) == {'C1': 2, 'C2': 2}
+    assert store.metrics.get('api.calls.conversations.info') == 2
+    assert store.state.unread_counts == {'C1': 2, 'C2': 2}
+
+def test_counts_follow_real_time_events(create_store):
+    store = create_store({})
+    store.state.auth = {'user_id': 'UME'}
+    store.state.unread_counts = {'C1': 1}
+
+    assert store.apply_unread_event({'type': 'message', 'channel': 'C1', 'user': 'U2', 'ts': '2'}) == 'C1'
+    assert store.state.unread_counts['C1'] == 2
+    store.apply_unread_event({'type': 'message', 'channel': 'C1', 'user': 'U2', 'ts': '3', 'thread_ts': '1'})
+    store.apply_unread_event({'type': 'message', 'channel': 'C1', 'subtype': 'message_changed'})
+    assert store.state.unread_counts['C1'] == 2
+    store.apply_unread_event({'type': 'channel_marked', 'channel': 'C1', 'unread_count_display': 1})
+    assert store.state.unread_counts['C1'] == 1
+    store.apply_unread_event({'type': 'message', 'channel': 'C1', 'user': 'UME', 'ts': '4'})
+    assert store.state.unread_counts['C1'] == 0
+    assert store.apply_unread_event({'type': 'user_typing', 'channel': 'C1'}) is None
+    assert store.metrics.get('api.calls') == 0
+
+def test_only_requests_sent_are_counted(create_store):
+    store = create_store({
+        'conversations.info': lambda channel: {'ok': True, 'channel': {'id': channel, 'unread_count_display': 2}},
+    })
+    store.get_channel_info('C1')
+    store.get_channel_info('C1')
+    assert store.metrics.get('api.calls') == 1
+    assert store.metrics.get('api.calls.conversations.info') == 1
+    assert store.metrics.get('api.saved_calls') == 1